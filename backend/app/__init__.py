@@ -16,6 +16,13 @@ def create_app():
     CORS(app)
     db.init_app(app)
 
+    from .utils.cache import response_cache
+    from .services.identity_cache import identity_cache
+    from .services.preference_resolver import preference_resolver
+    response_cache.init_app(app)
+    identity_cache.init_app(app)
+    preference_resolver.init_app(app)
+
     # Initialize Firebase Admin SDK (if credentials are available via env)
     try:
         init_firebase_app(app)
@@ -9,4 +9,72 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     FLASK_ENV = os.getenv('FLASK_ENV', 'development')
     DEBUG = os.getenv('FLASK_DEBUG', 'True').lower() in ('true', '1', 'yes')
-    ALLOW_TEST_TOKENS = os.getenv('ALLOW_TEST_TOKENS', str(FLASK_ENV != 'production')).lower() in ('true', '1', 'yes')
\ No newline at end of file
+    ALLOW_TEST_TOKENS = os.getenv('ALLOW_TEST_TOKENS', str(FLASK_ENV != 'production')).lower() in ('true', '1', 'yes')
+
+    # Response cache for anonymous gig reads; REDIS_URL shares it across workers
+    RESPONSE_CACHE_ENABLED = os.getenv('RESPONSE_CACHE_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', '30'))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '1024'))
+    REDIS_URL = os.getenv('REDIS_URL')
+
+    # Per-process uid -> (id, role) cache used by the auth decorators
+    AUTH_USER_CACHE_ENABLED = os.getenv('AUTH_USER_CACHE_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    AUTH_USER_CACHE_TTL = int(os.getenv('AUTH_USER_CACHE_TTL', '60'))
+
+    # Verified Firebase tokens are cached until exp; with revocation checks on,
+    # entries are re-verified at least this often (seconds)
+    FIREBASE_CHECK_REVOKED = os.getenv('FIREBASE_CHECK_REVOKED', 'False').lower() in ('true', '1', 'yes')
+    VERIFIED_TOKEN_REVOCATION_TTL = int(os.getenv('VERIFIED_TOKEN_REVOCATION_TTL', '300'))
+
+    # /api/notifications/stream: heartbeat (and cross-worker catch-up) interval
+    # and how long a connection is held before the client is asked to reconnect
+    NOTIFICATION_STREAM_HEARTBEAT = int(os.getenv('NOTIFICATION_STREAM_HEARTBEAT', '15'))
+    NOTIFICATION_STREAM_MAX_DURATION = int(os.getenv('NOTIFICATION_STREAM_MAX_DURATION', '300'))
+
+    # Email/push delivery workers (backend/scripts/notification_worker.py)
+    NOTIFICATION_WORKER_CONCURRENCY = int(os.getenv('NOTIFICATION_WORKER_CONCURRENCY', '8'))
+    NOTIFICATION_WORKER_BATCH_SIZE = int(os.getenv('NOTIFICATION_WORKER_BATCH_SIZE', '100'))
+    NOTIFICATION_WORKER_LEASE_SECONDS = int(os.getenv('NOTIFICATION_WORKER_LEASE_SECONDS', '300'))
+    # Failed sends retry after base * 2^(attempt-1) seconds (jittered, capped at
+    # the max); rows are dead-lettered as 'failed' after NOTIFICATION_MAX_ATTEMPTS
+    NOTIFICATION_MAX_ATTEMPTS = int(os.getenv('NOTIFICATION_MAX_ATTEMPTS', '3'))
+    NOTIFICATION_RETRY_BASE_SECONDS = int(os.getenv('NOTIFICATION_RETRY_BASE_SECONDS', '60'))
+    NOTIFICATION_RETRY_MAX_SECONDS = int(os.getenv('NOTIFICATION_RETRY_MAX_SECONDS', '3600'))
+
+    # Push delivery: 'mock' (placeholder sender), 'fake' (in-memory) or 'fcm'
+    # (Firebase multicast, up to 500 tokens per request)
+    PUSH_TRANSPORT = os.getenv('PUSH_TRANSPORT', 'mock')
+    # Registered devices not refreshed within this many days get no pushes
+    DEVICE_TOKEN_MAX_AGE_DAYS = int(os.getenv('DEVICE_TOKEN_MAX_AGE_DAYS', '60'))
+
+    # Per-user notification preference cache (shared through REDIS_URL when set)
+    NOTIFICATION_PREFERENCE_CACHE_ENABLED = os.getenv('NOTIFICATION_PREFERENCE_CACHE_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    NOTIFICATION_PREFERENCE_CACHE_TTL = int(os.getenv('NOTIFICATION_PREFERENCE_CACHE_TTL', '300'))
+
+    # Repeat gig updates for a user within this many seconds merge into one
+    # unread notification (0 disables merging)
+    NOTIFICATION_COALESCE_WINDOW = int(os.getenv('NOTIFICATION_COALESCE_WINDOW', '600'))
+    # Digest emails go out once a user's oldest undigested update is this old
+    NOTIFICATION_DIGEST_INTERVAL = int(os.getenv('NOTIFICATION_DIGEST_INTERVAL', '3600'))
+
+    # Retention (backend/scripts/purge_notifications.py): notifications older
+    # than this move to notifications_archive; sent/failed queue rows and
+    # dispatched outbox events are deleted after DELIVERY_RETENTION_DAYS
+    NOTIFICATION_RETENTION_DAYS = int(os.getenv('NOTIFICATION_RETENTION_DAYS', '90'))
+    DELIVERY_RETENTION_DAYS = int(os.getenv('DELIVERY_RETENTION_DAYS', '14'))
+
+    # Gig recommendations score at most this many candidates per request
+    RECOMMENDATION_CANDIDATES = int(os.getenv('RECOMMENDATION_CANDIDATES', '300'))
+    # Precomputed lists (backend/scripts/materialize_recommendations.py): gigs
+    # stored per student, and seconds before a list is recomputed on demand
+    RECOMMENDATION_STORED = int(os.getenv('RECOMMENDATION_STORED', '20'))
+    RECOMMENDATION_MAX_AGE = int(os.getenv('RECOMMENDATION_MAX_AGE', '21600'))
+
+    # Trending (backend/scripts/refresh_trending.py): activity decays with this
+    # half-life and is kept for TRENDING_WINDOW_HOURS; the stored list is
+    # recomputed inline once older than TRENDING_MAX_AGE seconds
+    TRENDING_HALF_LIFE_HOURS = float(os.getenv('TRENDING_HALF_LIFE_HOURS', '24'))
+    TRENDING_WINDOW_HOURS = int(os.getenv('TRENDING_WINDOW_HOURS', '72'))
+    TRENDING_MAX_AGE = int(os.getenv('TRENDING_MAX_AGE', '900'))
+    # Gig views are counted per process and written at most this often
+    TRENDING_VIEW_FLUSH_SECONDS = int(os.getenv('TRENDING_VIEW_FLUSH_SECONDS', '60'))
@@ -3,6 +3,7 @@ from flask import request, jsonify, current_app, g
 from typing import Iterable, Optional
 
 from .services.auth_service import verify_token
+from .services.identity_cache import identity_cache
 from .models import User
 
 
@@ -16,7 +17,8 @@ def _extract_bearer_token() -> Optional[str]:
 def token_required(auto_create_user: bool = False):
     """Decorator that ensures a valid Firebase/test token is supplied.
 
-    Sets `g.current_user` to the matched `User` instance (or None if not found and auto_create_user=False).
+    Sets `g.current_user` to the matched `User` instance, or to an
+    `AuthenticatedUser` built from the identity cache for repeat callers.
     If authentication fails, responds with 401.
     """
     def decorator(f):
@@ -32,25 +34,29 @@ def token_required(auto_create_user: bool = False):
                 return jsonify({"error": "Unauthorized"}), 401
 
             # Attach user to flask.g
-            try:
-                user = User.query.filter_by(uid=uid).one_or_none()
-            except Exception:
-                user = None
-
-            if not user and auto_create_user:
-                # minimal provisioning: require at least email and role if present
-                name = decoded.get("name") or decoded.get("email") or ""
-                email = decoded.get("email") or f"{uid}@example.com"
-                role = decoded.get("role") or "student"
-                user = User(uid=uid, name=name, email=email, role=role)
-                from .. import db
-
-                db.session.add(user)
-                db.session.commit()
-
-            if not user:
-                # No local user found; treat as unauthorized
-                return jsonify({"error": "User not found"}), 401
+            user = identity_cache.get(uid)
+            if user is None:
+                try:
+                    user = User.query.filter_by(uid=uid).one_or_none()
+                except Exception:
+                    user = None
+
+                if not user and auto_create_user:
+                    # minimal provisioning: require at least email and role if present
+                    name = decoded.get("name") or decoded.get("email") or ""
+                    email = decoded.get("email") or f"{uid}@example.com"
+                    role = decoded.get("role") or "student"
+                    user = User(uid=uid, name=name, email=email, role=role)
+                    from .. import db
+
+                    db.session.add(user)
+                    db.session.commit()
+
+                if not user:
+                    # No local user found; treat as unauthorized
+                    return jsonify({"error": "User not found"}), 401
+
+                identity_cache.remember(user)
 
             g.current_user = user
             g.auth_claims = decoded
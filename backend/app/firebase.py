@@ -65,3 +65,26 @@ def send_push_notification(token: str, title: str, body: str, data: dict = None)
         data=data or {}
     )
     return messaging.send(message)
+
+
+# FCM accepts at most this many tokens per multicast request
+FCM_MULTICAST_LIMIT = 500
+
+
+def send_multicast(tokens, title: str, body: str, data: dict = None):
+    """Send one notification to up to 500 device tokens in a single FCM call.
+
+    Returns the ``BatchResponse``; its ``responses`` are in the same order as
+    ``tokens``. FCM data payloads must be strings, so values are converted.
+    """
+    tokens = list(tokens)
+    if not tokens:
+        raise ValueError("No device tokens provided")
+    if len(tokens) > FCM_MULTICAST_LIMIT:
+        raise ValueError(f"At most {FCM_MULTICAST_LIMIT} tokens per multicast")
+    message = messaging.MulticastMessage(
+        notification=messaging.Notification(title=title, body=body),
+        tokens=tokens,
+        data={key: str(value) for key, value in (data or {}).items()}
+    )
+    return messaging.send_each_for_multicast(message)
@@ -1,22 +1,40 @@
 from .user import User
 from .gig import Gig
+from .gig_activity import GigActivityBucket, TrendingGig, TrendingRefresh
+from .gig_similarity import GigNeighbor, GigSimilarityBand
 from .application import Application
 from .rating import Rating
-from .notification import Notification
+from .notification import Notification, NotificationArchive, NotificationDigestItem
+from .notification_counter import NotificationCounter
 from .saved_gig import SavedGig
 from .feedback import Feedback
 from .audit_log import AuditLog
-from .skill import Skill, StudentSkill
+from .skill import GigSkill, Skill, StudentSkill
+from .device_token import DeviceToken
+from .outbox_event import OutboxEvent
+from .student_recommendation import StudentRecommendation
 
 __all__ = [
     "User",
     "Gig",
+    "GigActivityBucket",
+    "GigNeighbor",
+    "GigSimilarityBand",
     "Application",
     "Rating",
     "Notification",
+    "NotificationArchive",
+    "NotificationDigestItem",
+    "NotificationCounter",
     "SavedGig",
     "Feedback",
     "AuditLog",
     "Skill",
     "StudentSkill",
+    "GigSkill",
+    "DeviceToken",
+    "OutboxEvent",
+    "StudentRecommendation",
+    "TrendingGig",
+    "TrendingRefresh",
 ]
@@ -0,0 +1,21 @@
+from datetime import datetime
+from .. import db
+
+
+class DeviceToken(db.Model):
+    __tablename__ = "device_tokens"
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    token = db.Column(db.String(255), nullable=False, unique=True)
+    platform = db.Column(db.String(20))  # ios, android, web
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_seen_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    user = db.relationship("User")
+
+    __table_args__ = (
+        db.Index("idx_device_tokens_user_seen", "user_id", "last_seen_at"),
+    )
@@ -1,6 +1,28 @@
 from datetime import datetime
+from sqlalchemy import literal_column
+from sqlalchemy.dialects import postgresql  # noqa: F401  registers to_tsvector/setweight
 from .. import db
 
+SEARCH_CONFIG = literal_column("'english'")
+
+
+def _weighted_document(column, weight: str):
+    # Literal arguments keep the expression identical to the indexed one so the
+    # PostgreSQL planner can serve searches from idx_gigs_search_vector.
+    return db.func.setweight(
+        db.func.to_tsvector(SEARCH_CONFIG, db.func.coalesce(column, literal_column("''"))),
+        literal_column(f"'{weight}'"),
+    )
+
+
+def search_document(title, description, category):
+    """Weighted tsvector over the searchable gig text (title > description > category)."""
+    return (
+        _weighted_document(title, "A")
+        .op("||")(_weighted_document(description, "B"))
+        .op("||")(_weighted_document(category, "C"))
+    )
+
 
 class Gig(db.Model):
     __tablename__ = "gigs"
@@ -24,6 +46,13 @@ class Gig(db.Model):
     updated_at = db.Column(
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    # Denormalized aggregates kept current by the application, rating and admin
+    # services; gig_service.reconcile_gig_counters() rebuilds them.
+    application_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     provider = db.relationship("User", back_populates="provided_gigs")
     applications = db.relationship(
@@ -47,6 +76,20 @@ class Gig(db.Model):
     notifications = db.relationship(
         "Notification", back_populates="related_gig", lazy="dynamic"
     )
+    skill_matches = db.relationship(
+        "GigSkill",
+        back_populates="gig",
+        cascade="all, delete-orphan",
+        lazy="dynamic",
+    )
+
+    __table_args__ = (
+        db.Index(
+            "idx_gigs_search_vector",
+            search_document(title, description, category),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     @classmethod
     def validate_status(cls, status: str) -> None:
@@ -64,6 +107,12 @@ class Gig(db.Model):
                 )
             )
 
+    @property
+    def rating_average(self) -> float:
+        if not self.rating_count:
+            return 0.0
+        return round(self.rating_sum / self.rating_count, 2)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -79,3 +128,6 @@ class Gig(db.Model):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+GIG_SEARCH_VECTOR = search_document(Gig.title, Gig.description, Gig.category)
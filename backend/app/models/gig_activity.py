@@ -0,0 +1,42 @@
+from datetime import datetime
+from .. import db
+
+
+class GigActivityBucket(db.Model):
+    """Applications, saves and views of a gig within one hour."""
+
+    __tablename__ = "gig_activity_buckets"
+
+    gig_id = db.Column(
+        db.Integer, db.ForeignKey("gigs.id", ondelete="CASCADE"), primary_key=True
+    )
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    applications = db.Column(db.Integer, nullable=False, default=0)
+    saves = db.Column(db.Integer, nullable=False, default=0)
+    views = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index("idx_gig_activity_buckets_start", "bucket_start"),
+    )
+
+
+class TrendingGig(db.Model):
+    """Precomputed trending list entry, one row per rank."""
+
+    __tablename__ = "trending_gigs"
+
+    rank = db.Column(db.Integer, primary_key=True)
+    gig_id = db.Column(
+        db.Integer, db.ForeignKey("gigs.id", ondelete="CASCADE"), nullable=False
+    )
+    score = db.Column(db.Float, nullable=False)
+    computed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+class TrendingRefresh(db.Model):
+    """When the trending list was last refreshed; a single row, even if the list is empty."""
+
+    __tablename__ = "trending_refreshes"
+
+    id = db.Column(db.Integer, primary_key=True)
+    refreshed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
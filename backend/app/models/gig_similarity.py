@@ -0,0 +1,38 @@
+from datetime import datetime
+from .. import db
+
+
+class GigSimilarityBand(db.Model):
+    """LSH bucket of one band of a gig's MinHash signature."""
+
+    __tablename__ = "gig_similarity_bands"
+
+    gig_id = db.Column(
+        db.Integer, db.ForeignKey("gigs.id", ondelete="CASCADE"), primary_key=True
+    )
+    band = db.Column(db.Integer, primary_key=True)
+    bucket = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        db.Index("idx_gig_similarity_bands_bucket", "band", "bucket"),
+    )
+
+
+class GigNeighbor(db.Model):
+    """Cached nearest neighbor of a gig, one row per rank."""
+
+    __tablename__ = "gig_neighbors"
+
+    gig_id = db.Column(
+        db.Integer, db.ForeignKey("gigs.id", ondelete="CASCADE"), primary_key=True
+    )
+    rank = db.Column(db.Integer, primary_key=True)
+    neighbor_id = db.Column(
+        db.Integer, db.ForeignKey("gigs.id", ondelete="CASCADE"), nullable=False
+    )
+    score = db.Column(db.Float, nullable=False)
+    computed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index("idx_gig_neighbors_neighbor", "neighbor_id"),
+    )
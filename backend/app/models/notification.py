@@ -20,9 +20,65 @@ class Notification(db.Model):
         db.Integer, db.ForeignKey("applications.id", ondelete="SET NULL"), nullable=True
     )
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Number of events merged into this notification
+    group_count = db.Column(db.Integer, nullable=False, default=1)
+    # Waiting to be mailed in the recipient's next digest
+    digest_pending = db.Column(db.Boolean, nullable=False, default=False)
 
     user = db.relationship("User", back_populates="notifications")
     related_gig = db.relationship("Gig", back_populates="notifications")
     related_application = db.relationship(
         "Application", back_populates="notifications"
     )
+
+
+class NotificationDigestItem(db.Model):
+    """A coalesced event waiting for the digest email of a user who has no in-app row for it.
+
+    Recipients with email but not in-app enabled for a type get these instead
+    of ``digest_pending`` notifications; the digest worker deletes them once
+    mailed.
+    """
+
+    __tablename__ = "notification_digest_items"
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    type = db.Column(db.String(50), nullable=False)
+    title = db.Column(db.String(255), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    related_gig_id = db.Column(
+        db.Integer, db.ForeignKey("gigs.id", ondelete="CASCADE"), nullable=True
+    )
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    group_count = db.Column(db.Integer, nullable=False, default=1)
+
+    __table_args__ = (
+        db.Index("idx_notification_digest_items_user_created", "user_id", "created_at"),
+    )
+
+
+class NotificationArchive(db.Model):
+    """Notifications moved out of ``notifications`` by the retention job.
+
+    Same columns as ``Notification`` plus ``archived_at``; ids are kept, and
+    there are no foreign keys so archived rows outlive the records they
+    mention.
+    """
+
+    __tablename__ = "notifications_archive"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    type = db.Column(db.String(50), nullable=False)
+    title = db.Column(db.String(255), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    read = db.Column(db.Boolean, default=False)
+    related_gig_id = db.Column(db.Integer)
+    related_application_id = db.Column(db.Integer)
+    created_at = db.Column(db.DateTime)
+    group_count = db.Column(db.Integer, nullable=False, default=1)
+    digest_pending = db.Column(db.Boolean, nullable=False, default=False)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
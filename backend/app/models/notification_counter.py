@@ -0,0 +1,14 @@
+from datetime import datetime
+from .. import db
+
+
+class NotificationCounter(db.Model):
+    """Denormalized unread count per user, kept in step with ``notifications``."""
+
+    __tablename__ = "notification_counters"
+
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    unread_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
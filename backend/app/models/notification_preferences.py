@@ -40,11 +40,18 @@ class EmailQueue(db.Model):
     body = db.Column(db.Text, nullable=False)
     template = db.Column(db.String(100))
     template_data = db.Column(db.JSON)
-    status = db.Column(db.String(20), default="pending")  # pending, sent, failed
+    status = db.Column(db.String(20), default="pending")  # pending, sent, failed (dead letter)
     attempts = db.Column(db.Integer, default=0)
     last_attempt = db.Column(db.DateTime)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     sent_at = db.Column(db.DateTime)
+    # Lease held by the delivery worker that claimed the row
+    claimed_by = db.Column(db.String(64))
+    claimed_until = db.Column(db.DateTime)
+    # Lower values are sent first; retries wait until next_attempt_at
+    priority = db.Column(db.SmallInteger, nullable=False, default=1)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text)
 
     user = db.relationship("User")
 
@@ -59,10 +66,17 @@ class PushNotification(db.Model):
     title = db.Column(db.String(255), nullable=False)
     body = db.Column(db.Text, nullable=False)
     data = db.Column(db.JSON)
-    status = db.Column(db.String(20), default="pending")  # pending, sent, failed
+    status = db.Column(db.String(20), default="pending")  # pending, sent, failed (dead letter)
     attempts = db.Column(db.Integer, default=0)
     last_attempt = db.Column(db.DateTime)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     sent_at = db.Column(db.DateTime)
+    # Lease held by the delivery worker that claimed the row
+    claimed_by = db.Column(db.String(64))
+    claimed_until = db.Column(db.DateTime)
+    # Lower values are sent first; retries wait until next_attempt_at
+    priority = db.Column(db.SmallInteger, nullable=False, default=1)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text)
 
     user = db.relationship("User")
\ No newline at end of file
@@ -0,0 +1,24 @@
+from datetime import datetime
+from .. import db
+
+
+class OutboxEvent(db.Model):
+    """Side effect recorded in the same transaction as the change that caused it."""
+
+    __tablename__ = "outbox_events"
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_type = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+    status = db.Column(db.String(20), nullable=False, default="pending")  # pending, dispatched, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    available_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    claimed_by = db.Column(db.String(64))
+    claimed_until = db.Column(db.DateTime)
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    dispatched_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        db.Index("idx_outbox_events_status_available", "status", "available_at", "id"),
+    )
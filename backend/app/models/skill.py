@@ -13,6 +13,9 @@ class Skill(db.Model):
     student_skills = db.relationship(
         "StudentSkill", back_populates="skill", cascade="all, delete-orphan", lazy="dynamic"
     )
+    gig_matches = db.relationship(
+        "GigSkill", back_populates="skill", cascade="all, delete-orphan", lazy="dynamic"
+    )
 
     def to_dict(self) -> dict:
         return {
@@ -55,4 +58,25 @@ class StudentSkill(db.Model):
             "skill": self.skill.to_dict() if self.skill else None,
             "proficiency_level": self.proficiency_level,
             "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
\ No newline at end of file
+        }
+
+
+class GigSkill(db.Model):
+    """Match index row: the gig's title or description mentions the skill."""
+
+    __tablename__ = "gig_skills"
+
+    gig_id = db.Column(
+        db.Integer, db.ForeignKey("gigs.id", ondelete="CASCADE"), primary_key=True
+    )
+    skill_id = db.Column(
+        db.Integer, db.ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True
+    )
+    in_title = db.Column(db.Boolean, nullable=False, default=False)
+
+    gig = db.relationship("Gig", back_populates="skill_matches")
+    skill = db.relationship("Skill", back_populates="gig_matches")
+
+    __table_args__ = (
+        db.Index("idx_gig_skills_skill_gig", "skill_id", "gig_id"),
+    )
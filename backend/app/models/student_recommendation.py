@@ -0,0 +1,18 @@
+from datetime import datetime
+from .. import db
+
+
+class StudentRecommendation(db.Model):
+    """Precomputed recommended gig for a student, one row per rank."""
+
+    __tablename__ = "student_recommendations"
+
+    student_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    rank = db.Column(db.Integer, primary_key=True)
+    gig_id = db.Column(
+        db.Integer, db.ForeignKey("gigs.id", ondelete="CASCADE"), nullable=False
+    )
+    score = db.Column(db.Float, nullable=False, default=0.0)
+    computed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
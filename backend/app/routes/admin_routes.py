@@ -3,7 +3,7 @@ from flask import Blueprint, jsonify, g, request
 from ..services import admin_service
 from ..services.utils import require_auth, require_role
 from ..services.exceptions import ValidationError
-from .serializers import gig_to_dict, user_to_dict
+from .serializers import gig_to_dict, gigs_to_dicts, user_to_dict
 
 admin_bp = Blueprint("admin", __name__)
 
@@ -13,7 +13,7 @@ admin_bp = Blueprint("admin", __name__)
 @require_role("admin")
 def pending_gigs():
     gigs = admin_service.get_pending_gigs()
-    return jsonify([gig_to_dict(gig) for gig in gigs]), 200
+    return jsonify(gigs_to_dicts(gigs)), 200
 
 
 @admin_bp.route("/gigs/<int:gig_id>/approve", methods=["PATCH"])
@@ -44,6 +44,7 @@ def list_users():
     pagination = {
         "page": request.args.get("page", 1),
         "per_page": request.args.get("per_page", 20),
+        "cursor": request.args.get("cursor"),
     }
     data = admin_service.get_all_users(filters, pagination)
     data["items"] = [user for user in data["items"]]
@@ -116,6 +117,7 @@ def audit_logs():
     pagination = {
         "page": request.args.get("page", 1),
         "per_page": request.args.get("per_page", 20),
+        "cursor": request.args.get("cursor"),
     }
     data = admin_service.get_audit_logs(filters, pagination)
     return jsonify(data), 200
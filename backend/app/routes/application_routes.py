@@ -1,7 +1,6 @@
 from flask import Blueprint, jsonify, g, request
 
 from ..services import notification_service
-from ..models import User
 from ..services.application_service import (
     bulk_update_applications,
     create_application,
@@ -12,7 +11,6 @@ from ..services.application_service import (
     withdraw_application,
 )
 from ..services.exceptions import AuthorizationError, ValidationError
-from ..services.gig_service import get_gig_by_id
 from ..services.utils import require_auth, require_role
 from .serializers import application_to_dict
 
@@ -30,23 +28,6 @@ def apply_to_gig():
         raise ValidationError("gig_id is required")
 
     application = create_application(g.current_user.id, gig_id, notes)
-    gig = get_gig_by_id(gig_id)
-    notification_service.notify_application_received(
-        gig.provider_id, gig_id, application.id
-    )
-    # Also notify admins about a new application (non-fatal)
-    try:
-        admins = User.query.filter_by(role='admin').all()
-        for admin in admins:
-            notification_service.create_notification_with_preferences(
-                user_id=admin.id,
-                type='application_submitted',
-                title='New application submitted',
-                message=f"A new application was submitted for '{gig.title}'.",
-                related_ids={'gig_id': gig_id, 'application_id': application.id},
-            )
-    except Exception:
-        pass
     return (
         jsonify(application_to_dict(application, include_gig=True)),
         201,
@@ -1,6 +1,6 @@
 from flask import Blueprint, jsonify, g, request
 
-from ..models import Application, SavedGig, User
+from ..models import Application, SavedGig
 from ..services import notification_service
 from ..services.application_service import get_gig_applications
 from ..services.exceptions import AuthorizationError, NotFoundError, ValidationError
@@ -22,8 +22,17 @@ from ..services.recommendation_service import (
     get_student_recommendation_stats,
     get_trending_gigs,
 )
+from ..services.trending_service import view_buffer
 from ..services.utils import require_auth, require_role
-from .serializers import application_to_dict, gig_to_dict
+from ..utils.cache import response_cache
+from ..utils.conditional import conditional_response
+from .serializers import (
+    application_to_dict,
+    gig_etag_parts,
+    gig_to_dict,
+    gigs_to_dicts,
+    load_gig_providers,
+)
 
 gig_bp = Blueprint("gigs", __name__)
 
@@ -66,6 +75,7 @@ def _validate_gig_payload(payload, require_all: bool = True):
 
 
 @gig_bp.route("", methods=["GET"])
+@response_cache.cached("gigs")
 def list_gigs():
     filters = {
         "search": request.args.get("search"),
@@ -81,28 +91,48 @@ def list_gigs():
     pagination = {
         "page": request.args.get("page", 1),
         "per_page": request.args.get("per_page", 20),
+        "cursor": request.args.get("cursor"),
     }
     data = browse_gigs(filters, pagination)
-    return (
-        jsonify(
-            {
-                "items": [gig_to_dict(item) for item in data["items"]],
-                "page": data["page"],
-                "per_page": data["per_page"],
-                "total": data["total"],
-                "pages": data["pages"],
-            }
-        ),
-        200,
-    )
+    providers = load_gig_providers(data["items"])
+    page_parts = [
+        gig_etag_parts(gig, providers.get(gig.provider_id)) for gig in data["items"]
+    ]
+
+    if pagination["cursor"] is not None:
+        meta = {
+            "per_page": data["per_page"],
+            "next_cursor": data["next_cursor"],
+            "has_more": data["has_more"],
+        }
+    else:
+        meta = {
+            "page": data["page"],
+            "per_page": data["per_page"],
+            "total": data["total"],
+            "pages": data["pages"],
+        }
+
+    def build_page():
+        return jsonify(
+            {"items": gigs_to_dicts(data["items"], providers=providers), **meta}
+        )
+
+    return conditional_response([meta, page_parts], build_page, private=False)
 
 
 @gig_bp.route("/<int:gig_id>", methods=["GET"])
+@view_buffer.counts_views
+@response_cache.cached("gigs")
 def retrieve_gig(gig_id: int):
     gig = get_gig_by_id(gig_id)
     if gig.approval_status != "approved":
         raise NotFoundError("Gig not available or pending approval")
-    return jsonify(gig_to_dict(gig)), 200
+    return conditional_response(
+        gig_etag_parts(gig, gig.provider),
+        lambda: jsonify(gig_to_dict(gig)),
+        private=False,
+    )
 
 
 @gig_bp.route("", methods=["POST"])
@@ -112,21 +142,6 @@ def create_gig_endpoint():
     payload = request.get_json(silent=True) or {}
     _validate_gig_payload(payload)
     gig = create_gig(g.current_user.id, payload)
-    # Notify admins that a new gig is pending approval
-    try:
-        admins = User.query.filter_by(role='admin').all()
-        for admin in admins:
-            # Respect user preferences when possible
-            notification_service.create_notification_with_preferences(
-                user_id=admin.id,
-                type="gig_pending",
-                title="New gig pending approval",
-                message=f"A new gig '{gig.title}' has been posted and is awaiting approval.",
-                related_ids={"gig_id": gig.id},
-            )
-    except Exception:
-        # Don't fail gig creation if notifications fail
-        pass
     return jsonify(gig_to_dict(gig)), 201
 
 
@@ -135,7 +150,7 @@ def create_gig_endpoint():
 @require_role("provider")
 def list_provider_gigs():
     gigs = get_provider_gigs(g.current_user.id)
-    return jsonify([gig_to_dict(gig, include_provider=False) for gig in gigs]), 200
+    return jsonify(gigs_to_dicts(gigs, include_provider=False)), 200
 
 
 @gig_bp.route("/analytics", methods=["GET"])
@@ -152,7 +167,7 @@ def get_provider_analytics_endpoint():
 def get_expiring_gigs_endpoint():
     days_ahead = request.args.get("days", 7, type=int)
     expiring_gigs = get_gigs_expiring_soon(g.current_user.id, days_ahead)
-    return jsonify([gig_to_dict(gig, include_provider=False) for gig in expiring_gigs]), 200
+    return jsonify(gigs_to_dicts(expiring_gigs, include_provider=False)), 200
 
 
 @gig_bp.route("/mark-expired", methods=["POST"])
@@ -169,17 +184,19 @@ def mark_expired_gigs_endpoint():
 def get_recommended_gigs_endpoint():
     limit = request.args.get("limit", 10, type=int)
     recommended_gigs = get_recommended_gigs_for_student(g.current_user.id, min(limit, 20))
-    return jsonify([gig_to_dict(gig) for gig in recommended_gigs]), 200
+    return jsonify(gigs_to_dicts(recommended_gigs)), 200
 
 
 @gig_bp.route("/<int:gig_id>/similar", methods=["GET"])
+@response_cache.cached("gigs")
 def get_similar_gigs_endpoint(gig_id: int):
     limit = request.args.get("limit", 5, type=int)
     similar_gigs = get_similar_gigs(gig_id, min(limit, 10))
-    return jsonify([gig_to_dict(gig) for gig in similar_gigs]), 200
+    return jsonify(gigs_to_dicts(similar_gigs)), 200
 
 
 @gig_bp.route("/trending", methods=["GET"])
+@response_cache.cached("gigs")
 def get_trending_gigs_endpoint():
     limit = request.args.get("limit", 10, type=int)
     trending_gigs = get_trending_gigs(min(limit, 20))
@@ -1,11 +1,21 @@
-from flask import Blueprint, jsonify, g, request
+import json
+import time
+
+from flask import Blueprint, Response, current_app, jsonify, g, request, stream_with_context
+
+from .. import db
 
 from ..services.notification_service import (
     get_user_notifications,
+    paginate_user_notifications,
     get_user_notification_preferences,
+    get_notification_state,
     get_unread_notification_count,
     get_notification_summary,
     get_recent_notifications,
+    get_latest_notification_id,
+    get_notifications_after,
+    get_notifications_by_ids,
     mark_all_notifications_read,
     mark_notification_read,
     update_notification_preference,
@@ -13,20 +23,173 @@ from ..services.notification_service import (
     send_bulk_notification,
     process_email_queue,
     process_push_notification_queue,
+    NOTIFICATION_PAGE_SIZE,
 )
-from ..services.utils import require_auth, require_role
+from ..services.delivery_worker import list_dead_letters, requeue_dead_letters
+from ..services.device_service import list_devices, register_device, unregister_device
+from ..services.notification_digest import send_notification_digests
+from ..services.notification_stream import notification_hub
+from ..services.outbox_service import dispatch_outbox
+from ..services.utils import require_auth, require_role, require_stream_auth
 from ..services.exceptions import ValidationError
+from ..utils.conditional import conditional_response
 from .serializers import notification_to_dict
 
 notification_bp = Blueprint("notifications", __name__)
 
+# SSE event names the frontend listens for; other types arrive as "notification"
+STREAM_EVENT_NAMES = {
+    "gig_pending": "gig_pending",
+    "gig_approved": "gig_approved",
+    "gig_rejected": "gig_rejected",
+    "gig_update": "gig_updated",
+}
+STREAM_RETRY_MS = 3000
+
 
 @notification_bp.route("", methods=["GET"])
 @require_auth
 def list_notifications():
     unread_only = request.args.get("unread_only", "false").lower() == "true"
-    notifications = get_user_notifications(g.current_user.id, unread_only=unread_only)
-    return jsonify([notification_to_dict(n) for n in notifications]), 200
+    compact = request.args.get("compact", "false").lower() == "true"
+    cursor = request.args.get("cursor")
+    limit = request.args.get("limit", type=int)
+
+    # Passing cursor (empty for the first page) or limit selects paged mode
+    if cursor is not None or limit is not None:
+        page = paginate_user_notifications(
+            g.current_user.id,
+            cursor=cursor,
+            limit=limit or NOTIFICATION_PAGE_SIZE,
+            unread_only=unread_only,
+            compact=compact,
+        )
+        # Validated on the page itself, so revalidation stays an index range
+        # read; group_count moves with every merged message update
+        rows = [(n.id, n.read, n.group_count) for n in page["items"]]
+        return conditional_response(
+            [g.current_user.id, unread_only, compact, cursor, page["per_page"],
+             rows, page["next_cursor"], page["has_more"]],
+            lambda: jsonify({
+                "items": [notification_to_dict(n, compact=compact) for n in page["items"]],
+                "per_page": page["per_page"],
+                "next_cursor": page["next_cursor"],
+                "has_more": page["has_more"],
+            }),
+        )
+
+    state = get_notification_state(g.current_user.id, unread_only=unread_only)
+
+    def build_list():
+        notifications = get_user_notifications(g.current_user.id, unread_only=unread_only)
+        return jsonify([notification_to_dict(n, compact=compact) for n in notifications])
+
+    return conditional_response(
+        [g.current_user.id, unread_only, compact, state],
+        build_list,
+    )
+
+
+def _sse_message(event: str, data: dict, event_id: int = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _resume_from(user_id: int) -> int:
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    try:
+        return max(int(last_event_id), 0)
+    except (TypeError, ValueError):
+        # Fresh connection: only push what arrives from now on
+        return get_latest_notification_id(user_id)
+
+
+@notification_bp.route("/stream", methods=["GET"])
+@require_stream_auth
+def stream_notifications():
+    user_id = g.current_user.id
+    last_id = _resume_from(user_id)
+    heartbeat = float(current_app.config.get("NOTIFICATION_STREAM_HEARTBEAT", 15))
+    max_duration = float(current_app.config.get("NOTIFICATION_STREAM_MAX_DURATION", 300))
+    # Release the pooled connection before the stream starts idling
+    db.session.remove()
+
+    def generate():
+        nonlocal last_id
+        subscription = notification_hub.subscribe(user_id)
+        deadline = time.monotonic() + max_duration
+        try:
+            yield f"retry: {STREAM_RETRY_MS}\n\n"
+            while True:
+                for notification in get_notifications_after(user_id, last_id):
+                    last_id = notification.id
+                    yield _sse_message(
+                        STREAM_EVENT_NAMES.get(notification.type, "notification"),
+                        notification_to_dict(notification),
+                        notification.id,
+                    )
+                # Rows past last_id are sent above with their latest content
+                updated = [
+                    notification_id for notification_id in subscription.take_updated()
+                    if notification_id <= last_id
+                ]
+                for notification in get_notifications_by_ids(user_id, updated):
+                    # No event id: an update must not move the resume point back
+                    yield _sse_message("notification_updated", notification_to_dict(notification))
+                db.session.remove()
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # The client reconnects with Last-Event-ID after the retry delay
+                    return
+                if not subscription.wait(min(heartbeat, remaining)):
+                    yield _sse_message("heartbeat", {"time": int(time.time())})
+        finally:
+            notification_hub.unsubscribe(subscription)
+
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _device_to_dict(device) -> dict:
+    return {
+        "id": device.id,
+        "token": device.token,
+        "platform": device.platform,
+        "created_at": device.created_at.isoformat() if device.created_at else None,
+        "last_seen_at": device.last_seen_at.isoformat() if device.last_seen_at else None,
+    }
+
+
+@notification_bp.route("/devices", methods=["GET"])
+@require_auth
+def list_devices_endpoint():
+    return jsonify([_device_to_dict(device) for device in list_devices(g.current_user.id)]), 200
+
+
+@notification_bp.route("/devices", methods=["POST"])
+@require_auth
+def register_device_endpoint():
+    payload = request.get_json(silent=True) or {}
+    device = register_device(g.current_user.id, payload.get("token"), payload.get("platform"))
+    return jsonify(_device_to_dict(device)), 201
+
+
+@notification_bp.route("/devices", methods=["DELETE"])
+@require_auth
+def unregister_device_endpoint():
+    payload = request.get_json(silent=True) or {}
+    token = payload.get("token")
+    if not token:
+        raise ValidationError("token is required")
+    unregister_device(g.current_user.id, token)
+    return "", 204
 
 
 @notification_bp.route("/<int:notification_id>/read", methods=["PATCH"])
@@ -113,7 +276,9 @@ def get_notification_summary_endpoint():
 @require_auth
 def get_unread_count():
     count = get_unread_notification_count(g.current_user.id)
-    return jsonify({"unread_count": count}), 200
+    return conditional_response(
+        [g.current_user.id, count], lambda: jsonify({"unread_count": count})
+    )
 
 
 @notification_bp.route("/recent", methods=["GET"])
@@ -178,3 +343,55 @@ def process_push_queue_endpoint():
     
     results = process_push_notification_queue(limit)
     return jsonify(results), 200
+
+
+@notification_bp.route("/admin/process-outbox", methods=["POST"])
+@require_auth
+@require_role("admin")
+def process_outbox_endpoint():
+    limit = min(request.args.get("limit", 50, type=int), 200)
+    results = dispatch_outbox(limit)
+    results.pop("claimed", None)
+    return jsonify(results), 200
+
+
+@notification_bp.route("/admin/send-digests", methods=["POST"])
+@require_auth
+@require_role("admin")
+def send_digests_endpoint():
+    limit = min(request.args.get("limit", 100, type=int), 500)
+    results = send_notification_digests(limit)
+    results.pop("claimed", None)
+    return jsonify(results), 200
+
+
+@notification_bp.route("/admin/dead-letters/<queue>", methods=["GET"])
+@require_auth
+@require_role("admin")
+def list_dead_letters_endpoint(queue: str):
+    limit = min(request.args.get("limit", 50, type=int), 200)
+    rows = list_dead_letters(queue, limit)
+    return jsonify([
+        {
+            "id": row.id,
+            "user_id": row.user_id,
+            "priority": row.priority,
+            "attempts": row.attempts,
+            "last_error": row.last_error,
+            "last_attempt": row.last_attempt.isoformat() if row.last_attempt else None,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+        }
+        for row in rows
+    ]), 200
+
+
+@notification_bp.route("/admin/dead-letters/<queue>/requeue", methods=["POST"])
+@require_auth
+@require_role("admin")
+def requeue_dead_letters_endpoint(queue: str):
+    payload = request.get_json(silent=True) or {}
+    ids = payload.get("ids")
+    if ids is not None and not isinstance(ids, list):
+        raise ValidationError("ids must be an array")
+    requeued = requeue_dead_letters(queue, ids)
+    return jsonify({"requeued": requeued}), 200
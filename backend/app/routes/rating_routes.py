@@ -1,11 +1,11 @@
 from flask import Blueprint, jsonify, g, request
 from datetime import datetime, timedelta
 
-from .. import db
 from ..models import Rating
 from ..services.notification_service import notify_rating_received
 from ..services.rating_service import (
     create_rating,
+    edit_rating,
     flag_rating_for_review,
     get_gig_rating_summary,
     get_platform_rating_stats,
@@ -110,39 +110,13 @@ def get_pending_moderation_ratings():
 @require_auth
 def update_rating(rating_id: int):
     # Allow users to update their own ratings within a time window
-    rating = Rating.query.get(rating_id)
-    if not rating:
-        raise ValidationError("Rating not found")
-    
-    if rating.rater_id != g.current_user.id:
-        raise ValidationError("You can only update your own ratings")
-    
-    # Check if rating is still within edit window (e.g., 24 hours)
-    from datetime import datetime, timedelta
-    edit_deadline = rating.created_at + timedelta(hours=24)
-    if datetime.utcnow() > edit_deadline:
-        raise ValidationError("Rating can only be edited within 24 hours of creation")
-    
     payload = request.get_json(silent=True) or {}
-    new_score = payload.get("score")
-    new_comment = payload.get("comment")
-    
-    if new_score is not None:
-        try:
-            Rating.validate_score(new_score)
-            rating.score = new_score
-        except ValueError as exc:
-            raise ValidationError(str(exc))
-    
-    if new_comment is not None:
-        rating.comment = new_comment
-    
-    db.session.commit()
-    
-    # Update user's average rating
-    from ..services.rating_service import calculate_average_rating
-    calculate_average_rating(rating.ratee_id)
-    
+    rating = edit_rating(
+        rating_id,
+        g.current_user.id,
+        score=payload.get("score"),
+        comment=payload.get("comment"),
+    )
     return jsonify(rating_to_dict(rating, include_ratee=True)), 200
 
 
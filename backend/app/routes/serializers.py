@@ -1,3 +1,8 @@
+from typing import Optional
+
+from ..models import User
+
+
 def user_to_dict(user, include_email: bool = False) -> dict:
     if not user:
         return {}
@@ -17,10 +22,9 @@ def user_to_dict(user, include_email: bool = False) -> dict:
     return data
 
 
-def gig_to_dict(gig, include_provider: bool = True) -> dict:
+def _gig_payload(gig, provider_obj, include_provider: bool) -> dict:
     data = gig.to_dict()
 
-    provider_obj = getattr(gig, "provider", None)
     if include_provider and provider_obj:
         data["provider"] = user_to_dict(provider_obj, include_email=False)
 
@@ -32,29 +36,9 @@ def gig_to_dict(gig, include_provider: bool = True) -> dict:
         float(provider_obj.average_rating or 0.0) if provider_obj else 0.0
     )
 
-    ratings_rel = getattr(gig, "ratings", None)
-    rating_items = []
-    if ratings_rel is not None:
-        try:
-            rating_items = ratings_rel.all()
-        except AttributeError:
-            rating_items = ratings_rel
-    rating_scores = [rating.score for rating in rating_items if rating.score is not None]
-    if rating_scores:
-        data["rating_average"] = round(sum(rating_scores) / len(rating_scores), 2)
-        data["rating_count"] = len(rating_scores)
-    else:
-        data["rating_average"] = 0.0
-        data["rating_count"] = 0
-
-    applications_rel = getattr(gig, "applications", None)
-    application_count = 0
-    if applications_rel is not None:
-        if hasattr(applications_rel, "count"):
-            application_count = applications_rel.count()
-        else:
-            application_count = len(applications_rel)
-    data["application_count"] = application_count
+    data["rating_average"] = gig.rating_average
+    data["rating_count"] = gig.rating_count or 0
+    data["application_count"] = gig.application_count or 0
 
     data["price"] = data.get("budget")
     data["duration_label"] = None
@@ -66,6 +50,72 @@ def gig_to_dict(gig, include_provider: bool = True) -> dict:
     return data
 
 
+def gig_to_dict(gig, include_provider: bool = True) -> dict:
+    return _gig_payload(gig, getattr(gig, "provider", None), include_provider)
+
+
+def load_gig_providers(gigs) -> dict:
+    """Fetch the providers of ``gigs`` in one query, keyed by user id."""
+    provider_ids = {gig.provider_id for gig in gigs if gig.provider_id is not None}
+    if not provider_ids:
+        return {}
+    return {
+        user.id: user
+        for user in User.query.filter(User.id.in_(provider_ids)).all()
+    }
+
+
+def gigs_to_dicts(gigs, include_provider: bool = True, providers: Optional[dict] = None) -> list:
+    """Serialize a list of gigs, loading all of their providers in one query.
+
+    Rating and application totals come from the gig's own counter columns, so
+    a page costs a single extra query no matter how many gigs it holds. Pass
+    ``providers`` from ``load_gig_providers`` to reuse an earlier lookup.
+    """
+    gigs = [gig for gig in gigs if gig is not None]
+    if not gigs:
+        return []
+
+    if providers is None:
+        providers = load_gig_providers(gigs)
+
+    return [
+        _gig_payload(gig, providers.get(gig.provider_id), include_provider)
+        for gig in gigs
+    ]
+
+
+def user_etag_parts(user) -> tuple:
+    """Every stored field ``user_to_dict`` reads, for conditional responses."""
+    if not user:
+        return ()
+    return (
+        user.id,
+        user.uid,
+        user.name,
+        user.role,
+        user.profile_photo,
+        user.location,
+        user.bio,
+        user.average_rating,
+        user.email,
+    )
+
+
+def gig_etag_parts(gig, provider_obj) -> tuple:
+    """Every stored field ``gig_to_dict`` reads, for conditional responses."""
+    return (
+        gig.id,
+        gig.updated_at,
+        gig.status,
+        gig.approval_status,
+        gig.application_count,
+        gig.rating_sum,
+        gig.rating_count,
+        user_etag_parts(provider_obj),
+    )
+
+
 def application_to_dict(
     application,
     include_gig: bool = False,
@@ -91,19 +141,44 @@ def application_to_dict(
     return data
 
 
-def saved_gig_to_dict(saved_gig) -> dict:
+def saved_gig_to_dict(saved_gig, gig_data: Optional[dict] = None) -> dict:
     data = {
         "id": saved_gig.id,
         "gig_id": saved_gig.gig_id,
         "user_id": saved_gig.user_id,
         "saved_at": saved_gig.saved_at.isoformat() if saved_gig.saved_at else None,
     }
-    if getattr(saved_gig, "gig", None):
+    if gig_data is not None:
+        data["gig"] = gig_data
+    elif getattr(saved_gig, "gig", None):
         data["gig"] = gig_to_dict(saved_gig.gig)
     return data
 
 
-def notification_to_dict(notification) -> dict:
+def saved_gigs_to_dicts(saved_gigs) -> list:
+    saved_gigs = list(saved_gigs)
+    gig_data = {
+        item["id"]: item
+        for item in gigs_to_dicts(saved.gig for saved in saved_gigs)
+    }
+    return [
+        saved_gig_to_dict(saved, gig_data.get(saved.gig_id)) for saved in saved_gigs
+    ]
+
+
+def notification_to_dict(notification, compact: bool = False) -> dict:
+    if compact:
+        return {
+            "id": notification.id,
+            "type": notification.type,
+            "title": notification.title,
+            "read": notification.read,
+            "related_gig_id": notification.related_gig_id,
+            "count": notification.group_count or 1,
+            "created_at": notification.created_at.isoformat()
+            if notification.created_at
+            else None,
+        }
     return {
         "id": notification.id,
         "type": notification.type,
@@ -112,6 +187,7 @@ def notification_to_dict(notification) -> dict:
         "read": notification.read,
         "related_gig_id": notification.related_gig_id,
         "related_application_id": notification.related_application_id,
+        "count": notification.group_count or 1,
         "created_at": notification.created_at.isoformat()
         if notification.created_at
         else None,
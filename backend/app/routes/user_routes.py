@@ -22,7 +22,13 @@ from ..services.user_service import (
     update_user_profile,
 )
 from ..services.utils import require_auth, require_role
-from .serializers import saved_gig_to_dict, user_to_dict
+from ..utils.conditional import conditional_response
+from .serializers import (
+    saved_gig_to_dict,
+    saved_gigs_to_dicts,
+    user_etag_parts,
+    user_to_dict,
+)
 
 user_bp = Blueprint("users", __name__)
 
@@ -32,9 +38,16 @@ user_bp = Blueprint("users", __name__)
 def get_user_profile(user_id: int):
     user = get_user_by_id(user_id)
     include_email = user.id == g.current_user.id
-    profile = user_to_dict(user, include_email=include_email)
-    profile["ratings_count"] = user.ratings_received.count()
-    return jsonify(profile), 200
+    ratings_count = user.ratings_received.count()
+
+    def build_profile():
+        profile = user_to_dict(user, include_email=include_email)
+        profile["ratings_count"] = ratings_count
+        return jsonify(profile)
+
+    return conditional_response(
+        [user_etag_parts(user), include_email, ratings_count], build_profile
+    )
 
 
 @user_bp.route("/profile", methods=["PUT"])
@@ -71,7 +84,7 @@ def save_gig_endpoint():
 @require_auth
 def list_saved_gigs():
     saved_items = get_saved_gigs(g.current_user.id)
-    return jsonify([saved_gig_to_dict(item) for item in saved_items]), 200
+    return jsonify(saved_gigs_to_dicts(saved_items)), 200
 
 
 @user_bp.route("/saved-gigs/<int:saved_gig_id>", methods=["DELETE"])
@@ -6,7 +6,10 @@ from sqlalchemy import and_, func, or_
 from .. import db
 from ..models import Application, AuditLog, Gig, Rating, User, SavedGig
 from .exceptions import AuthorizationError, NotFoundError, ValidationError
-from .gig_service import get_gig_by_id
+from .gig_service import adjust_gig_counters, get_gig_by_id, invalidate_gig_cache
+from .identity_cache import identity_cache
+from .pagination import SortKey, keyset_paginate
+from .similarity_service import index_gig_similarity
 from .notification_service import create_notification, notify_gig_approved
 from .user_service import get_user_by_id, update_user_average_rating
 
@@ -47,6 +50,44 @@ def _previous_month_start(dt: datetime) -> datetime:
     return dt.replace(year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
+def _newest_first_keys(model):
+    return [
+        SortKey(model.created_at, True, lambda row: row.created_at),
+        SortKey(model.id, True, lambda row: row.id),
+    ]
+
+
+def _admin_user_dict(user: User) -> Dict:
+    return {
+        "id": user.id,
+        "name": user.name,
+        "email": user.email,
+        "role": user.role,
+        "average_rating": float(user.average_rating or 0.0),
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+    }
+
+
+def _audit_log_dict(log: AuditLog) -> Dict:
+    return {
+        "id": log.id,
+        "action": log.action,
+        "resource_type": log.resource_type,
+        "resource_id": log.resource_id,
+        "details": log.details,
+        "created_at": log.created_at.isoformat() if log.created_at else None,
+        "user": (
+            {
+                "id": log.user.id,
+                "name": log.user.name,
+                "role": log.user.role,
+            }
+            if log.user
+            else None
+        ),
+    }
+
+
 def get_pending_gigs():
     return (
         Gig.query.filter_by(approval_status="pending")
@@ -60,7 +101,9 @@ def approve_gig(gig_id: int, admin_id: int) -> Gig:
     gig = get_gig_by_id(gig_id)
     gig.approval_status = "approved"
     gig.status = "open"
+    index_gig_similarity(gig)
     db.session.commit()
+    invalidate_gig_cache()
 
     _log_action(
         admin.id,
@@ -101,7 +144,9 @@ def reject_gig(gig_id: int, admin_id: int, reason: str) -> Gig:
     gig = get_gig_by_id(gig_id)
     gig.approval_status = "rejected"
     gig.status = "closed"
+    index_gig_similarity(gig)
     db.session.commit()
+    invalidate_gig_cache()
 
     _log_action(
         admin.id,
@@ -130,6 +175,7 @@ def update_user_role(user_id: int, new_role: str, admin_id: int) -> User:
     previous_role = user.role
     user.role = new_role
     db.session.commit()
+    identity_cache.invalidate(user.uid)
 
     _log_action(
         admin.id,
@@ -163,24 +209,20 @@ def get_all_users(filters: Dict, pagination: Dict):
             )
         )
 
+    per_page = min(int(pagination.get("per_page", 20)), 100)
+    cursor = pagination.get("cursor")
+    if cursor is not None:
+        page_data = keyset_paginate(query, _newest_first_keys(User), cursor, per_page)
+        page_data["items"] = [_admin_user_dict(user) for user in page_data["items"]]
+        return page_data
+
     query = query.order_by(User.created_at.desc())
 
     page = max(int(pagination.get("page", 1)), 1)
-    per_page = min(int(pagination.get("per_page", 20)), 100)
     pagination_obj = query.paginate(page=page, per_page=per_page, error_out=False)
 
     return {
-        "items": [
-            {
-                "id": user.id,
-                "name": user.name,
-                "email": user.email,
-                "role": user.role,
-                "average_rating": float(user.average_rating or 0.0),
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-            }
-            for user in pagination_obj.items
-        ],
+        "items": [_admin_user_dict(user) for user in pagination_obj.items],
         "page": pagination_obj.page,
         "per_page": pagination_obj.per_page,
         "total": pagination_obj.total,
@@ -393,6 +435,7 @@ def moderate_rating(rating_id: int, admin_id: int, action: str, note: str = ""):
     if action == "remove":
         ratee_id = rating.ratee_id
         rating.moderation_status = "rejected"
+        adjust_gig_counters(rating.gig_id, rating_sum=-rating.score, ratings=-1)
         db.session.delete(rating)
         db.session.commit()
         update_user_average_rating(ratee_id)
@@ -439,33 +482,20 @@ def get_audit_logs(filters: Dict, pagination: Dict):
         end = datetime.fromisoformat(end_date)
         query = query.filter(AuditLog.created_at <= end)
 
+    per_page = min(int(pagination.get("per_page", 20)), 100)
+    cursor = pagination.get("cursor")
+    if cursor is not None:
+        page_data = keyset_paginate(query, _newest_first_keys(AuditLog), cursor, per_page)
+        page_data["items"] = [_audit_log_dict(log) for log in page_data["items"]]
+        return page_data
+
     query = query.order_by(AuditLog.created_at.desc())
 
     page = max(int(pagination.get("page", 1)), 1)
-    per_page = min(int(pagination.get("per_page", 20)), 100)
     pagination_obj = query.paginate(page=page, per_page=per_page, error_out=False)
 
     return {
-        "items": [
-            {
-                "id": log.id,
-                "action": log.action,
-                "resource_type": log.resource_type,
-                "resource_id": log.resource_id,
-                "details": log.details,
-                "created_at": log.created_at.isoformat() if log.created_at else None,
-                "user": (
-                    {
-                        "id": log.user.id,
-                        "name": log.user.name,
-                        "role": log.user.role,
-                    }
-                    if log.user
-                    else None
-                ),
-            }
-            for log in pagination_obj.items
-        ],
+        "items": [_audit_log_dict(log) for log in pagination_obj.items],
         "page": pagination_obj.page,
         "per_page": pagination_obj.per_page,
         "total": pagination_obj.total,
@@ -2,10 +2,14 @@ from datetime import datetime
 from typing import Dict, List
 from .. import db
 from ..models import Application, Gig
-from ..models import User
-from . import notification_service as _notification_service
+from . import outbox_service, similarity_service, trending_service
 from .exceptions import AuthorizationError, NotFoundError, ValidationError
-from .gig_service import get_gig_by_id
+from .gig_service import (
+    adjust_gig_counters,
+    counts_toward_applications,
+    get_gig_by_id,
+    invalidate_gig_cache,
+)
 
 
 def create_application(student_id: int, gig_id: int, notes: str = "") -> Application:
@@ -21,24 +25,23 @@ def create_application(student_id: int, gig_id: int, notes: str = "") -> Applica
         gig_id=gig_id, student_id=student_id, notes=notes, status="pending"
     )
     db.session.add(application)
+    adjust_gig_counters(gig_id, applications=1)
+    trending_service.record_activity(gig_id, applications=1)
+    db.session.flush()
+    payload = {"gig_id": gig_id, "application_id": application.id}
+    outbox_service.enqueue_event("application_received", payload)
+    outbox_service.enqueue_event("application_submitted", payload)
     db.session.commit()
-
-    # Notify admins about new application (service-level so seeder triggers it)
-    try:
-        admins = User.query.filter_by(role='admin').all()
-        for admin in admins:
-            _notification_service.create_notification_with_preferences(
-                user_id=admin.id,
-                type='application_submitted',
-                title='New application submitted',
-                message=f"A new application was submitted for '{gig.title}'.",
-                related_ids={'gig_id': gig_id, 'application_id': application.id},
-            )
-    except Exception:
-        pass
     return application
 
 
+def _track_status_change(application: Application, new_status: str) -> None:
+    delta = int(counts_toward_applications(new_status)) - int(
+        counts_toward_applications(application.status)
+    )
+    adjust_gig_counters(application.gig_id, applications=delta)
+
+
 def get_application_by_id(application_id: int) -> Application:
     application = Application.query.get(application_id)
     if not application:
@@ -73,16 +76,23 @@ def select_candidate(application_id: int, provider_id: int) -> Application:
     except ValueError as exc:
         raise ValidationError(str(exc))
 
+    _track_status_change(application, "accepted")
     application.status = "accepted"
     application.selected_at = datetime.utcnow()
     gig.status = "in_progress"
+    similarity_service.index_gig_similarity(gig)
 
     # Mark other applications as rejected
-    Application.query.filter(
+    others = Application.query.filter(
         Application.gig_id == gig.id, Application.id != application.id
-    ).update({Application.status: "rejected"}, synchronize_session=False)
+    )
+    # Withdrawn applications rejoin the gig's application_count as rejected ones
+    rejoined = others.filter(Application.status == "withdrawn").count()
+    others.update({Application.status: "rejected"}, synchronize_session=False)
+    adjust_gig_counters(gig.id, applications=rejoined)
 
     db.session.commit()
+    invalidate_gig_cache()
     return application
 
 
@@ -93,6 +103,7 @@ def update_application_status(application_id: int, new_status: str) -> Applicati
     except ValueError as exc:
         raise ValidationError(str(exc))
 
+    _track_status_change(application, new_status)
     application.status = new_status
     if new_status == "accepted" and not application.selected_at:
         application.selected_at = datetime.utcnow()
@@ -113,6 +124,7 @@ def withdraw_application(application_id: int, student_id: int) -> None:
     if application.status == "withdrawn":
         raise ValidationError("Application is already withdrawn")
     
+    _track_status_change(application, "withdrawn")
     application.status = "withdrawn"
     db.session.commit()
 
@@ -138,6 +150,7 @@ def bulk_update_applications(gig_id: int, provider_id: int, updates: List[Dict])
                 continue  # Skip applications not for this gig
             
             Application.validate_status(new_status)
+            _track_status_change(application, new_status)
             application.status = new_status
             if new_status == "accepted" and not application.selected_at:
                 application.selected_at = datetime.utcnow()
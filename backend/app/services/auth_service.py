@@ -1,11 +1,21 @@
+import hashlib
 import os
+import time
 from typing import Optional
 
 import firebase_admin
 from firebase_admin import auth, credentials
 
+from ..utils.cache import TTLCache, register_cache
+
 firebase_available = False
 
+# Verified Firebase ID tokens keyed by SHA-256 of the raw token. Entries never
+# outlive the token's exp claim, so a hit skips RSA signature verification
+# without extending a token's validity.
+_verified_tokens = TTLCache(max_entries=10000, default_ttl=300)
+register_cache("verified_tokens", _verified_tokens)
+
 cred_path = os.getenv("FIREBASE_CREDENTIALS_PATH", "firebase-service-account.json")
 if os.path.exists(cred_path):
     try:
@@ -25,6 +35,28 @@ def _check_test_tokens_enabled() -> bool:
         return allow_test.lower() in ('true', '1', 'yes')
 
 
+def _config_value(name: str, default):
+    from flask import current_app
+    try:
+        return current_app.config.get(name, default)
+    except RuntimeError:
+        return default
+
+
+def _token_cache_key(id_token: str) -> str:
+    return hashlib.sha256(id_token.encode()).hexdigest()
+
+
+def _cache_verified_token(key: str, decoded: dict, check_revoked: bool) -> None:
+    ttl = float(decoded.get("exp", 0)) - time.time()
+    if check_revoked:
+        # Revocation is only detected on re-verification; bound how long a
+        # revoked token can keep being accepted.
+        ttl = min(ttl, float(_config_value("VERIFIED_TOKEN_REVOCATION_TTL", 300)))
+    if ttl > 0:
+        _verified_tokens.set(key, decoded, ttl)
+
+
 def verify_token(id_token: Optional[str]):
     if not id_token:
         return None
@@ -45,8 +77,14 @@ def verify_token(id_token: Optional[str]):
             }
     
     if firebase_available:
+        key = _token_cache_key(id_token)
+        cached = _verified_tokens.get(key)
+        if cached is not None and cached.get("exp", 0) > time.time():
+            return dict(cached)
+
+        check_revoked = _config_value("FIREBASE_CHECK_REVOKED", False)
         try:
-            decoded = auth.verify_id_token(id_token)
+            decoded = auth.verify_id_token(id_token, check_revoked=check_revoked)
             # Firebase ID tokens may have custom_claims or claims directly
             # Try to extract role from custom claims if present
             if "role" in decoded:
@@ -57,7 +95,8 @@ def verify_token(id_token: Optional[str]):
                 custom_claims = decoded.get("custom_claims") or decoded.get("claims") or {}
                 if "role" in custom_claims:
                     decoded["role"] = custom_claims["role"]
-            return decoded
+            _cache_verified_token(key, decoded, check_revoked)
+            return dict(decoded)
         except Exception:
             return None
     
@@ -0,0 +1,291 @@
+"""Lock-safe delivery workers for the email and push notification queues.
+
+A worker claims a batch by stamping a lease (``claimed_by``/``claimed_until``)
+on pending rows and commits straight away. On PostgreSQL the candidate rows
+are selected ``FOR UPDATE SKIP LOCKED``, so concurrent workers claim disjoint
+batches without waiting on each other; on SQLite the clause is dropped and the
+single-statement UPDATE is serialized by the database lock instead. Sends then
+run on a bounded thread pool and the outcomes are written back in one commit
+per batch. A worker that dies mid-batch leaves its rows leased until
+``claimed_until`` passes, after which any worker can claim them again.
+
+Failed sends are rescheduled with exponential backoff and jitter through
+``next_attempt_at``; after ``NOTIFICATION_MAX_ATTEMPTS`` the row is parked as
+``failed`` (the dead-letter state) with the last error kept in ``last_error``.
+Claims take the lowest ``priority`` first and, within a priority, fresh rows
+before retries, so a flaky provider does not delay new messages.
+
+Run ``backend/scripts/notification_worker.py`` in as many processes as the
+backlog needs.
+"""
+import logging
+import os
+import random
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import or_, select, update
+
+from .. import db
+from ..models.notification_preferences import EmailQueue, PushNotification
+from . import notification_service
+from .exceptions import ValidationError
+from .device_service import get_live_tokens, prune_device_tokens
+from .push_delivery import deliver_pushes, get_push_transport
+
+logger = logging.getLogger("skillsync.delivery")
+
+
+def _send_email(email: EmailQueue) -> bool:
+    # Resolved at call time so the transport can be swapped or patched
+    return notification_service.send_email_mock(email)
+
+
+def _send_push(push: PushNotification) -> bool:
+    return notification_service.send_push_notification_mock(push)
+
+
+QUEUES = {
+    "email": (EmailQueue, _send_email),
+    "push": (PushNotification, _send_push),
+}
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def retry_delay(attempts: int, base: float, cap: float) -> timedelta:
+    """Backoff before retry number ``attempts``: exponential, capped, with jitter.
+
+    The delay is drawn from the upper half of the exponential step so retries
+    from one burst of failures spread out instead of returning together.
+    """
+    step = min(cap, base * (2 ** max(attempts - 1, 0)))
+    return timedelta(seconds=random.uniform(step / 2, step))
+
+
+def claim_rows(model, worker_id: str, limit: int, lease_seconds: int,
+               filters: List, order_by: List) -> List:
+    """Lease up to ``limit`` rows of ``model`` matching ``filters`` to ``worker_id``.
+
+    ``model`` needs ``claimed_by``/``claimed_until`` columns. Rows already
+    leased to someone else are skipped until their lease expires. The claim is
+    committed before the rows are returned.
+    """
+    now = datetime.utcnow()
+    # Unique per claim, so the re-select below returns exactly this batch
+    token = f"{worker_id}:{uuid.uuid4().hex[:8]}"[-64:]
+    candidates = (
+        select(model.id)
+        .where(
+            *filters,
+            or_(model.claimed_until.is_(None), model.claimed_until < now),
+        )
+        .order_by(*order_by)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    claimed = db.session.execute(
+        update(model)
+        .where(model.id.in_(candidates))
+        .values(
+            claimed_by=token,
+            claimed_until=now + timedelta(seconds=lease_seconds),
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    if not claimed:
+        return []
+    return model.query.filter(model.claimed_by == token).order_by(model.id).all()
+
+
+class BatchWorker:
+    """Drain/poll loop shared by workers that implement ``process_batch``.
+
+    ``process_batch`` returns a dict with at least ``claimed``; other integer
+    entries are summed and list entries concatenated by ``drain``.
+    """
+
+    worker_id: str
+    label: str
+
+    def process_batch(self, limit: int) -> Dict:
+        raise NotImplementedError
+
+    def drain(self, batch_size: int = 100, max_batches: Optional[int] = None) -> Dict:
+        """Process batches until nothing claimable is left."""
+        totals: Dict = {"batches": 0}
+        while max_batches is None or totals["batches"] < max_batches:
+            results = self.process_batch(batch_size)
+            if not results["claimed"]:
+                break
+            totals["batches"] += 1
+            for key, value in results.items():
+                if isinstance(value, list):
+                    totals.setdefault(key, []).extend(value)
+                else:
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def run_forever(self, batch_size: int = 100, idle_sleep: float = 5.0,
+                    stop: Optional[threading.Event] = None) -> None:
+        stop = stop or threading.Event()
+        logger.info(f"Worker {self.worker_id} polling {self.label}")
+        while not stop.is_set():
+            try:
+                results = self.process_batch(batch_size)
+            except Exception:
+                db.session.rollback()
+                logger.exception(f"Worker {self.worker_id} batch failed")
+                results = {"claimed": 0}
+            finally:
+                db.session.remove()
+            if not results["claimed"]:
+                stop.wait(idle_sleep)
+
+
+class QueueWorker(BatchWorker):
+    """Claims, sends and settles batches from one delivery queue.
+
+    ``sender`` receives rows that were fully loaded before the pool started
+    and must not touch the database session. A ``batch_sender`` takes the
+    whole claimed batch instead and returns ``(row, sent, error, permanent)``
+    tuples; the push queue uses one for multicast when ``PUSH_TRANSPORT`` is
+    set.
+    """
+
+    def __init__(
+        self,
+        queue: str,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        sender: Optional[Callable] = None,
+        batch_sender: Optional[Callable] = None,
+    ):
+        if queue not in QUEUES:
+            raise ValidationError(f"Unknown delivery queue '{queue}'")
+        config = current_app.config
+        self.queue = queue
+        self.label = f"the {queue} queue"
+        self.model, default_sender = QUEUES[queue]
+        self.sender = sender or default_sender
+        self.batch_sender = batch_sender
+        self.transport = None
+        if queue == "push" and sender is None and batch_sender is None:
+            self.transport = get_push_transport()
+            if self.transport is not None:
+                self.batch_sender = self._multicast_pushes
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = concurrency or int(config.get("NOTIFICATION_WORKER_CONCURRENCY", 8))
+        self.lease_seconds = lease_seconds or int(config.get("NOTIFICATION_WORKER_LEASE_SECONDS", 300))
+        self.max_attempts = int(config.get("NOTIFICATION_MAX_ATTEMPTS", 3))
+        self.retry_base = float(config.get("NOTIFICATION_RETRY_BASE_SECONDS", 60))
+        self.retry_max = float(config.get("NOTIFICATION_RETRY_MAX_SECONDS", 3600))
+
+    def claim_batch(self, limit: int) -> List:
+        """Lease up to ``limit`` pending rows to this worker and return them."""
+        model = self.model
+        return claim_rows(
+            model,
+            self.worker_id,
+            limit,
+            self.lease_seconds,
+            filters=[model.status == "pending", model.next_attempt_at <= datetime.utcnow()],
+            order_by=[model.priority, model.attempts > 0, model.id],
+        )
+
+    def _multicast_pushes(self, rows: List) -> List:
+        device_tokens = get_live_tokens(row.user_id for row in rows if not row.device_token)
+        invalid_tokens: List[str] = []
+        outcomes = deliver_pushes(rows, self.transport, device_tokens, invalid_tokens)
+        # Committed together with the batch outcomes
+        prune_device_tokens(invalid_tokens, commit=False)
+        return outcomes
+
+    def _send_all(self, rows: List) -> List:
+        """Send ``rows``; returns ``(row, sent, error, permanent)`` tuples."""
+        if self.batch_sender is not None:
+            return self.batch_sender(rows)
+
+        def attempt(row):
+            try:
+                return row, bool(self.sender(row)), None, False
+            except Exception as exc:
+                return row, False, str(exc), False
+
+        if len(rows) == 1 or self.concurrency <= 1:
+            return [attempt(row) for row in rows]
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(rows))) as pool:
+            return list(pool.map(attempt, rows))
+
+    def process_batch(self, limit: int = 50) -> Dict:
+        rows = self.claim_batch(limit)
+        results = {"claimed": len(rows), "sent": 0, "failed": 0, "errors": []}
+        if not rows:
+            return results
+
+        now = datetime.utcnow()
+        for row, sent, error, permanent in self._send_all(rows):
+            row.claimed_by = None
+            row.claimed_until = None
+            if sent:
+                row.status = "sent"
+                row.sent_at = now
+                results["sent"] += 1
+                continue
+            row.attempts = (row.attempts or 0) + 1
+            row.last_attempt = now
+            row.last_error = error or "Sender reported failure"
+            if error:
+                results["errors"].append(f"{self.queue.capitalize()} {row.id}: {error}")
+            if permanent or row.attempts >= self.max_attempts:
+                row.status = "failed"
+                results["failed"] += 1
+            else:
+                row.next_attempt_at = now + retry_delay(row.attempts, self.retry_base, self.retry_max)
+        db.session.commit()
+        return results
+
+
+def list_dead_letters(queue: str, limit: int = 50) -> List:
+    """Rows that exhausted their attempts, most recent failure first."""
+    if queue not in QUEUES:
+        raise ValidationError(f"Unknown delivery queue '{queue}'")
+    model = QUEUES[queue][0]
+    return (
+        model.query.filter(model.status == "failed")
+        .order_by(model.last_attempt.desc(), model.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def requeue_dead_letters(queue: str, ids: Optional[List[int]] = None) -> int:
+    """Give dead-lettered rows (all, or just ``ids``) a fresh set of attempts."""
+    if queue not in QUEUES:
+        raise ValidationError(f"Unknown delivery queue '{queue}'")
+    model = QUEUES[queue][0]
+    query = model.query.filter(model.status == "failed")
+    if ids:
+        query = query.filter(model.id.in_(ids))
+    requeued = query.update(
+        {
+            model.status: "pending",
+            model.attempts: 0,
+            model.next_attempt_at: datetime.utcnow(),
+            model.claimed_by: None,
+            model.claimed_until: None,
+        },
+        synchronize_session=False,
+    )
+    db.session.commit()
+    return requeued
@@ -0,0 +1,90 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from flask import current_app
+
+from .. import db
+from ..models import DeviceToken
+from .exceptions import NotFoundError, ValidationError
+
+PLATFORMS = {"ios", "android", "web"}
+
+
+def _live_since() -> datetime:
+    max_age = int(current_app.config.get("DEVICE_TOKEN_MAX_AGE_DAYS", 60))
+    return datetime.utcnow() - timedelta(days=max_age)
+
+
+def register_device(user_id: int, token: str, platform: Optional[str] = None) -> DeviceToken:
+    """Register a device token, or refresh it if already known.
+
+    A token belongs to one app install, so registering it for a different user
+    (someone else signed in on the device) moves it to that user.
+    """
+    token = (token or "").strip()
+    if not token:
+        raise ValidationError("token is required")
+    if len(token) > 255:
+        raise ValidationError("token must be at most 255 characters")
+    if platform is not None and platform not in PLATFORMS:
+        raise ValidationError(f"platform must be one of: {', '.join(sorted(PLATFORMS))}")
+
+    device = DeviceToken.query.filter_by(token=token).first()
+    if device is None:
+        device = DeviceToken(token=token)
+        db.session.add(device)
+    device.user_id = user_id
+    if platform is not None:
+        device.platform = platform
+    device.last_seen_at = datetime.utcnow()
+    db.session.commit()
+    return device
+
+
+def unregister_device(user_id: int, token: str) -> None:
+    device = DeviceToken.query.filter_by(user_id=user_id, token=token).first()
+    if device is None:
+        raise NotFoundError("Device token not registered")
+    db.session.delete(device)
+    db.session.commit()
+
+
+def list_devices(user_id: int) -> List[DeviceToken]:
+    return (
+        DeviceToken.query.filter_by(user_id=user_id)
+        .order_by(DeviceToken.last_seen_at.desc())
+        .all()
+    )
+
+
+def get_live_tokens(user_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """Tokens seen within ``DEVICE_TOKEN_MAX_AGE_DAYS`` for each user, in one query."""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    rows = (
+        db.session.query(DeviceToken.user_id, DeviceToken.token)
+        .filter(
+            DeviceToken.user_id.in_(user_ids),
+            DeviceToken.last_seen_at >= _live_since(),
+        )
+        .all()
+    )
+    tokens = defaultdict(list)
+    for user_id, token in rows:
+        tokens[user_id].append(token)
+    return dict(tokens)
+
+
+def prune_device_tokens(tokens: Iterable[str], commit: bool = True) -> int:
+    """Delete tokens the push provider reported as unregistered or invalid."""
+    tokens = set(tokens)
+    if not tokens:
+        return 0
+    deleted = DeviceToken.query.filter(DeviceToken.token.in_(tokens)).delete(
+        synchronize_session=False
+    )
+    if commit:
+        db.session.commit()
+    return deleted
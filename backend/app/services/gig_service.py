@@ -1,15 +1,28 @@
 from datetime import datetime, date
-from typing import Dict, Optional
-from sqlalchemy import desc, asc, and_, or_, func
+from decimal import Decimal
+from typing import Dict, List, Optional
+from sqlalchemy import desc, asc, and_, func, or_, update
 from .. import db
-from ..models import Gig, User, Application
-from . import notification_service as _notification_service
+from ..models import Gig, User, Application, Rating
+from ..utils.cache import response_cache
+from . import outbox_service, search_service, similarity_service, skill_match_service
 from .exceptions import NotFoundError, ValidationError
+from .pagination import SortKey, keyset_paginate
 from .user_service import get_user_by_id
 
 
 DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d")
 
+# Stand-ins for NULL budgets/deadlines in cursor mode. They sort above every
+# real value, matching PostgreSQL's NULL ordering for the offset-mode sorts.
+_BUDGET_NULL_SENTINEL = Decimal("100000000")
+_DEADLINE_NULL_SENTINEL = date(9999, 12, 31)
+
+
+def invalidate_gig_cache() -> None:
+    """Drop cached public gig responses after a gig write commits."""
+    response_cache.invalidate("gigs")
+
 
 def _parse_deadline(value: Optional[str]):
     if not value:
@@ -47,21 +60,13 @@ def create_gig(provider_id: int, gig_data: Dict) -> Gig:
         raise ValidationError(str(exc))
 
     db.session.add(gig)
+    db.session.flush()
+    skill_match_service.index_gig_skills(gig)
+    # Admins are notified by the outbox dispatcher, committed with the gig
+    outbox_service.enqueue_event("gig_submitted", {"gig_id": gig.id})
     db.session.commit()
-
-    # Notify admins that a new gig is pending approval (service-level so seed scripts trigger it)
-    try:
-        admins = User.query.filter_by(role='admin').all()
-        for admin in admins:
-            _notification_service.create_notification_with_preferences(
-                user_id=admin.id,
-                type="gig_pending",
-                title="New gig pending approval",
-                message=f"A new gig '{gig.title}' has been posted and is awaiting approval.",
-                related_ids={"gig_id": gig.id},
-            )
-    except Exception:
-        pass
+    search_service.index_gig(gig)
+    invalidate_gig_cache()
     return gig
 
 
@@ -95,29 +100,138 @@ def update_gig(gig_id: int, gig_data: Dict) -> Gig:
                 Gig.validate_status(value)
             except ValueError as exc:
                 raise ValidationError(str(exc))
+    if {"title", "description"} & gig_data.keys():
+        skill_match_service.index_gig_skills(gig)
+    if {"title", "description", "category", "status"} & gig_data.keys():
+        similarity_service.index_gig_similarity(gig)
     db.session.commit()
+    search_service.index_gig(gig)
+    invalidate_gig_cache()
     return gig
 
 
 def delete_gig(gig_id: int) -> None:
     gig = get_gig_by_id(gig_id)
+    similarity_service.remove_gig_similarity(gig_id)
     db.session.delete(gig)
     db.session.commit()
+    search_service.remove_gig(gig_id)
+    invalidate_gig_cache()
+
+
+def counts_toward_applications(status: Optional[str]) -> bool:
+    """Whether an application with ``status`` is included in ``Gig.application_count``."""
+    return status != "withdrawn"
+
+
+def adjust_gig_counters(
+    gig_id: int,
+    applications: int = 0,
+    rating_sum: int = 0,
+    ratings: int = 0,
+) -> None:
+    """Apply deltas to a gig's denormalized counters in the current transaction.
+
+    The increment happens in the database (``SET x = x + :delta``) so
+    concurrent requests cannot lose each other's updates. The caller commits.
+    """
+    values = {}
+    if applications:
+        values[Gig.application_count] = Gig.application_count + applications
+    if rating_sum:
+        values[Gig.rating_sum] = Gig.rating_sum + rating_sum
+    if ratings:
+        values[Gig.rating_count] = Gig.rating_count + ratings
+    if values:
+        # Counter changes are not edits; keep updated_at's onupdate from firing.
+        values[Gig.updated_at] = Gig.updated_at
+        Gig.query.filter(Gig.id == gig_id).update(values, synchronize_session=False)
+
+
+def reconcile_gig_counters() -> int:
+    """Recompute every gig's counters from the applications and ratings tables.
+
+    Runs as one bulk UPDATE and only touches rows that drifted. Returns the
+    number of gigs that were corrected.
+    """
+    application_total = (
+        db.select(func.count(Application.id))
+        .where(Application.gig_id == Gig.id, Application.status != "withdrawn")
+        .scalar_subquery()
+    )
+    rating_total = (
+        db.select(func.coalesce(func.sum(Rating.score), 0))
+        .where(Rating.gig_id == Gig.id)
+        .scalar_subquery()
+    )
+    rating_total_count = (
+        db.select(func.count(Rating.id))
+        .where(Rating.gig_id == Gig.id)
+        .scalar_subquery()
+    )
+    result = db.session.execute(
+        update(Gig)
+        .where(
+            or_(
+                Gig.application_count != application_total,
+                Gig.rating_sum != rating_total,
+                Gig.rating_count != rating_total_count,
+            )
+        )
+        .values(
+            application_count=application_total,
+            rating_sum=rating_total,
+            rating_count=rating_total_count,
+            updated_at=Gig.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    if result.rowcount:
+        invalidate_gig_cache()
+    return result.rowcount
+
+
+def _gig_cursor_keys(sort_by: Optional[str]) -> List[SortKey]:
+    """Keyset ordering for cursor pagination, always tie-broken by id."""
+    if sort_by == "budget_high" or sort_by == "budget_low":
+        descending = sort_by == "budget_high"
+        budget = func.coalesce(Gig.budget, _BUDGET_NULL_SENTINEL)
+
+        def budget_value(gig):
+            return gig.budget if gig.budget is not None else _BUDGET_NULL_SENTINEL
+
+        return [
+            SortKey(budget, descending, budget_value),
+            SortKey(Gig.id, descending, lambda gig: gig.id),
+        ]
+    if sort_by == "deadline":
+        deadline = func.coalesce(Gig.deadline, _DEADLINE_NULL_SENTINEL)
+        return [
+            SortKey(deadline, False, lambda gig: gig.deadline or _DEADLINE_NULL_SENTINEL),
+            SortKey(Gig.id, False, lambda gig: gig.id),
+        ]
+    if sort_by == "title":
+        return [
+            SortKey(Gig.title, False, lambda gig: gig.title),
+            SortKey(Gig.id, False, lambda gig: gig.id),
+        ]
+    if sort_by in ("rating", "relevance"):
+        raise ValidationError(f"Cursor pagination is not available for sort_by={sort_by}")
+    return [
+        SortKey(Gig.created_at, True, lambda gig: gig.created_at),
+        SortKey(Gig.id, True, lambda gig: gig.id),
+    ]
 
 
 def browse_gigs(filters: Dict, pagination: Dict):
     query = Gig.query
 
-    # Keyword search in title and description
+    # Full-text search over title, description and category
+    relevance = None
     search = filters.get("search")
     if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            or_(
-                Gig.title.ilike(search_pattern),
-                Gig.description.ilike(search_pattern)
-            )
-        )
+        query, relevance = search_service.apply_gig_search(query, search)
 
     # Category filtering
     category = filters.get("category")
@@ -186,8 +300,17 @@ def browse_gigs(filters: Dict, pagination: Dict):
     else:
         query = query.filter(Gig.approval_status == "approved")
 
-    # Enhanced sorting options
     sort_by = filters.get("sort")
+    per_page = min(int(pagination.get("per_page", 20)), 100)
+
+    # Cursor mode: index seek on the sort key, no COUNT(*) or OFFSET
+    cursor = pagination.get("cursor")
+    if cursor is not None:
+        return keyset_paginate(
+            query, _gig_cursor_keys(sort_by), cursor, per_page, sort_name=sort_by or "newest"
+        )
+
+    # Enhanced sorting options
     if sort_by == "budget_high":
         query = query.order_by(desc(Gig.budget))
     elif sort_by == "budget_low":
@@ -200,11 +323,12 @@ def browse_gigs(filters: Dict, pagination: Dict):
         query = query.join(User, Gig.provider_id == User.id).order_by(
             desc(User.average_rating)
         )
+    elif sort_by == "relevance" and relevance is not None:
+        query = query.order_by(desc(relevance), desc(Gig.created_at))
     else:  # Default: newest first
         query = query.order_by(desc(Gig.created_at))
 
     page = max(int(pagination.get("page", 1)), 1)
-    per_page = min(int(pagination.get("per_page", 20)), 100)
     pagination_obj = query.paginate(page=page, per_page=per_page, error_out=False)
 
     return {
@@ -223,7 +347,9 @@ def update_gig_status(gig_id: int, new_status: str) -> Gig:
     except ValueError as exc:
         raise ValidationError(str(exc))
     gig.status = new_status
+    similarity_service.index_gig_similarity(gig)
     db.session.commit()
+    invalidate_gig_cache()
     return gig
 
 
@@ -332,10 +458,12 @@ def mark_expired_gigs():
     count = 0
     for gig in expired_gigs:
         gig.status = "closed"
+        similarity_service.remove_gig_similarity(gig.id)
         count += 1
     
     if count > 0:
         db.session.commit()
+        invalidate_gig_cache()
     
     return count
 
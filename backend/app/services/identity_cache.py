@@ -0,0 +1,90 @@
+"""Per-process cache of authenticated user identities.
+
+``require_auth`` and ``token_required`` resolve the token's uid to a ``User``
+on every request. This cache keeps each uid's ``(id, role)`` for
+``AUTH_USER_CACHE_TTL`` seconds so repeat callers skip the users lookup; the
+full row is only loaded if a handler reads some other attribute. Services that
+change a user's role or profile call ``invalidate`` after committing. Other
+worker processes pick the change up when their entry expires.
+"""
+from typing import Optional
+
+from flask import Flask, current_app
+
+from .. import db
+from ..models import User
+from ..utils.cache import TTLCache, register_cache
+from .exceptions import AuthenticationError
+
+
+class AuthenticatedUser:
+    """Stand-in for ``g.current_user`` built from a cached identity.
+
+    ``id``, ``uid`` and ``role`` are answered from the cache; any other
+    attribute loads the ``User`` row once and delegates to it.
+    """
+
+    def __init__(self, user_id: int, uid: str, role: str):
+        self.id = user_id
+        self.uid = uid
+        self.role = role
+        self._user: Optional[User] = None
+
+    def is_role(self, *roles: str) -> bool:
+        normalized = {role.lower() for role in roles}
+        return self.role.lower() in normalized
+
+    def _load(self) -> User:
+        if self._user is None:
+            user = db.session.get(User, self.id)
+            if user is None:
+                identity_cache.invalidate(self.uid)
+                raise AuthenticationError("Authenticated user no longer exists")
+            self._user = user
+        return self._user
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes not set in __init__
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        return f"<AuthenticatedUser {self.uid} ({self.role})>"
+
+
+class IdentityCache:
+    def __init__(self, app: Flask = None):
+        self.cache = TTLCache(max_entries=10000, default_ttl=60)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        app.config.setdefault("AUTH_USER_CACHE_ENABLED", True)
+        app.config.setdefault("AUTH_USER_CACHE_TTL", 60)
+        app.config.setdefault("AUTH_USER_CACHE_MAX_ENTRIES", 10000)
+        self.cache = TTLCache(
+            max_entries=int(app.config["AUTH_USER_CACHE_MAX_ENTRIES"]),
+            default_ttl=float(app.config["AUTH_USER_CACHE_TTL"]),
+        )
+        register_cache("auth_users", self.cache)
+
+    def _enabled(self) -> bool:
+        return current_app.config.get("AUTH_USER_CACHE_ENABLED", False)
+
+    def get(self, uid: str) -> Optional[AuthenticatedUser]:
+        if not self._enabled():
+            return None
+        entry = self.cache.get(uid)
+        if entry is None:
+            return None
+        user_id, role = entry
+        return AuthenticatedUser(user_id, uid, role)
+
+    def remember(self, user: User) -> None:
+        if self._enabled():
+            self.cache.set(user.uid, (user.id, user.role))
+
+    def invalidate(self, uid: str) -> None:
+        self.cache.delete(uid)
+
+
+identity_cache = IdentityCache()
@@ -0,0 +1,95 @@
+"""Per-user unread notification counters.
+
+``notification_counters`` holds each user's unread count so the constantly
+polled unread-count endpoint is a primary-key read. Every write that creates,
+reads or removes notifications applies its delta with ``SET unread_count =
+unread_count + :delta`` in the same transaction, so concurrent writers cannot
+lose updates. A user's row is created lazily from ``COUNT(*)`` on the first
+read; until then deltas for that user are no-ops. Migration 013 backfills a
+row for every existing user, and the lazy initialization is a single
+``INSERT ... VALUES (:user_id, (SELECT COUNT(*) ...)) ON CONFLICT DO NOTHING``
+so there is no window between counting and writing.
+``reconcile_notification_counters`` repairs any remaining drift (e.g. rows
+loaded outside the services).
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable
+
+from sqlalchemy import func, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from .. import db
+from ..models import Notification, NotificationCounter
+
+# Users per UPDATE ... WHERE user_id IN (...)
+COUNTER_CHUNK_SIZE = 1000
+
+
+def adjust_unread_counts(user_ids: Iterable[int], delta: int) -> None:
+    """Add ``delta`` to the unread count of each of ``user_ids``; the caller commits.
+
+    A user listed twice gets the delta twice.
+    """
+    per_user = Counter(user_ids)
+    by_delta: Dict[int, list] = {}
+    for user_id, times in per_user.items():
+        by_delta.setdefault(delta * times, []).append(user_id)
+    for amount, users in by_delta.items():
+        if not amount:
+            continue
+        for start in range(0, len(users), COUNTER_CHUNK_SIZE):
+            db.session.execute(
+                update(NotificationCounter)
+                .where(NotificationCounter.user_id.in_(users[start:start + COUNTER_CHUNK_SIZE]))
+                .values(
+                    unread_count=NotificationCounter.unread_count + amount,
+                    updated_at=datetime.utcnow(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+
+def _unread_subquery(user_id):
+    return (
+        db.select(func.count(Notification.id))
+        .where(Notification.user_id == user_id, Notification.read.is_(False))
+        .scalar_subquery()
+    )
+
+
+def _insert_ignoring_conflicts():
+    dialect = postgresql if db.engine.dialect.name == "postgresql" else sqlite
+    return dialect.insert(NotificationCounter)
+
+
+def get_unread_count(user_id: int) -> int:
+    counter = db.session.get(NotificationCounter, user_id)
+    if counter is not None:
+        return counter.unread_count
+    # Count and insert in one statement; a concurrent initializer wins quietly
+    db.session.execute(
+        _insert_ignoring_conflicts()
+        .values(user_id=user_id, unread_count=_unread_subquery(user_id),
+                updated_at=datetime.utcnow())
+        .on_conflict_do_nothing(index_elements=["user_id"])
+    )
+    db.session.commit()
+    return db.session.get(NotificationCounter, user_id).unread_count
+
+
+def reconcile_notification_counters() -> int:
+    """Recompute every existing counter from ``notifications``.
+
+    Runs as one bulk UPDATE that only touches drifted rows; returns how many
+    were corrected.
+    """
+    actual = _unread_subquery(NotificationCounter.user_id)
+    result = db.session.execute(
+        update(NotificationCounter)
+        .where(NotificationCounter.unread_count != actual)
+        .values(unread_count=actual, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount
@@ -0,0 +1,114 @@
+"""Periodic email digests of coalesced notifications.
+
+``coalesce_notifications`` flags notifications with ``digest_pending`` for
+recipients who want email for their type, and queues
+``notification_digest_items`` for recipients who want email but no in-app
+notification. Once a user's oldest flagged notification or item is
+``NOTIFICATION_DIGEST_INTERVAL`` seconds old, the digest worker queues a
+single low-priority email summarizing all of them, clears the flags and
+deletes the items. Notifications already read in the app are left out of the
+email.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Union
+
+from flask import current_app
+from sqlalchemy import func, select, union_all
+
+from .. import db
+from ..models import Notification, NotificationDigestItem, User
+from ..models.notification_preferences import EmailQueue
+from .delivery_worker import BatchWorker, default_worker_id
+from .notification_service import PRIORITY_LOW
+
+
+def digest_subject(count: int) -> str:
+    if count == 1:
+        return "You have 1 new update on SkillSync"
+    return f"You have {count} new updates on SkillSync"
+
+
+def digest_body(entries: Sequence[Union[Notification, NotificationDigestItem]]) -> str:
+    lines = [f"- {entry.title}: {entry.message}" for entry in entries]
+    return "Here is what happened since your last update:\n\n" + "\n".join(lines)
+
+
+class DigestWorker(BatchWorker):
+    """Queues one digest email per user whose flagged notifications are due."""
+
+    label = "notification digests"
+
+    def __init__(self, worker_id: Optional[str] = None, interval: Optional[int] = None):
+        self.worker_id = worker_id or default_worker_id()
+        self.interval = interval if interval is not None else int(
+            current_app.config.get("NOTIFICATION_DIGEST_INTERVAL", 3600)
+        )
+
+    def due_users(self, limit: int) -> List[int]:
+        cutoff = datetime.utcnow() - timedelta(seconds=self.interval)
+        pending = union_all(
+            select(Notification.user_id, Notification.created_at)
+            .where(Notification.digest_pending.is_(True)),
+            select(NotificationDigestItem.user_id, NotificationDigestItem.created_at),
+        ).subquery()
+        oldest = func.min(pending.c.created_at)
+        rows = (
+            db.session.query(pending.c.user_id)
+            .group_by(pending.c.user_id)
+            .having(oldest <= cutoff)
+            .order_by(oldest)
+            .limit(limit)
+            .all()
+        )
+        return [user_id for (user_id,) in rows]
+
+    def send_digest(self, user_id: int) -> int:
+        """Queue the digest for ``user_id``; returns how many entries it lists."""
+        flagged = (
+            Notification.query.filter(
+                Notification.user_id == user_id,
+                Notification.digest_pending.is_(True),
+            )
+            .order_by(Notification.id)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        items = (
+            NotificationDigestItem.query.filter(NotificationDigestItem.user_id == user_id)
+            .order_by(NotificationDigestItem.id)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for notification in flagged:
+            notification.digest_pending = False
+        for item in items:
+            db.session.delete(item)
+        unread = [notification for notification in flagged if not notification.read]
+        entries = sorted([*unread, *items], key=lambda entry: entry.created_at)
+        email_address = db.session.query(User.email).filter(User.id == user_id).scalar()
+        if entries and email_address:
+            db.session.add(EmailQueue(
+                user_id=user_id,
+                email_address=email_address,
+                subject=digest_subject(len(entries)),
+                body=digest_body(entries),
+                template="digest",
+                template_data={"notification_ids": [notification.id for notification in unread]},
+                priority=PRIORITY_LOW,
+            ))
+        db.session.commit()
+        return len(entries) if email_address else 0
+
+    def process_batch(self, limit: int = 100) -> Dict:
+        user_ids = self.due_users(limit)
+        results = {"claimed": len(user_ids), "digests": 0, "notifications": 0}
+        for user_id in user_ids:
+            listed = self.send_digest(user_id)
+            if listed:
+                results["digests"] += 1
+                results["notifications"] += listed
+        return results
+
+
+def send_notification_digests(limit: int = 100) -> Dict:
+    return DigestWorker().process_batch(limit)
@@ -1,9 +1,17 @@
-from typing import Dict, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import insert
+from sqlalchemy.orm import load_only
 from .. import db
-from ..models import Notification
+from ..models import Notification, NotificationDigestItem, User
 from ..models.notification_preferences import NotificationPreference, EmailQueue, PushNotification
 from .exceptions import AuthorizationError, NotFoundError, ValidationError
+from .pagination import SortKey, keyset_paginate
+from .notification_counters import adjust_unread_counts, get_unread_count
+from .notification_stream import notification_hub
+from .preference_resolver import preference_resolver
+from .retention_service import hot_cutoff
 from .user_service import get_user_by_id
 
 
@@ -13,7 +21,13 @@ def create_notification(
     title: str,
     message: str,
     related_ids: Optional[Dict[str, int]] = None,
+    commit: bool = True,
 ) -> Notification:
+    """Add an in-app notification and wake the recipient's open streams.
+
+    With ``commit=False`` the row is only added to the current transaction;
+    the caller commits it and then publishes ``user_id`` to the hub.
+    """
     related_ids = related_ids or {}
     notification = Notification(
         user_id=user_id,
@@ -24,10 +38,45 @@ def create_notification(
         related_application_id=related_ids.get("application_id"),
     )
     db.session.add(notification)
-    db.session.commit()
+    adjust_unread_counts([user_id], 1)
+    if commit:
+        db.session.commit()
+        notification_hub.publish(user_id)
     return notification
 
 
+def get_notifications_after(user_id: int, after_id: int, limit: int = 100) -> List[Notification]:
+    """Notifications newer than ``after_id``, oldest first, for stream delivery."""
+    return (
+        Notification.query.filter(
+            Notification.user_id == user_id, Notification.id > after_id
+        )
+        .order_by(Notification.id.asc())
+        .limit(limit)
+        .all()
+    )
+
+
+def get_notifications_by_ids(user_id: int, ids: List[int]) -> List[Notification]:
+    """The user's notifications among ``ids``, oldest first, for stream updates."""
+    if not ids:
+        return []
+    return (
+        Notification.query.filter(Notification.user_id == user_id, Notification.id.in_(ids))
+        .order_by(Notification.id.asc())
+        .all()
+    )
+
+
+def get_latest_notification_id(user_id: int) -> int:
+    latest = (
+        db.session.query(db.func.max(Notification.id))
+        .filter(Notification.user_id == user_id)
+        .scalar()
+    )
+    return latest or 0
+
+
 def get_user_notifications(user_id: int, unread_only: bool = False) -> List[Notification]:
     query = Notification.query.filter_by(user_id=user_id)
     if unread_only:
@@ -35,14 +84,63 @@ def get_user_notifications(user_id: int, unread_only: bool = False) -> List[Noti
     return query.order_by(Notification.created_at.desc()).all()
 
 
+NOTIFICATION_PAGE_SIZE = 20
+NOTIFICATION_PAGE_MAX = 100
+
+# Columns the compact list representation needs
+COMPACT_NOTIFICATION_COLUMNS = (
+    Notification.id,
+    Notification.type,
+    Notification.title,
+    Notification.read,
+    Notification.related_gig_id,
+    Notification.created_at,
+    Notification.group_count,
+)
+
+_NOTIFICATION_CURSOR_KEYS = [
+    SortKey(Notification.created_at, True, lambda notification: notification.created_at),
+    SortKey(Notification.id, True, lambda notification: notification.id),
+]
+
+
+def paginate_user_notifications(
+    user_id: int,
+    cursor: Optional[str] = None,
+    limit: int = NOTIFICATION_PAGE_SIZE,
+    unread_only: bool = False,
+    compact: bool = False,
+) -> Dict:
+    """One page of a user's notifications, newest first.
+
+    Seeks on ``(created_at, id)`` so each page is an index range read on
+    ``idx_notifications_user_created`` (or the partial unread index), however
+    long the history. ``compact`` loads only the columns of the compact
+    representation.
+    """
+    limit = max(1, min(int(limit), NOTIFICATION_PAGE_MAX))
+    query = Notification.query.filter(Notification.user_id == user_id)
+    if unread_only:
+        query = query.filter(Notification.read.is_(False))
+    if compact:
+        query = query.options(load_only(*COMPACT_NOTIFICATION_COLUMNS))
+    return keyset_paginate(query, _NOTIFICATION_CURSOR_KEYS, cursor, limit, sort_name="newest")
+
+
 def mark_notification_read(notification_id: int, user_id: Optional[int] = None) -> Notification:
     notification = Notification.query.get(notification_id)
     if not notification:
         raise NotFoundError(f"Notification with id {notification_id} not found")
     if user_id is not None and notification.user_id != user_id:
         raise AuthorizationError("Cannot modify another user's notification")
-    notification.read = True
+    # Conditional update, so concurrent reads of the same row decrement once
+    changed = (
+        Notification.query.filter_by(id=notification_id, read=False)
+        .update({Notification.read: True}, synchronize_session=False)
+    )
+    adjust_unread_counts([notification.user_id], -changed)
     db.session.commit()
+    db.session.refresh(notification)
     return notification
 
 
@@ -51,12 +149,13 @@ def mark_all_notifications_read(user_id: int) -> int:
         Notification.query.filter_by(user_id=user_id, read=False)
         .update({Notification.read: True}, synchronize_session=False)
     )
+    adjust_unread_counts([user_id], -updated)
     db.session.commit()
     return updated
 
 
 def notify_application_received(
-    provider_id: int, gig_id: int, application_id: int
+    provider_id: int, gig_id: int, application_id: int, commit: bool = True
 ) -> Notification:
     return create_notification(
         user_id=provider_id,
@@ -64,6 +163,7 @@ def notify_application_received(
         title="New application received",
         message="A student has applied to your gig.",
         related_ids={"gig_id": gig_id, "application_id": application_id},
+        commit=commit,
     )
 
 
@@ -79,23 +179,139 @@ def notify_application_status_change(
     )
 
 
-def notify_gig_update(
-    student_ids: Iterable[int], gig_id: int, update_type: str
+COALESCE_CHUNK_SIZE = 1000
+
+
+def coalesce_notifications(
+    user_ids: Iterable[int],
+    type: str,
+    title: str,
+    message: str,
+    gig_id: int,
+    merged_message: Callable[[int], str],
 ) -> List[Notification]:
+    """Notify ``user_ids`` about ``gig_id``, merging into recent unread notifications.
+
+    A recipient who still has an unread notification of ``type`` for the gig
+    from the last ``NOTIFICATION_COALESCE_WINDOW`` seconds gets that row's
+    ``group_count`` bumped and its message replaced by
+    ``merged_message(group_count)`` instead of a new row. Recipients with
+    email enabled for ``type`` have the notification flagged for their next
+    digest (see ``notification_digest``) rather than one email per event;
+    those with email but not in-app enabled get a digest item instead, merged
+    the same way.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    window = int(current_app.config.get("NOTIFICATION_COALESCE_WINDOW", 600))
+    preferences = preference_resolver.resolve_many(user_ids, type)
+    recipients = [user_id for user_id in user_ids if preferences[user_id].in_app_enabled]
+    _queue_digest_items(
+        [
+            user_id for user_id in user_ids
+            if preferences[user_id].email_enabled and not preferences[user_id].in_app_enabled
+        ],
+        type, title, message, gig_id, merged_message,
+    )
+
+    latest: Dict[int, Notification] = {}
+    if window > 0:
+        since = datetime.utcnow() - timedelta(seconds=window)
+        for start in range(0, len(recipients), COALESCE_CHUNK_SIZE):
+            for notification in (
+                Notification.query.filter(
+                    Notification.user_id.in_(recipients[start:start + COALESCE_CHUNK_SIZE]),
+                    Notification.type == type,
+                    Notification.related_gig_id == gig_id,
+                    Notification.read.is_(False),
+                    Notification.created_at >= since,
+                )
+                .order_by(Notification.id)
+            ):
+                latest[notification.user_id] = notification
+
     notifications: List[Notification] = []
-    for student_id in student_ids:
-        notifications.append(
-            create_notification(
-                user_id=student_id,
-                type="gig_update",
-                title="Gig update",
-                message=f"A gig you applied to has a new update: {update_type}.",
-                related_ids={"gig_id": gig_id},
+    created: List[int] = []
+    merged: Dict[int, int] = {}
+    for user_id in recipients:
+        notification = latest.get(user_id)
+        if notification is None:
+            notification = Notification(
+                user_id=user_id,
+                type=type,
+                title=title,
+                message=message,
+                related_gig_id=gig_id,
+                group_count=1,
             )
-        )
+            db.session.add(notification)
+            created.append(user_id)
+        else:
+            notification.group_count = (notification.group_count or 1) + 1
+            notification.message = merged_message(notification.group_count)
+            merged[user_id] = notification.id
+        notification.digest_pending = preferences[user_id].email_enabled
+        notifications.append(notification)
+    adjust_unread_counts(created, 1)
+    db.session.commit()
+    for user_id in created:
+        notification_hub.publish(user_id)
+    # A merged row keeps its id, so streams are told which row to re-send
+    for user_id, notification_id in merged.items():
+        notification_hub.publish(user_id, updated_ids=[notification_id])
     return notifications
 
 
+def _queue_digest_items(
+    user_ids: List[int],
+    type: str,
+    title: str,
+    message: str,
+    gig_id: int,
+    merged_message: Callable[[int], str],
+) -> None:
+    """Add the event to the pending digest items of ``user_ids``; the caller commits."""
+    pending: Dict[int, NotificationDigestItem] = {}
+    for start in range(0, len(user_ids), COALESCE_CHUNK_SIZE):
+        for item in (
+            NotificationDigestItem.query.filter(
+                NotificationDigestItem.user_id.in_(user_ids[start:start + COALESCE_CHUNK_SIZE]),
+                NotificationDigestItem.type == type,
+                NotificationDigestItem.related_gig_id == gig_id,
+            )
+            .order_by(NotificationDigestItem.id)
+        ):
+            pending[item.user_id] = item
+    for user_id in user_ids:
+        item = pending.get(user_id)
+        if item is None:
+            db.session.add(NotificationDigestItem(
+                user_id=user_id,
+                type=type,
+                title=title,
+                message=message,
+                related_gig_id=gig_id,
+                group_count=1,
+            ))
+        else:
+            item.group_count += 1
+            item.message = merged_message(item.group_count)
+
+
+def notify_gig_update(
+    student_ids: Iterable[int], gig_id: int, update_type: str
+) -> List[Notification]:
+    return coalesce_notifications(
+        student_ids,
+        type="gig_update",
+        title="Gig update",
+        message=f"A gig you applied to has a new update: {update_type}.",
+        gig_id=gig_id,
+        merged_message=lambda count: (
+            f"A gig you applied to has {count} new updates. Latest: {update_type}."
+        ),
+    )
+
+
 def notify_rating_received(user_id: int, rating_id: int) -> Notification:
     return create_notification(
         user_id=user_id,
@@ -141,6 +357,7 @@ def create_default_notification_preferences(user_id: int) -> List[NotificationPr
         preferences.append(preference)
     
     db.session.commit()
+    preference_resolver.invalidate(user_id)
     return preferences
 
 
@@ -166,6 +383,7 @@ def update_notification_preference(user_id: int, notification_type: str, **setti
     
     preference.updated_at = datetime.utcnow()
     db.session.commit()
+    preference_resolver.invalidate(user_id)
     return preference
 
 
@@ -197,23 +415,8 @@ def create_notification_with_preferences(
 ) -> Dict:
     """Create notification respecting user preferences and send via multiple channels"""
     
-    # Get user preferences
-    preference = NotificationPreference.query.filter_by(
-        user_id=user_id, 
-        notification_type=type
-    ).first()
-    
-    if not preference:
-        # Create default preference if none exists
-        preference = NotificationPreference(
-            user_id=user_id,
-            notification_type=type,
-            email_enabled=True,
-            push_enabled=True,
-            in_app_enabled=True
-        )
-        db.session.add(preference)
-        db.session.commit()
+    # Stored preference, or the type's default when the user never set one
+    preference = preference_resolver.resolve(user_id, type)
     
     results = {"created": []}
     
@@ -225,27 +428,49 @@ def create_notification_with_preferences(
     # Queue email notification if enabled
     if preference.email_enabled:
         email_id = queue_email_notification(
-            user_id, title, message, email_template, email_data
+            user_id, title, message, email_template, email_data, notification_type=type
         )
         if email_id:
             results["created"].append({"type": "email", "id": email_id})
     
     # Queue push notification if enabled
     if preference.push_enabled:
-        push_id = queue_push_notification(user_id, title, message, related_ids)
+        push_id = queue_push_notification(
+            user_id, title, message, related_ids, notification_type=type
+        )
         if push_id:
             results["created"].append({"type": "push", "id": push_id})
     
     return results
 
 
+# Delivery priority of queued emails and pushes (lower is sent first)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+DELIVERY_PRIORITIES = {
+    "application_received": PRIORITY_HIGH,
+    "application_status": PRIORITY_HIGH,
+    "role_changed": PRIORITY_HIGH,
+    "rating_warning": PRIORITY_HIGH,
+    "gig_update": PRIORITY_LOW,
+    "rating_received": PRIORITY_LOW,
+}
+
+
+def delivery_priority(notification_type: Optional[str]) -> int:
+    return DELIVERY_PRIORITIES.get(notification_type, PRIORITY_NORMAL)
+
+
 # Email notification system
 def queue_email_notification(
     user_id: int, 
     subject: str, 
     message: str, 
     template: Optional[str] = None,
-    template_data: Optional[Dict] = None
+    template_data: Optional[Dict] = None,
+    notification_type: Optional[str] = None
 ) -> Optional[int]:
     """Queue an email notification for sending"""
     try:
@@ -259,7 +484,8 @@ def queue_email_notification(
             subject=subject,
             body=message,
             template=template,
-            template_data=template_data or {}
+            template_data=template_data or {},
+            priority=delivery_priority(notification_type)
         )
         db.session.add(email)
         db.session.commit()
@@ -269,36 +495,10 @@ def queue_email_notification(
 
 
 def process_email_queue(limit: int = 50) -> Dict:
-    """Process pending emails in the queue"""
-    pending_emails = EmailQueue.query.filter_by(status="pending").limit(limit).all()
-    
-    results = {"sent": 0, "failed": 0, "errors": []}
-    
-    for email in pending_emails:
-        try:
-            # Here you would integrate with an email service like SendGrid, SES, etc.
-            # For now, we'll simulate the sending process
-            success = send_email_mock(email)
-            
-            if success:
-                email.status = "sent"
-                email.sent_at = datetime.utcnow()
-                results["sent"] += 1
-            else:
-                email.attempts += 1
-                email.last_attempt = datetime.utcnow()
-                if email.attempts >= 3:
-                    email.status = "failed"
-                    results["failed"] += 1
-        except Exception as e:
-            email.attempts += 1
-            email.last_attempt = datetime.utcnow()
-            results["errors"].append(f"Email {email.id}: {str(e)}")
-            if email.attempts >= 3:
-                email.status = "failed"
-                results["failed"] += 1
-    
-    db.session.commit()
+    """Claim and send one batch of pending emails"""
+    from .delivery_worker import QueueWorker
+    results = QueueWorker("email").process_batch(limit)
+    results.pop("claimed")
     return results
 
 
@@ -314,7 +514,8 @@ def queue_push_notification(
     user_id: int, 
     title: str, 
     body: str, 
-    data: Optional[Dict] = None
+    data: Optional[Dict] = None,
+    notification_type: Optional[str] = None
 ) -> Optional[int]:
     """Queue a push notification for sending"""
     try:
@@ -323,7 +524,8 @@ def queue_push_notification(
             user_id=user_id,
             title=title,
             body=body,
-            data=data or {}
+            data=data or {},
+            priority=delivery_priority(notification_type)
         )
         db.session.add(push_notification)
         db.session.commit()
@@ -333,35 +535,10 @@ def queue_push_notification(
 
 
 def process_push_notification_queue(limit: int = 100) -> Dict:
-    """Process pending push notifications"""
-    pending_pushes = PushNotification.query.filter_by(status="pending").limit(limit).all()
-    
-    results = {"sent": 0, "failed": 0, "errors": []}
-    
-    for push in pending_pushes:
-        try:
-            # Here you would integrate with FCM, APNS, etc.
-            success = send_push_notification_mock(push)
-            
-            if success:
-                push.status = "sent"
-                push.sent_at = datetime.utcnow()
-                results["sent"] += 1
-            else:
-                push.attempts += 1
-                push.last_attempt = datetime.utcnow()
-                if push.attempts >= 3:
-                    push.status = "failed"
-                    results["failed"] += 1
-        except Exception as e:
-            push.attempts += 1
-            push.last_attempt = datetime.utcnow()
-            results["errors"].append(f"Push {push.id}: {str(e)}")
-            if push.attempts >= 3:
-                push.status = "failed"
-                results["failed"] += 1
-    
-    db.session.commit()
+    """Claim and send one batch of pending push notifications"""
+    from .delivery_worker import QueueWorker
+    results = QueueWorker("push").process_batch(limit)
+    results.pop("claimed")
     return results
 
 
@@ -372,6 +549,107 @@ def send_push_notification_mock(push: PushNotification) -> bool:
 
 
 # Bulk notification system for admins
+BULK_NOTIFICATION_CHUNK_SIZE = 500
+
+
+def fan_out_notification(
+    user_ids: Iterable[int],
+    type: str,
+    title: str,
+    message: str,
+    related_ids: Optional[Dict[str, int]] = None,
+    email_template: Optional[str] = None,
+    email_data: Optional[Dict] = None,
+    chunk_size: int = BULK_NOTIFICATION_CHUNK_SIZE,
+    commit: bool = True,
+) -> Dict:
+    """Batched ``create_notification_with_preferences`` for many recipients.
+
+    Each chunk of recipients costs one query for emails, one for preferences
+    and one multi-row INSERT per channel; everything is committed together at
+    the end. Recipients without a stored preference for ``type`` get its
+    default channels, as in the single-user path.
+    Queued emails and pushes get ``PRIORITY_LOW`` so a large announcement
+    does not hold up individual notifications.
+
+    With ``commit=False`` nothing is committed or published; the recipients
+    of in-app rows are returned under ``in_app_recipients`` so the caller can
+    publish them after its own commit.
+    """
+    related_ids = related_ids or {}
+    recipients = list(dict.fromkeys(user_ids))
+    results = {
+        "total_users": len(recipients),
+        "in_app_sent": 0,
+        "emails_queued": 0,
+        "push_queued": 0,
+        "errors": []
+    }
+    in_app_recipients = []
+
+    for start in range(0, len(recipients), chunk_size):
+        chunk = recipients[start:start + chunk_size]
+        emails = dict(
+            db.session.query(User.id, User.email).filter(User.id.in_(chunk)).all()
+        )
+        preferences = preference_resolver.resolve_many(chunk, type)
+
+        notification_rows, email_rows, push_rows = [], [], []
+        for user_id in chunk:
+            if user_id not in emails:
+                results["errors"].append(f"User {user_id}: User with id {user_id} not found")
+                continue
+            preference = preferences[user_id]
+            if preference.in_app_enabled:
+                notification_rows.append({
+                    "user_id": user_id,
+                    "type": type,
+                    "title": title,
+                    "message": message,
+                    "related_gig_id": related_ids.get("gig_id"),
+                    "related_application_id": related_ids.get("application_id"),
+                })
+            if preference.email_enabled and emails[user_id]:
+                email_rows.append({
+                    "user_id": user_id,
+                    "email_address": emails[user_id],
+                    "subject": title,
+                    "body": message,
+                    "template": email_template,
+                    "template_data": email_data or {},
+                    "priority": PRIORITY_LOW,
+                })
+            if preference.push_enabled:
+                push_rows.append({
+                    "user_id": user_id,
+                    "title": title,
+                    "body": message,
+                    "data": related_ids,
+                    "priority": PRIORITY_LOW,
+                })
+
+        for model, rows in (
+            (Notification, notification_rows),
+            (EmailQueue, email_rows),
+            (PushNotification, push_rows),
+        ):
+            if rows:
+                db.session.execute(insert(model), rows)
+        adjust_unread_counts([row["user_id"] for row in notification_rows], 1)
+        results["in_app_sent"] += len(notification_rows)
+        results["emails_queued"] += len(email_rows)
+        results["push_queued"] += len(push_rows)
+        in_app_recipients.extend(row["user_id"] for row in notification_rows)
+
+    if not commit:
+        results["in_app_recipients"] = in_app_recipients
+        return results
+    db.session.commit()
+    for user_id in in_app_recipients:
+        notification_hub.publish(user_id)
+    return results
+
+
 def send_bulk_notification(
     user_ids: List[int], 
     notification_type: str,
@@ -381,34 +659,13 @@ def send_bulk_notification(
     email_template: Optional[str] = None
 ) -> Dict:
     """Send bulk notifications to multiple users (admin only)"""
-    results = {
-        "total_users": len(user_ids),
-        "in_app_sent": 0,
-        "emails_queued": 0,
-        "push_queued": 0,
-        "errors": []
-    }
-    
-    for user_id in user_ids:
-        try:
-            notification_result = create_notification_with_preferences(
-                user_id=user_id,
-                type=notification_type,
-                title=title,
-                message=message,
-                email_template=email_template
-            )
-            
-            for created in notification_result["created"]:
-                if created["type"] == "in_app":
-                    results["in_app_sent"] += 1
-                elif created["type"] == "email":
-                    results["emails_queued"] += 1
-                elif created["type"] == "push":
-                    results["push_queued"] += 1
-                    
-        except Exception as e:
-            results["errors"].append(f"User {user_id}: {str(e)}")
+    results = fan_out_notification(
+        user_ids,
+        type=notification_type,
+        title=title,
+        message=message,
+        email_template=email_template
+    )
     
     # Log bulk notification in audit log
     from .admin_service import _log_action
@@ -420,7 +677,7 @@ def send_bulk_notification(
         {
             "notification_type": notification_type,
             "title": title,
-            "total_recipients": len(user_ids),
+            "total_recipients": results["total_users"],
             "results": results
         }
     )
@@ -429,9 +686,36 @@ def send_bulk_notification(
 
 
 # Real-time notification helpers
+def get_notification_state(user_id: int, unread_only: bool = False) -> Dict:
+    """Totals and newest entry of a user's notifications in a single query.
+
+    Any change to the notification list (a new row, a read flag, a deletion,
+    an update merged into an existing row) changes at least one of these
+    values, so they serve as a cheap validator. With ``unread_only`` only the
+    unread rows are aggregated, which the partial unread index covers.
+    """
+    query = db.session.query(
+        db.func.count(Notification.id),
+        db.func.sum(db.case((Notification.read.is_(False), 1), else_=0)),
+        db.func.max(Notification.id),
+        db.func.max(Notification.created_at),
+        db.func.sum(Notification.group_count),
+    ).filter(Notification.user_id == user_id)
+    if unread_only:
+        query = query.filter(Notification.read.is_(False))
+    total, unread, newest_id, newest_at, events = query.one()
+    return {
+        "total": total,
+        "unread": int(unread or 0),
+        "newest_id": newest_id,
+        "newest_at": newest_at,
+        "events": int(events or 0),
+    }
+
+
 def get_unread_notification_count(user_id: int) -> int:
-    """Get count of unread notifications for a user"""
-    return Notification.query.filter_by(user_id=user_id, read=False).count()
+    """Get count of unread notifications for a user from their maintained counter"""
+    return get_unread_count(user_id)
 
 
 def get_recent_notifications(user_id: int, limit: int = 10) -> List[Notification]:
@@ -442,9 +726,18 @@ def get_recent_notifications(user_id: int, limit: int = 10) -> List[Notification
 
 
 def get_notification_summary(user_id: int) -> Dict:
-    """Get notification summary for dashboard"""
-    total_notifications = Notification.query.filter_by(user_id=user_id).count()
-    unread_count = get_unread_notification_count(user_id)
+    """Get notification summary for dashboard
+
+    Counts cover the retention window only, so they never scan archived
+    history even before the retention job has moved it out.
+    """
+    total_notifications, unread_count = db.session.query(
+        db.func.count(Notification.id),
+        db.func.sum(db.case((Notification.read.is_(False), 1), else_=0)),
+    ).filter(
+        Notification.user_id == user_id,
+        Notification.created_at >= hot_cutoff(),
+    ).one()
     
     # Get notifications by type for the last 30 days
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
@@ -458,7 +751,7 @@ def get_notification_summary(user_id: int) -> Dict:
     
     return {
         "total_notifications": total_notifications,
-        "unread_count": unread_count,
+        "unread_count": int(unread_count or 0),
         "recent_by_type": dict(recent_by_type),
         "last_30_days": len(recent_by_type)
     }
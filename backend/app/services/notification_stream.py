@@ -0,0 +1,88 @@
+"""In-process fan-out hub for the notification event stream.
+
+Each open ``/api/notifications/stream`` connection subscribes for its user and
+blocks on a one-slot wake-up queue. ``create_notification`` publishes the
+recipient's id after committing, which wakes that user's streams; the stream
+then reads the new rows itself, so no ORM objects cross threads and resume,
+live delivery and catch-up all share one query. A gig update merged into an
+existing row keeps that row's id, so ``coalesce_notifications`` publishes it
+with the row's id in ``updated_ids``; the stream re-reads those rows and sends
+them as ``notification_updated`` events.
+
+Only the ``queue`` and ``threading`` primitives are used, so under a gevent
+worker (``gunicorn -k gevent``) an idle stream is a parked greenlet rather than
+a pinned OS thread. Notifications committed by another worker process do not
+wake local streams; they are picked up by the catch-up read that follows every
+heartbeat. Updates to existing rows only reach streams in the worker that
+made them; other clients see them in the notification list.
+"""
+import queue
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+
+
+class Subscription:
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self._signal: "queue.Queue[None]" = queue.Queue(maxsize=1)
+        self._lock = threading.Lock()
+        self._updated: Set[int] = set()
+
+    def notify(self, updated_ids: Iterable[int] = ()) -> None:
+        with self._lock:
+            self._updated.update(updated_ids)
+        # Wake-ups coalesce: a pending signal already means "read again"
+        try:
+            self._signal.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def wait(self, timeout: float) -> bool:
+        """Block until woken or ``timeout`` elapses; ``True`` when woken."""
+        try:
+            self._signal.get(timeout=timeout)
+            return True
+        except queue.Empty:
+            return False
+
+    def take_updated(self) -> List[int]:
+        """Ids of existing notifications changed since the last call."""
+        with self._lock:
+            updated, self._updated = self._updated, set()
+        return sorted(updated)
+
+
+class NotificationHub:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[int, Set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(user_id)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_id: int, updated_ids: Iterable[int] = ()) -> None:
+        updated_ids = list(updated_ids)
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            subscription.notify(updated_ids)
+
+    def connection_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+notification_hub = NotificationHub()
@@ -0,0 +1,177 @@
+"""Transactional outbox for the notification side effects of domain writes.
+
+Services call ``enqueue_event`` before committing a change, so the event row
+lands in the same transaction: it exists exactly when the gig or application
+does, and the request never waits on notification fan-out. The
+``OutboxDispatcher`` later claims pending events with the same lease scheme as
+the delivery queues and runs the handler for each event type, which creates
+in-app notifications and queues emails and pushes.
+
+Handlers never commit: they add their rows to the session (the notification
+helpers take ``commit=False``) and return the ids of users whose notification
+streams to wake. The dispatcher marks the event dispatched and commits once,
+so the side effects land atomically with the event, and only then publishes
+to the hub. Side effects that must succeed or fail independently get their
+own event type. If a handler fails, its work is rolled back and the event is
+retried with backoff; after ``NOTIFICATION_MAX_ATTEMPTS`` it is parked as
+``failed``.
+"""
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from flask import current_app
+
+from .. import db
+from ..models import Application, Gig, OutboxEvent, User
+from . import notification_service
+from .delivery_worker import BatchWorker, claim_rows, default_worker_id, retry_delay
+from .exceptions import ValidationError
+from .notification_stream import notification_hub
+
+logger = logging.getLogger("skillsync.outbox")
+
+HANDLERS: Dict[str, Callable[[Dict], Optional[Iterable[int]]]] = {}
+
+
+def handler(event_type: str):
+    def register(func):
+        HANDLERS[event_type] = func
+        return func
+    return register
+
+
+def enqueue_event(event_type: str, payload: Dict) -> OutboxEvent:
+    """Add an event to the current transaction; the caller commits it."""
+    if event_type not in HANDLERS:
+        raise ValidationError(f"Unknown outbox event '{event_type}'")
+    event = OutboxEvent(event_type=event_type, payload=payload)
+    db.session.add(event)
+    return event
+
+
+def _admin_ids() -> List[int]:
+    return [user_id for (user_id,) in db.session.query(User.id).filter(User.role == "admin")]
+
+
+@handler("gig_submitted")
+def _gig_submitted(payload: Dict) -> List[int]:
+    gig = Gig.query.get(payload["gig_id"])
+    if gig is None:
+        return []
+    return notification_service.fan_out_notification(
+        _admin_ids(),
+        type="gig_pending",
+        title="New gig pending approval",
+        message=f"A new gig '{gig.title}' has been posted and is awaiting approval.",
+        related_ids={"gig_id": gig.id},
+        commit=False,
+    )["in_app_recipients"]
+
+
+@handler("application_submitted")
+def _application_submitted(payload: Dict) -> List[int]:
+    application = Application.query.get(payload["application_id"])
+    if application is None:
+        return []
+    gig = application.gig
+    return notification_service.fan_out_notification(
+        _admin_ids(),
+        type="application_submitted",
+        title="New application submitted",
+        message=f"A new application was submitted for '{gig.title}'.",
+        related_ids={"gig_id": gig.id, "application_id": application.id},
+        commit=False,
+    )["in_app_recipients"]
+
+
+@handler("application_received")
+def _application_received(payload: Dict) -> List[int]:
+    application = Application.query.get(payload["application_id"])
+    if application is None:
+        return []
+    notification = notification_service.notify_application_received(
+        application.gig.provider_id, application.gig_id, application.id, commit=False
+    )
+    return [notification.user_id]
+
+
+class OutboxDispatcher(BatchWorker):
+    """Claims pending outbox events and runs their handlers one at a time."""
+
+    label = "the outbox"
+
+    def __init__(self, worker_id: Optional[str] = None, lease_seconds: Optional[int] = None):
+        config = current_app.config
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds or int(config.get("NOTIFICATION_WORKER_LEASE_SECONDS", 300))
+        self.max_attempts = int(config.get("NOTIFICATION_MAX_ATTEMPTS", 3))
+        self.retry_base = float(config.get("NOTIFICATION_RETRY_BASE_SECONDS", 60))
+        self.retry_max = float(config.get("NOTIFICATION_RETRY_MAX_SECONDS", 3600))
+
+    def claim_batch(self, limit: int) -> List[OutboxEvent]:
+        return claim_rows(
+            OutboxEvent,
+            self.worker_id,
+            limit,
+            self.lease_seconds,
+            filters=[
+                OutboxEvent.status == "pending",
+                OutboxEvent.available_at <= datetime.utcnow(),
+            ],
+            order_by=[OutboxEvent.id],
+        )
+
+    def _dispatch(self, event_id: int) -> Optional[str]:
+        """Run one event's handler; returns the error message if it failed."""
+        event = OutboxEvent.query.get(event_id)
+        func = HANDLERS.get(event.event_type)
+        if func is None:
+            error = f"No handler for '{event.event_type}'"
+            event.status = "failed"
+        else:
+            try:
+                woken = func(dict(event.payload or {})) or []
+                event.status = "dispatched"
+                event.dispatched_at = datetime.utcnow()
+                event.claimed_by = None
+                event.claimed_until = None
+                db.session.commit()
+            except Exception as exc:
+                db.session.rollback()
+                error = str(exc) or exc.__class__.__name__
+                event = OutboxEvent.query.get(event_id)
+                event.attempts = (event.attempts or 0) + 1
+                if event.attempts >= self.max_attempts:
+                    event.status = "failed"
+                else:
+                    event.available_at = datetime.utcnow() + retry_delay(
+                        event.attempts, self.retry_base, self.retry_max
+                    )
+            else:
+                for user_id in woken:
+                    notification_hub.publish(user_id)
+                return None
+        event.last_error = error
+        event.claimed_by = None
+        event.claimed_until = None
+        db.session.commit()
+        return error
+
+    def process_batch(self, limit: int = 50) -> Dict:
+        event_ids = [event.id for event in self.claim_batch(limit)]
+        results = {"claimed": len(event_ids), "dispatched": 0, "failed": 0, "errors": []}
+        for event_id in event_ids:
+            error = self._dispatch(event_id)
+            if error is None:
+                results["dispatched"] += 1
+                continue
+            logger.warning(f"Outbox event {event_id} failed: {error}")
+            results["errors"].append(f"Event {event_id}: {error}")
+            if OutboxEvent.query.get(event_id).status == "failed":
+                results["failed"] += 1
+        return results
+
+
+def dispatch_outbox(limit: int = 50) -> Dict:
+    return OutboxDispatcher().process_batch(limit)
@@ -0,0 +1,130 @@
+"""Keyset (cursor) pagination.
+
+``query.paginate()`` runs a ``COUNT(*)`` over the filtered set and uses
+``OFFSET``, so every page re-reads all the rows before it. Cursor mode seeks
+past the last row of the previous page using the active sort key plus the
+primary key as a tie breaker, and never counts. Cursors are opaque
+URL-safe strings; clients pass ``next_cursor`` back verbatim.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import and_, or_, tuple_
+
+from .exceptions import ValidationError
+
+
+class SortKey(NamedTuple):
+    """One component of a keyset ordering.
+
+    ``getter`` reads the key's value from a result row so the next cursor can
+    be built from the last item of a page; it must agree with ``expression``.
+    """
+
+    expression: Any
+    descending: bool
+    getter: Callable[[Any], Any]
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "n" in value:
+            return Decimal(value["n"])
+    return value
+
+
+def encode_cursor(sort_name: str, values: Sequence[Any]) -> str:
+    payload = json.dumps(
+        {"s": sort_name, "k": [_encode_value(value) for value in values]},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_name: str, key_count: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_decode_value(value) for value in payload["k"]]
+        cursor_sort = payload["s"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValidationError("Invalid pagination cursor")
+    if cursor_sort != sort_name or len(values) != key_count:
+        raise ValidationError("Pagination cursor does not match the requested sort order")
+    return values
+
+
+def _seek_condition(keys: Sequence[SortKey], values: Sequence[Any]):
+    if all(key.descending == keys[0].descending for key in keys):
+        # Uniform direction: a row-value comparison lets the database seek a
+        # composite index directly.
+        row = tuple_(*[key.expression for key in keys])
+        bound = tuple_(*values)
+        return row < bound if keys[0].descending else row > bound
+
+    clauses = []
+    for position, key in enumerate(keys):
+        equal_prefix = [
+            keys[i].expression == values[i] for i in range(position)
+        ]
+        step = (
+            key.expression < values[position]
+            if key.descending
+            else key.expression > values[position]
+        )
+        clauses.append(and_(*equal_prefix, step))
+    return or_(*clauses)
+
+
+def keyset_paginate(
+    query,
+    keys: Sequence[SortKey],
+    cursor: Optional[str],
+    per_page: int,
+    sort_name: str = "default",
+) -> dict:
+    """Return one page of ``query`` ordered by ``keys`` starting after ``cursor``.
+
+    An empty cursor requests the first page. The result carries ``next_cursor``
+    (None on the last page) instead of ``total``/``pages``.
+    """
+    if cursor:
+        values = decode_cursor(cursor, sort_name, len(keys))
+        query = query.filter(_seek_condition(keys, values))
+
+    query = query.order_by(
+        *[key.expression.desc() if key.descending else key.expression.asc() for key in keys]
+    )
+    rows = query.limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    items = rows[:per_page]
+
+    next_cursor = None
+    if has_more and items:
+        last = items[-1]
+        next_cursor = encode_cursor(sort_name, [key.getter(last) for key in keys])
+
+    return {
+        "items": items,
+        "per_page": per_page,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
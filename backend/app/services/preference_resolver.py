@@ -0,0 +1,111 @@
+"""Resolution of per-type notification channel settings.
+
+A user's stored preferences are loaded in one query and cached per user;
+types without a stored row fall back to
+``NotificationPreference.get_default_preferences()`` (every channel enabled
+for types not listed there) without writing anything. The preference
+services call ``invalidate`` after committing a change. With ``REDIS_URL`` set
+the cache is shared, so invalidation reaches every worker; otherwise other
+workers pick changes up when their entry expires.
+"""
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from flask import Flask, current_app
+
+from ..models.notification_preferences import NotificationPreference
+from ..utils.cache import TTLCache, create_shared_cache, register_cache
+
+
+class ChannelSettings(NamedTuple):
+    email_enabled: bool
+    push_enabled: bool
+    in_app_enabled: bool
+
+
+ALL_CHANNELS = ChannelSettings(True, True, True)
+
+DEFAULT_SETTINGS = {
+    pref["notification_type"]: ChannelSettings(
+        pref["email_enabled"], pref["push_enabled"], pref["in_app_enabled"]
+    )
+    for pref in NotificationPreference.get_default_preferences()
+}
+
+
+def default_settings(notification_type: str) -> ChannelSettings:
+    return DEFAULT_SETTINGS.get(notification_type, ALL_CHANNELS)
+
+
+def _settings(pref: NotificationPreference) -> ChannelSettings:
+    # Columns are nullable; unset flags mean the channel is on, as the column defaults do
+    return ChannelSettings(
+        pref.email_enabled is not False,
+        pref.push_enabled is not False,
+        pref.in_app_enabled is not False,
+    )
+
+
+class PreferenceResolver:
+    def __init__(self, app: Flask = None):
+        self.cache = TTLCache(max_entries=10000, default_ttl=300)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        app.config.setdefault("NOTIFICATION_PREFERENCE_CACHE_ENABLED", True)
+        app.config.setdefault("NOTIFICATION_PREFERENCE_CACHE_TTL", 300)
+        self.cache = create_shared_cache(
+            app,
+            prefix="skillsync:notification_preferences:",
+            max_entries=10000,
+            default_ttl=float(app.config["NOTIFICATION_PREFERENCE_CACHE_TTL"]),
+        )
+        register_cache("notification_preferences", self.cache)
+
+    def _enabled(self) -> bool:
+        return current_app.config.get("NOTIFICATION_PREFERENCE_CACHE_ENABLED", False)
+
+    def _stored(self, user_id: int) -> Dict[str, ChannelSettings]:
+        key = str(user_id)
+        if self._enabled():
+            cached = self.cache.get(key)
+            if cached is not None:
+                return {type_: ChannelSettings(*flags) for type_, flags in cached.items()}
+
+        stored = {
+            pref.notification_type: _settings(pref)
+            for pref in NotificationPreference.query.filter_by(user_id=user_id)
+        }
+        if self._enabled():
+            self.cache.set(key, {type_: list(flags) for type_, flags in stored.items()})
+        return stored
+
+    def resolve(self, user_id: int, notification_type: str) -> ChannelSettings:
+        stored = self._stored(user_id)
+        return stored.get(notification_type) or default_settings(notification_type)
+
+    def resolve_many(self, user_ids: Iterable[int], notification_type: str,
+                     chunk_size: int = 1000) -> Dict[int, ChannelSettings]:
+        """Settings for ``notification_type`` across many users, one query per chunk.
+
+        Used for fan-out, where one type is needed for each of many users, so
+        the per-user cache is bypassed.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        fallback = default_settings(notification_type)
+        resolved = {user_id: fallback for user_id in user_ids}
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            for pref in NotificationPreference.query.filter(
+                NotificationPreference.user_id.in_(chunk),
+                NotificationPreference.notification_type == notification_type,
+            ):
+                resolved[pref.user_id] = _settings(pref)
+        return resolved
+
+    def invalidate(self, user_id: Optional[int]) -> None:
+        if user_id is not None:
+            self.cache.delete(str(user_id))
+
+
+preference_resolver = PreferenceResolver()
@@ -5,7 +5,7 @@ from sqlalchemy import func, and_, desc, or_
 from .. import db
 from ..models import Application, Gig, Rating, User
 from .exceptions import AuthorizationError, NotFoundError, ValidationError
-from .gig_service import get_gig_by_id
+from .gig_service import adjust_gig_counters, get_gig_by_id, invalidate_gig_cache
 from .user_service import get_user_by_id, update_user_average_rating
 
 
@@ -83,11 +83,48 @@ def create_rating(
         comment=comment,
     )
     db.session.add(rating)
+    adjust_gig_counters(gig_id, rating_sum=score, ratings=1)
     db.session.commit()
     update_user_average_rating(ratee_id)
     return rating
 
 
+def edit_rating(
+    rating_id: int,
+    rater_id: int,
+    score: Optional[int] = None,
+    comment: Optional[str] = None,
+) -> Rating:
+    """Let a rater change their own rating within 24 hours of creating it."""
+    rating = Rating.query.get(rating_id)
+    if not rating:
+        raise ValidationError("Rating not found")
+
+    if rating.rater_id != rater_id:
+        raise ValidationError("You can only update your own ratings")
+
+    edit_deadline = rating.created_at + timedelta(hours=24)
+    if datetime.utcnow() > edit_deadline:
+        raise ValidationError("Rating can only be edited within 24 hours of creation")
+
+    if score is not None:
+        try:
+            Rating.validate_score(score)
+        except ValueError as exc:
+            raise ValidationError(str(exc))
+        old_score = rating.score
+        rating.score = score
+        adjust_gig_counters(rating.gig_id, rating_sum=score - old_score)
+
+    if comment is not None:
+        rating.comment = comment
+
+    db.session.commit()
+    update_user_average_rating(rating.ratee_id)
+    invalidate_gig_cache()
+    return rating
+
+
 def get_user_ratings(user_id: int) -> List[Rating]:
     get_user_by_id(user_id)
     return Rating.query.filter_by(ratee_id=user_id).order_by(Rating.created_at.desc()).all()
@@ -0,0 +1,175 @@
+"""Vectorized gig scoring for student recommendations.
+
+One query pulls a bounded candidate set of open, approved gigs the student
+has not applied to, each with its proficiency-weighted skill overlap (through
+``gig_skills``) and its provider's rating. The combined score is then computed
+for every candidate at once with NumPy, and the top ``k`` are picked with a
+partial sort:
+
+    score = skills * s + location * l + recency * r + rating * p - saturation * a
+
+where ``skills`` is the overlap relative to the best candidate, ``location``
+is 1 when the gig's location contains the student's, ``recency`` halves every
+``RECENCY_HALF_LIFE_DAYS``, ``rating`` is the provider's average out of 5
+(unrated providers count as neutral) and ``saturation`` grows towards 1 with
+the gig's application count.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from flask import current_app
+from sqlalchemy import and_, case, func
+
+from .. import db
+from ..models import Application, Gig, GigSkill, StudentSkill, User
+
+CANDIDATE_LIMIT = 300
+
+PROFICIENCY_WEIGHTS = {
+    "beginner": 1.0,
+    "intermediate": 1.5,
+    "advanced": 2.0,
+    "expert": 2.5,
+}
+# A skill named in the title counts this much more than one in the description
+TITLE_MATCH_BOOST = 1.5
+
+WEIGHTS = {
+    "skills": 0.45,
+    "location": 0.15,
+    "recency": 0.2,
+    "rating": 0.1,
+    "saturation": 0.1,
+}
+RECENCY_HALF_LIFE_DAYS = 14.0
+NEUTRAL_RATING = 0.5
+# Application count at which a gig counts as half saturated
+SATURATION_PIVOT = 10.0
+
+
+def _proficiency_weight():
+    return case(
+        *[(StudentSkill.proficiency_level == level, weight)
+          for level, weight in PROFICIENCY_WEIGHTS.items()],
+        else_=1.0,
+    )
+
+
+def fetch_candidates(student_id: int, limit: Optional[int] = None) -> List:
+    """Candidate rows ``(id, created_at, location, application_count, skill_score, rating)``.
+
+    Skill-matched gigs come first, then the most recent, so the bound keeps
+    every gig that can score on skills before filling up with fresh ones.
+    """
+    if limit is None:
+        limit = int(current_app.config.get("RECOMMENDATION_CANDIDATES", CANDIDATE_LIMIT))
+    skill_scores = (
+        db.session.query(
+            GigSkill.gig_id.label("gig_id"),
+            func.sum(
+                _proficiency_weight()
+                * case((GigSkill.in_title.is_(True), TITLE_MATCH_BOOST), else_=1.0)
+            ).label("score"),
+        )
+        .join(StudentSkill, StudentSkill.skill_id == GigSkill.skill_id)
+        .filter(StudentSkill.student_id == student_id)
+        .group_by(GigSkill.gig_id)
+        .subquery()
+    )
+    applied = db.session.query(Application.gig_id).filter(Application.student_id == student_id)
+    skill_score = func.coalesce(skill_scores.c.score, 0.0)
+    return (
+        db.session.query(
+            Gig.id,
+            Gig.created_at,
+            Gig.location,
+            Gig.application_count,
+            skill_score,
+            User.average_rating,
+        )
+        .join(User, User.id == Gig.provider_id)
+        .outerjoin(skill_scores, skill_scores.c.gig_id == Gig.id)
+        .filter(
+            and_(Gig.approval_status == "approved", Gig.status == "open"),
+            ~Gig.id.in_(applied),
+        )
+        .order_by(skill_score.desc(), Gig.created_at.desc(), Gig.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def score_candidates(rows: Sequence, student_location: Optional[str],
+                     now: Optional[datetime] = None) -> np.ndarray:
+    """Combined score of each candidate row, in row order."""
+    now = now or datetime.utcnow()
+    count = len(rows)
+    if not count:
+        return np.zeros(0)
+    _, created, locations, applications, skills, ratings = zip(*rows)
+
+    skills = np.asarray(skills, dtype=float)
+    best = skills.max()
+    skill_part = skills / best if best > 0 else skills
+
+    location_part = np.zeros(count)
+    if student_location:
+        gig_locations = np.char.lower(np.asarray([loc or "" for loc in locations], dtype=str))
+        location_part = (np.char.find(gig_locations, student_location.lower()) >= 0).astype(float)
+
+    age_days = np.asarray(
+        [(now - ts).total_seconds() / 86400 if ts else np.inf for ts in created], dtype=float
+    )
+    recency_part = np.power(0.5, np.clip(age_days, 0, None) / RECENCY_HALF_LIFE_DAYS)
+
+    ratings = np.asarray([float(r) if r is not None else 0.0 for r in ratings])
+    rating_part = np.where(ratings > 0, ratings / 5.0, NEUTRAL_RATING)
+
+    applications = np.asarray([a or 0 for a in applications], dtype=float)
+    saturation_part = applications / (applications + SATURATION_PIVOT)
+
+    return (
+        WEIGHTS["skills"] * skill_part
+        + WEIGHTS["location"] * location_part
+        + WEIGHTS["recency"] * recency_part
+        + WEIGHTS["rating"] * rating_part
+        - WEIGHTS["saturation"] * saturation_part
+    )
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest scores, best first, without a full sort."""
+    if k <= 0 or not len(scores):
+        return np.zeros(0, dtype=int)
+    if k < len(scores):
+        # Everything above the k-th best score, then the earliest of the
+        # entries tied with it, so boundary ties are not picked arbitrarily
+        kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+        above = np.flatnonzero(scores > kth)
+        tied = np.flatnonzero(scores == kth)[:k - len(above)]
+        picked = np.sort(np.concatenate([above, tied]))
+    else:
+        picked = np.arange(len(scores))
+    # picked is in index order and the sort is stable, so equal scores keep
+    # the order of ``scores`` (the candidate query's order)
+    return picked[np.argsort(-scores[picked], kind="stable")]
+
+
+def rank_candidates(student: User, limit: int) -> List[Tuple[int, float]]:
+    """``(gig_id, score)`` of the student's ``limit`` best candidates, best first."""
+    rows = fetch_candidates(student.id)
+    scores = score_candidates(rows, student.location)
+    return [(rows[index][0], float(scores[index])) for index in top_k(scores, limit)]
+
+
+def gigs_in_order(ids: Sequence[int]) -> List[Gig]:
+    """Load the gigs with ``ids`` in one query, keeping the order of ``ids``."""
+    if not ids:
+        return []
+    gigs: Dict[int, Gig] = {gig.id: gig for gig in Gig.query.filter(Gig.id.in_(ids))}
+    return [gigs[gig_id] for gig_id in ids if gig_id in gigs]
+
+
+def rank_gigs_for_student(student: User, limit: int) -> List[Gig]:
+    return gigs_in_order([gig_id for gig_id, _ in rank_candidates(student, limit)])
@@ -1,175 +1,62 @@
 from typing import List, Dict
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, func
 from .. import db
-from ..models import Gig, User, StudentSkill, Application, Skill
+from ..models import Gig, GigSkill, StudentSkill, Application
 from .exceptions import ValidationError
+from .recommendation_store import get_stored_recommendations, refresh_recommendations
+from .similarity_service import similar_gigs
+from .trending_service import trending_gigs
 from .user_service import get_user_by_id
 
 
+def _skill_matches(student_id: int):
+    """Subquery of (gig_id, matched) for gigs mentioning any of the student's skills."""
+    return (
+        db.session.query(
+            GigSkill.gig_id.label("gig_id"),
+            func.count(GigSkill.skill_id).label("matched"),
+        )
+        .join(StudentSkill, StudentSkill.skill_id == GigSkill.skill_id)
+        .filter(StudentSkill.student_id == student_id)
+        .group_by(GigSkill.gig_id)
+        .subquery()
+    )
+
+
 def get_recommended_gigs_for_student(student_id: int, limit: int = 10) -> List[Gig]:
-    """Get recommended gigs for a student based on their skills and activity"""
+    """Get recommended gigs for a student, best combined score first.
+
+    Served from the precomputed ``student_recommendations`` rows when they are
+    fresh; otherwise the student is ranked now (skill overlap, location,
+    recency, provider rating and application saturation, see
+    ``recommendation_scoring``) and the result stored.
+    """
     student = get_user_by_id(student_id)
     if not student.is_role("student"):
         raise ValidationError("Only students can get gig recommendations")
-    
-    # Get student's skills
-    student_skills = db.session.query(StudentSkill.skill_id).filter_by(
-        student_id=student_id
-    ).subquery()
-    
-    # Get skill names for text matching (explicit join to avoid string-based join targets)
-    # Select from StudentSkill then join Skill to avoid ambiguous join paths
-    skill_rows = db.session.query(Skill.name).select_from(StudentSkill).join(
-        Skill, StudentSkill.skill_id == Skill.id
-    ).filter(
-        StudentSkill.student_id == student_id
-    ).all()
-    # older SQLAlchemy versions return list of 1-tuples for single column queries
-    skill_names = [r[0] for r in skill_rows]
-    
-    # Start with base query for approved, open gigs
-    base_query = Gig.query.filter(
-        and_(
-            Gig.approval_status == "approved",
-            Gig.status == "open"
-        )
-    )
-    
-    # Exclude gigs the student has already applied to
-    applied_gig_ids = db.session.query(Application.gig_id).filter_by(
-        student_id=student_id
-    ).subquery()
-    
-    base_query = base_query.filter(
-        ~Gig.id.in_(applied_gig_ids)
-    )
-    
-    recommended_gigs = []
-    
-    # 1. Skills-based matching (highest priority)
-    if skill_names:
-        skill_patterns = [f"%{name}%" for name in skill_names]
-        skills_query = base_query.filter(
-            or_(
-                *[Gig.title.ilike(pattern) for pattern in skill_patterns],
-                *[Gig.description.ilike(pattern) for pattern in skill_patterns]
-            )
-        ).order_by(Gig.created_at.desc()).limit(limit // 2)
-        
-        recommended_gigs.extend(skills_query.all())
-    
-    # 2. Location-based matching
-    if student.location:
-        location_query = base_query.filter(
-            Gig.location.ilike(f"%{student.location}%")
-        ).filter(
-            ~Gig.id.in_([gig.id for gig in recommended_gigs])
-        ).order_by(Gig.created_at.desc()).limit(limit // 4)
-        
-        recommended_gigs.extend(location_query.all())
-    
-    # 3. Fill remaining slots with recent gigs
-    remaining_slots = limit - len(recommended_gigs)
-    if remaining_slots > 0:
-        recent_query = base_query.filter(
-            ~Gig.id.in_([gig.id for gig in recommended_gigs])
-        ).order_by(Gig.created_at.desc()).limit(remaining_slots)
-        
-        recommended_gigs.extend(recent_query.all())
-    
-    return recommended_gigs[:limit]
+
+    stored = get_stored_recommendations(student_id, limit)
+    if stored is not None:
+        return stored
+    return refresh_recommendations(student, limit)
 
 
 def get_similar_gigs(gig_id: int, limit: int = 5) -> List[Gig]:
-    """Get gigs similar to the given gig based on category and keywords"""
+    """Get the open gigs whose title, description and category overlap most
+    with the given gig's, using the cached ``similarity_service`` index."""
     from .gig_service import get_gig_by_id
-    
-    reference_gig = get_gig_by_id(gig_id)
-    
-    # Base query for approved, open gigs excluding the reference gig
-    query = Gig.query.filter(
-        and_(
-            Gig.approval_status == "approved",
-            Gig.status == "open",
-            Gig.id != gig_id
-        )
-    )
-    
-    similar_gigs = []
-    
-    # 1. Same category
-    if reference_gig.category:
-        category_query = query.filter(
-            Gig.category.ilike(f"%{reference_gig.category}%")
-        ).order_by(Gig.created_at.desc()).limit(limit // 2)
-        
-        similar_gigs.extend(category_query.all())
-    
-    # 2. Similar keywords in title/description
-    # Extract potential keywords from title (simple approach)
-    title_words = reference_gig.title.lower().split()
-    important_words = [word for word in title_words if len(word) > 3]
-    
-    if important_words:
-        keyword_patterns = [f"%{word}%" for word in important_words[:3]]  # Top 3 words
-        keyword_query = query.filter(
-            or_(
-                *[Gig.title.ilike(pattern) for pattern in keyword_patterns],
-                *[Gig.description.ilike(pattern) for pattern in keyword_patterns]
-            )
-        ).filter(
-            ~Gig.id.in_([gig.id for gig in similar_gigs])
-        ).order_by(Gig.created_at.desc()).limit(limit // 2)
-        
-        similar_gigs.extend(keyword_query.all())
-    
-    # 3. Same location
-    if reference_gig.location:
-        location_query = query.filter(
-            Gig.location.ilike(f"%{reference_gig.location}%")
-        ).filter(
-            ~Gig.id.in_([gig.id for gig in similar_gigs])
-        ).order_by(Gig.created_at.desc()).limit(limit // 4)
-        
-        similar_gigs.extend(location_query.all())
-    
-    # 4. Fill remaining with recent gigs
-    remaining_slots = limit - len(similar_gigs)
-    if remaining_slots > 0:
-        recent_query = query.filter(
-            ~Gig.id.in_([gig.id for gig in similar_gigs])
-        ).order_by(Gig.created_at.desc()).limit(remaining_slots)
-        
-        similar_gigs.extend(recent_query.all())
-    
-    return similar_gigs[:limit]
+
+    return similar_gigs(get_gig_by_id(gig_id), limit)
 
 
 def get_trending_gigs(limit: int = 10) -> List[Dict]:
-    """Get trending gigs based on application count and recency"""
-    # Get gigs with application counts
-    trending_query = db.session.query(
-        Gig,
-        func.count(Application.id).label('application_count')
-    ).outerjoin(Application).filter(
-        and_(
-            Gig.approval_status == "approved",
-            Gig.status == "open"
-        )
-    ).group_by(Gig.id).order_by(
-        func.count(Application.id).desc(),
-        Gig.created_at.desc()
-    ).limit(limit)
-    
+    """Get trending gigs by time-decayed applications, saves and views"""
     results = []
-    for gig, app_count in trending_query.all():
+    for gig, score in trending_gigs(limit):
         gig_dict = gig.to_dict()
-        gig_dict['application_count'] = app_count
-        gig_dict['trending_score'] = app_count * 2 + (
-            1 if gig.created_at and gig.created_at.date() >= db.func.current_date() - db.text("interval '7 days'") else 0
-        )
+        gig_dict['application_count'] = gig.application_count or 0
+        gig_dict['trending_score'] = round(score, 3)
         results.append(gig_dict)
-    
     return results
 
 
@@ -190,33 +77,20 @@ def get_student_recommendation_stats(student_id: int) -> Dict:
     # Count gigs already applied to
     applied_count = Application.query.filter_by(student_id=student_id).count()
     
-    # Count skills-based matches
-    # Query student's skill names for stats
-    student_skill_rows = db.session.query(Skill.name).select_from(StudentSkill).join(
-        Skill, StudentSkill.skill_id == Skill.id
-    ).filter(
-        StudentSkill.student_id == student_id
-    ).all()
-    student_skills = [r[0] for r in student_skill_rows]
-
-    skill_matches = 0
-    if student_skills:
-        skill_patterns = [f"%{name}%" for name in student_skills]
-        skill_matches = Gig.query.filter(
-            and_(
-                Gig.approval_status == "approved",
-                Gig.status == "open",
-                or_(
-                    *[Gig.title.ilike(pattern) for pattern in skill_patterns],
-                    *[Gig.description.ilike(pattern) for pattern in skill_patterns]
-                )
-            )
-        ).count()
+    # Count skills-based matches through the gig_skills index
+    skills_count = StudentSkill.query.filter_by(student_id=student_id).count()
+    matches = _skill_matches(student_id)
+    skill_matches = Gig.query.join(matches, matches.c.gig_id == Gig.id).filter(
+        and_(
+            Gig.approval_status == "approved",
+            Gig.status == "open",
+        )
+    ).count()
     
     return {
         "total_available_gigs": total_gigs,
         "applied_gigs": applied_count,
         "skill_based_matches": skill_matches,
         "recommendation_score": skill_matches / max(total_gigs, 1) * 100,
-        "skills_count": len(student_skills)
+        "skills_count": skills_count
     }
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""Precomputed student recommendations (``student_recommendations``).
+
+``materialize_recommendations`` (``backend/scripts/materialize_recommendations.py``)
+ranks the top ``RECOMMENDATION_STORED`` gigs of every student ahead of time.
+Students are split into id-ordered chunks handed to a process pool; each
+worker process has its own app and database connection and replaces a
+chunk's rows in one transaction.
+
+``get_stored_recommendations`` serves a student's list with one indexed read,
+dropping gigs that closed or that the student applied to since. Students
+without rows, or whose rows are older than ``RECOMMENDATION_MAX_AGE`` seconds,
+get ``None`` so the caller ranks them on demand and stores the result.
+Changing a student's skills deletes their rows.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from flask import current_app
+from sqlalchemy import and_, delete, insert
+from sqlalchemy.exc import IntegrityError
+
+from .. import db
+from ..models import Application, Gig, StudentRecommendation, User
+from .recommendation_scoring import gigs_in_order, rank_candidates
+
+MATERIALIZE_CHUNK_SIZE = 200
+
+_worker_app = None
+
+
+def stored_count() -> int:
+    return int(current_app.config.get("RECOMMENDATION_STORED", 20))
+
+
+def invalidate_recommendations(student_id: int) -> None:
+    """Drop the student's stored list; the caller commits."""
+    db.session.execute(
+        delete(StudentRecommendation).where(StudentRecommendation.student_id == student_id)
+    )
+
+
+def store_recommendations(student_id: int, ranked: Sequence[Tuple[int, float]],
+                          computed_at: Optional[datetime] = None) -> None:
+    """Replace the student's stored list with ``ranked``; the caller commits."""
+    computed_at = computed_at or datetime.utcnow()
+    invalidate_recommendations(student_id)
+    if ranked:
+        db.session.execute(insert(StudentRecommendation), [
+            {"student_id": student_id, "rank": rank, "gig_id": gig_id,
+             "score": score, "computed_at": computed_at}
+            for rank, (gig_id, score) in enumerate(ranked)
+        ])
+
+
+def get_stored_recommendations(student_id: int, limit: int) -> Optional[List[Gig]]:
+    """The student's fresh stored recommendations, or ``None`` when missing or stale."""
+    max_age = int(current_app.config.get("RECOMMENDATION_MAX_AGE", 21600))
+    applied = db.session.query(Application.gig_id).filter(Application.student_id == student_id)
+    rows = (
+        db.session.query(Gig, StudentRecommendation.computed_at)
+        .join(StudentRecommendation, StudentRecommendation.gig_id == Gig.id)
+        .filter(
+            StudentRecommendation.student_id == student_id,
+            and_(Gig.approval_status == "approved", Gig.status == "open"),
+            ~Gig.id.in_(applied),
+        )
+        .order_by(StudentRecommendation.rank)
+        .limit(limit)
+        .all()
+    )
+    if not rows or rows[0][1] < datetime.utcnow() - timedelta(seconds=max_age):
+        return None
+    return [gig for gig, _ in rows]
+
+
+def refresh_recommendations(student: User, limit: int) -> List[Gig]:
+    """Rank ``student`` now, store the list and return its first ``limit`` gigs."""
+    ranked = rank_candidates(student, max(limit, stored_count()))
+    store_recommendations(student.id, ranked)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # A concurrent request stored the same student's list first
+        db.session.rollback()
+    return gigs_in_order([gig_id for gig_id, _ in ranked[:limit]])
+
+
+def refresh_students(student_ids: Sequence[int]) -> int:
+    """Recompute and store the lists of ``student_ids`` in one transaction."""
+    count = stored_count()
+    computed_at = datetime.utcnow()
+    students = User.query.filter(User.id.in_(student_ids), User.role == "student").all()
+    for student in students:
+        store_recommendations(student.id, rank_candidates(student, count), computed_at)
+    db.session.commit()
+    return len(students)
+
+
+def _init_worker() -> None:
+    global _worker_app
+    from .. import create_app
+
+    _worker_app = create_app()
+
+
+def _refresh_chunk(student_ids: List[int]) -> int:
+    with _worker_app.app_context():
+        return refresh_students(student_ids)
+
+
+def _student_chunks(chunk_size: int) -> Iterator[List[int]]:
+    last_id = 0
+    while True:
+        ids = [
+            student_id for (student_id,) in
+            db.session.query(User.id)
+            .filter(User.role == "student", User.id > last_id)
+            .order_by(User.id)
+            .limit(chunk_size)
+        ]
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def materialize_recommendations(workers: int = 1,
+                                chunk_size: int = MATERIALIZE_CHUNK_SIZE) -> Dict[str, int]:
+    """Recompute every student's stored list.
+
+    With ``workers`` > 1 the chunks run in a process pool; otherwise they run
+    in the current app context.
+    """
+    chunks = list(_student_chunks(chunk_size))
+    if workers <= 1:
+        students = sum(refresh_students(ids) for ids in chunks)
+    else:
+        # Forked workers must not reuse the parent's pooled connections
+        db.engine.dispose()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            students = sum(pool.map(_refresh_chunk, chunks))
+    return {"students": students, "chunks": len(chunks)}
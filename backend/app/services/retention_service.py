@@ -0,0 +1,125 @@
+"""Retention for the notification tables.
+
+``notifications`` keeps the last ``NOTIFICATION_RETENTION_DAYS`` of history
+(the hot set the list, summary and stream queries read); older rows are moved
+to ``notifications_archive``. Delivered and dead-lettered ``email_queue`` and
+``push_notifications`` rows, and dispatched outbox events, are deleted once
+they are ``DELIVERY_RETENTION_DAYS`` old.
+
+Every step works in id-ordered batches with a commit per batch, so a run never
+holds long locks and can be interrupted and resumed. Run
+``backend/scripts/purge_notifications.py`` from cron.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from flask import current_app
+from sqlalchemy import delete, insert, literal, select
+
+from .. import db
+from ..models import Notification, NotificationArchive, OutboxEvent
+from ..models.notification_preferences import EmailQueue, PushNotification
+from .notification_counters import adjust_unread_counts
+
+RETENTION_BATCH_SIZE = 1000
+
+_ARCHIVED_COLUMNS = [
+    "id", "user_id", "type", "title", "message", "read", "related_gig_id",
+    "related_application_id", "created_at", "group_count", "digest_pending",
+]
+
+
+def hot_cutoff(days: Optional[int] = None) -> datetime:
+    """Oldest ``created_at`` still kept in ``notifications``."""
+    if days is None:
+        days = int(current_app.config.get("NOTIFICATION_RETENTION_DAYS", 90))
+    return datetime.utcnow() - timedelta(days=days)
+
+
+def _delivery_cutoff(days: Optional[int]) -> datetime:
+    if days is None:
+        days = int(current_app.config.get("DELIVERY_RETENTION_DAYS", 14))
+    return datetime.utcnow() - timedelta(days=days)
+
+
+def archive_notifications(days: Optional[int] = None,
+                          batch_size: int = RETENTION_BATCH_SIZE) -> int:
+    """Move notifications older than the hot window into the archive."""
+    cutoff = hot_cutoff(days)
+    moved = 0
+    while True:
+        batch = (
+            db.session.query(Notification.id, Notification.user_id, Notification.read)
+            .filter(
+                Notification.created_at < cutoff,
+                Notification.digest_pending.is_(False),
+            )
+            .order_by(Notification.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return moved
+        ids = [notification_id for notification_id, _, _ in batch]
+        columns = [getattr(Notification, name) for name in _ARCHIVED_COLUMNS]
+        db.session.execute(
+            insert(NotificationArchive).from_select(
+                _ARCHIVED_COLUMNS + ["archived_at"],
+                select(*columns, literal(datetime.utcnow())).where(Notification.id.in_(ids)),
+            )
+        )
+        db.session.execute(
+            delete(Notification)
+            .where(Notification.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        adjust_unread_counts([user_id for _, user_id, read in batch if not read], -1)
+        db.session.commit()
+        moved += len(ids)
+
+
+def _purge(model, criteria, batch_size: int) -> int:
+    deleted = 0
+    while True:
+        ids = [
+            row_id for (row_id,) in
+            db.session.query(model.id).filter(*criteria).order_by(model.id).limit(batch_size)
+        ]
+        if not ids:
+            return deleted
+        db.session.execute(
+            delete(model)
+            .where(model.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        deleted += len(ids)
+
+
+def purge_delivery_queues(days: Optional[int] = None,
+                          batch_size: int = RETENTION_BATCH_SIZE) -> Dict[str, int]:
+    """Delete settled queue rows and outbox events older than the retention window.
+
+    Pending rows are never touched, whatever their age.
+    """
+    cutoff = _delivery_cutoff(days)
+    results = {}
+    for name, model in (("email", EmailQueue), ("push", PushNotification)):
+        results[name] = _purge(
+            model,
+            [model.status.in_(("sent", "failed")), model.created_at < cutoff],
+            batch_size,
+        )
+    results["outbox"] = _purge(
+        OutboxEvent,
+        [OutboxEvent.status.in_(("dispatched", "failed")), OutboxEvent.created_at < cutoff],
+        batch_size,
+    )
+    return results
+
+
+def run_retention(batch_size: int = RETENTION_BATCH_SIZE) -> Dict:
+    return {
+        "notifications_archived": archive_notifications(batch_size=batch_size),
+        "purged": purge_delivery_queues(batch_size=batch_size),
+    }
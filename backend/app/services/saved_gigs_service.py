@@ -1,7 +1,10 @@
+from sqlalchemy.orm import selectinload
+
 from .. import db
 from ..models import SavedGig
 from .exceptions import NotFoundError, ValidationError
 from .gig_service import get_gig_by_id
+from .trending_service import record_activity
 from .user_service import get_user_by_id
 
 
@@ -12,6 +15,7 @@ def save_gig(user_id: int, gig_id: int) -> SavedGig:
         raise ValidationError("Gig already saved")
     saved = SavedGig(user_id=user_id, gig_id=gig_id)
     db.session.add(saved)
+    record_activity(gig_id, saves=1)
     db.session.commit()
     return saved
 
@@ -26,7 +30,12 @@ def unsave_gig(user_id: int, gig_id: int) -> None:
 
 def get_saved_gigs(user_id: int):
     get_user_by_id(user_id)
-    return SavedGig.query.filter_by(user_id=user_id).order_by(SavedGig.saved_at.desc()).all()
+    return (
+        SavedGig.query.options(selectinload(SavedGig.gig))
+        .filter_by(user_id=user_id)
+        .order_by(SavedGig.saved_at.desc())
+        .all()
+    )
 
 
 def is_gig_saved(user_id: int, gig_id: int) -> bool:
@@ -0,0 +1,207 @@
+"""Full-text search over gigs.
+
+PostgreSQL deployments match against the weighted ``GIG_SEARCH_VECTOR``
+expression, which is served by the ``idx_gigs_search_vector`` GIN index and
+ranked with ``ts_rank_cd``. Other dialects (SQLite in local and test setups)
+fall back to an in-process inverted index that is built lazily from the gigs
+table and kept current by the gig service.
+"""
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, false
+
+from .. import db
+from ..models import Gig
+from ..models.gig import GIG_SEARCH_VECTOR, SEARCH_CONFIG
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+        "is", "it", "of", "on", "or", "the", "to", "with",
+    }
+)
+# Mirrors PostgreSQL's default ts_rank weights for the A/B/C labels used in
+# search_document().
+FIELD_WEIGHTS = (("title", 1.0), ("description", 0.4), ("category", 0.2))
+MAX_QUERY_TERMS = 8
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case alphanumeric tokens with stop words and single characters removed."""
+    if not text:
+        return []
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+def uses_database_search() -> bool:
+    return db.engine.dialect.name == "postgresql"
+
+
+class InvertedIndex:
+    """Token -> {gig_id: weighted term frequency} postings with prefix lookup."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._documents: Dict[int, Tuple[str, ...]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, doc_id: int, fields: Dict[str, Optional[str]]) -> None:
+        weights: Dict[str, float] = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(fields.get(field)):
+                weights[token] += weight
+        with self._lock:
+            self._discard(doc_id)
+            for token, weight in weights.items():
+                if token not in self._postings:
+                    self._vocabulary_dirty = True
+                self._postings[token][doc_id] = weight
+            self._documents[doc_id] = tuple(weights)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._discard(doc_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._documents.clear()
+            self._vocabulary = []
+            self._vocabulary_dirty = False
+            self.loaded = False
+
+    def _discard(self, doc_id: int) -> None:
+        for token in self._documents.pop(doc_id, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[token]
+                self._vocabulary_dirty = True
+
+    def _expand(self, prefix: str) -> List[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect_left(self._vocabulary, prefix)
+        matches = []
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            matches.append(token)
+        return matches
+
+    def search(self, query: str) -> Dict[int, float]:
+        """Return {doc_id: score} for documents matching every query term.
+
+        Each term matches as a prefix so partially typed words still hit, and
+        scores are TF-IDF style sums so rarer terms count for more.
+        """
+        terms = tokenize(query)[:MAX_QUERY_TERMS]
+        if not terms:
+            return {}
+        with self._lock:
+            total = max(len(self._documents), 1)
+            scores: Optional[Dict[int, float]] = None
+            for term in terms:
+                term_scores: Dict[int, float] = defaultdict(float)
+                for token in self._expand(term):
+                    postings = self._postings[token]
+                    idf = math.log(1 + total / len(postings))
+                    for doc_id, weight in postings.items():
+                        term_scores[doc_id] += weight * idf
+                if scores is None:
+                    scores = dict(term_scores)
+                else:
+                    scores = {
+                        doc_id: score + term_scores[doc_id]
+                        for doc_id, score in scores.items()
+                        if doc_id in term_scores
+                    }
+                if not scores:
+                    return {}
+            return scores or {}
+
+
+_fallback_index = InvertedIndex()
+
+
+def _gig_fields(gig: Gig) -> Dict[str, Optional[str]]:
+    return {
+        "title": gig.title,
+        "description": gig.description,
+        "category": gig.category,
+    }
+
+
+def _ensure_fallback_index() -> InvertedIndex:
+    if not _fallback_index.loaded:
+        rows = db.session.query(
+            Gig.id, Gig.title, Gig.description, Gig.category
+        ).all()
+        for gig_id, title, description, category in rows:
+            _fallback_index.add(
+                gig_id,
+                {"title": title, "description": description, "category": category},
+            )
+        _fallback_index.loaded = True
+    return _fallback_index
+
+
+def index_gig(gig: Gig) -> None:
+    """Refresh a gig's entry in the fallback index (no-op on PostgreSQL)."""
+    if uses_database_search() or not _fallback_index.loaded:
+        return
+    _fallback_index.add(gig.id, _gig_fields(gig))
+
+
+def remove_gig(gig_id: int) -> None:
+    if uses_database_search() or not _fallback_index.loaded:
+        return
+    _fallback_index.remove(gig_id)
+
+
+def _to_tsquery_text(terms: Iterable[str]) -> str:
+    # Tokens are strictly [a-z0-9]+ so they are safe to splice into tsquery syntax.
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def apply_gig_search(query, search: str):
+    """Restrict ``query`` to gigs matching ``search``.
+
+    Returns ``(query, relevance)`` where ``relevance`` is a SQL expression
+    suitable for ``order_by`` (higher is better). ``relevance`` is None when
+    there is nothing to rank: either the search text has no indexable terms
+    (the query is left unfiltered) or nothing can match.
+    """
+    terms = tokenize(search)[:MAX_QUERY_TERMS]
+    if not terms:
+        return query, None
+
+    if uses_database_search():
+        ts_query = db.func.to_tsquery(SEARCH_CONFIG, _to_tsquery_text(terms))
+        query = query.filter(GIG_SEARCH_VECTOR.op("@@")(ts_query))
+        return query, db.func.ts_rank_cd(GIG_SEARCH_VECTOR, ts_query)
+
+    scores = _ensure_fallback_index().search(" ".join(terms))
+    if not scores:
+        return query.filter(false()), None
+    relevance = case(scores, value=Gig.id, else_=0.0)
+    return query.filter(Gig.id.in_(list(scores))), relevance
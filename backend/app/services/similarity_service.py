@@ -0,0 +1,235 @@
+"""Similar-gig index: MinHash signatures bucketed with LSH.
+
+Each approved, open gig is reduced to the token set of its title, description
+and category (``search_service.tokenize``). ``SIGNATURE_BANDS`` bands of
+``ROWS_PER_BAND`` MinHash values are each hashed to a bucket and stored in
+``gig_similarity_bands``; two gigs land in a common bucket with probability
+``1 - (1 - J**ROWS_PER_BAND) ** SIGNATURE_BANDS`` for token-set Jaccard
+similarity ``J`` (about 0.5 at J = 0.2, 0.99 at J = 0.5).
+
+A gig's neighbors are the gigs sharing the most buckets with it, re-ranked by
+exact Jaccard similarity and cached in ``gig_neighbors``. Signatures depend
+only on the gig itself, so indexing is incremental: the gig and admin
+services re-sign a gig when it is approved, closed or its text changes, and
+drop the cached lists that change can affect (the gig's own, the lists that
+include it and the lists of gigs sharing a bucket with it); ``mark_expired_gigs``
+unindexes the gigs it closes the same way.
+
+``rebuild_similarity_index`` (``backend/scripts/rebuild_gig_similarity.py``)
+recreates the index, e.g. after loading data with SQL.
+"""
+import random
+import struct
+import zlib
+from typing import FrozenSet, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, delete, func, insert, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
+
+from .. import db
+from ..models import Gig, GigNeighbor, GigSimilarityBand
+from .search_service import tokenize
+
+SIGNATURE_BANDS = 16
+ROWS_PER_BAND = 2
+NEIGHBOR_COUNT = 10
+# Bucket-sharing gigs re-ranked exactly per lookup
+CANDIDATE_LIMIT = 50
+REBUILD_BATCH_SIZE = 500
+
+_PRIME = (1 << 31) - 1
+_random = random.Random(20240611)
+# Fixed universal hash functions h(x) = (a * x + b) mod p, so signatures are
+# stable across processes and deploys
+_HASHES = [
+    (_random.randrange(1, _PRIME), _random.randrange(0, _PRIME))
+    for _ in range(SIGNATURE_BANDS * ROWS_PER_BAND)
+]
+
+
+def gig_tokens(title: Optional[str], description: Optional[str],
+               category: Optional[str]) -> FrozenSet[str]:
+    return frozenset(tokenize(title) + tokenize(description) + tokenize(category))
+
+
+def minhash_signature(tokens: FrozenSet[str]) -> List[int]:
+    values = [zlib.crc32(token.encode()) for token in tokens]
+    return [min((a * value + b) % _PRIME for value in values) for a, b in _HASHES]
+
+
+def band_buckets(tokens: FrozenSet[str]) -> List[int]:
+    """One bucket per band; empty for a gig without tokens."""
+    if not tokens:
+        return []
+    signature = minhash_signature(tokens)
+    return [
+        zlib.crc32(struct.pack(f">{ROWS_PER_BAND}I", *signature[start:start + ROWS_PER_BAND]))
+        & 0x7FFFFFFF
+        for start in range(0, len(signature), ROWS_PER_BAND)
+    ]
+
+
+def jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    union = len(left | right)
+    return len(left & right) / union if union else 0.0
+
+
+def _indexable(gig: Gig) -> bool:
+    return gig.approval_status == "approved" and gig.status == "open"
+
+
+def _tokens_of(gig: Gig) -> FrozenSet[str]:
+    return gig_tokens(gig.title, gig.description, gig.category)
+
+
+def _bucket_filter(buckets: List[int]):
+    return or_(*[
+        and_(GigSimilarityBand.band == band, GigSimilarityBand.bucket == bucket)
+        for band, bucket in enumerate(buckets)
+    ])
+
+
+def _gigs_sharing_buckets(gig_id: int) -> Set[int]:
+    mine = aliased(GigSimilarityBand)
+    return {
+        other_id for (other_id,) in
+        db.session.query(GigSimilarityBand.gig_id)
+        .join(mine, and_(mine.band == GigSimilarityBand.band, mine.bucket == GigSimilarityBand.bucket))
+        .filter(mine.gig_id == gig_id, GigSimilarityBand.gig_id != gig_id)
+        .distinct()
+    }
+
+
+def remove_gig_similarity(gig_id: int) -> Set[int]:
+    """Unindex a gig and drop the cached lists it affects; the caller commits.
+
+    Returns the ids whose lists were dropped.
+    """
+    affected = {gig_id} | _gigs_sharing_buckets(gig_id) | {
+        owner_id for (owner_id,) in
+        db.session.query(GigNeighbor.gig_id).filter(GigNeighbor.neighbor_id == gig_id).distinct()
+    }
+    db.session.execute(delete(GigSimilarityBand).where(GigSimilarityBand.gig_id == gig_id))
+    db.session.execute(
+        delete(GigNeighbor)
+        .where(GigNeighbor.gig_id.in_(affected))
+        .execution_options(synchronize_session=False)
+    )
+    return affected
+
+
+def index_gig_similarity(gig: Gig) -> None:
+    """Re-sign ``gig`` (which must be flushed) after an approval, status or text change.
+
+    Gigs that are not approved and open are only removed. The caller commits.
+    """
+    affected = remove_gig_similarity(gig.id)
+    if not _indexable(gig):
+        return
+    buckets = band_buckets(_tokens_of(gig))
+    if not buckets:
+        return
+    db.session.execute(insert(GigSimilarityBand), [
+        {"gig_id": gig.id, "band": band, "bucket": bucket}
+        for band, bucket in enumerate(buckets)
+    ])
+    newly_affected = _gigs_sharing_buckets(gig.id) - affected
+    if newly_affected:
+        db.session.execute(
+            delete(GigNeighbor)
+            .where(GigNeighbor.gig_id.in_(newly_affected))
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _open_gigs():
+    return Gig.query.filter(Gig.approval_status == "approved", Gig.status == "open")
+
+
+def _cached_neighbors(gig_id: int, limit: int) -> List[Gig]:
+    return (
+        _open_gigs()
+        .join(GigNeighbor, GigNeighbor.neighbor_id == Gig.id)
+        .filter(GigNeighbor.gig_id == gig_id)
+        .order_by(GigNeighbor.rank)
+        .limit(limit)
+        .all()
+    )
+
+
+def _compute_neighbors(reference: Gig) -> List[Tuple[float, Gig]]:
+    tokens = _tokens_of(reference)
+    buckets = band_buckets(tokens)
+    if not buckets:
+        return []
+    shared = func.count(GigSimilarityBand.band)
+    candidate_ids = [
+        gig_id for gig_id, _ in
+        db.session.query(GigSimilarityBand.gig_id, shared)
+        .filter(_bucket_filter(buckets), GigSimilarityBand.gig_id != reference.id)
+        .group_by(GigSimilarityBand.gig_id)
+        .order_by(shared.desc(), GigSimilarityBand.gig_id.desc())
+        .limit(CANDIDATE_LIMIT)
+    ]
+    if not candidate_ids:
+        return []
+    scored = [
+        (jaccard(tokens, _tokens_of(gig)), gig)
+        for gig in _open_gigs().filter(Gig.id.in_(candidate_ids))
+    ]
+    scored.sort(key=lambda item: (item[0], item[1].id), reverse=True)
+    return [(score, gig) for score, gig in scored[:NEIGHBOR_COUNT] if score > 0]
+
+
+def similar_gigs(reference: Gig, limit: int) -> List[Gig]:
+    """The gigs most similar to ``reference``, most similar first.
+
+    Served from ``gig_neighbors`` when cached; otherwise computed and, for an
+    indexed gig, cached.
+    """
+    cached = _cached_neighbors(reference.id, limit)
+    if cached:
+        return cached
+    neighbors = _compute_neighbors(reference)
+    if neighbors and _indexable(reference):
+        # Rows whose neighbors have all closed since are replaced, not kept
+        db.session.execute(delete(GigNeighbor).where(GigNeighbor.gig_id == reference.id))
+        db.session.execute(insert(GigNeighbor), [
+            {"gig_id": reference.id, "rank": rank, "neighbor_id": gig.id, "score": score}
+            for rank, (score, gig) in enumerate(neighbors)
+        ])
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # A concurrent request cached the same list first
+            db.session.rollback()
+    return [gig for _, gig in neighbors[:limit]]
+
+
+def rebuild_similarity_index(batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """Re-sign every approved, open gig and drop all cached lists; commits per batch."""
+    db.session.execute(delete(GigNeighbor))
+    db.session.execute(delete(GigSimilarityBand))
+    db.session.commit()
+    total, last_id = 0, 0
+    while True:
+        gigs = (
+            db.session.query(Gig.id, Gig.title, Gig.description, Gig.category)
+            .filter(Gig.approval_status == "approved", Gig.status == "open", Gig.id > last_id)
+            .order_by(Gig.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not gigs:
+            return total
+        rows = [
+            {"gig_id": gig_id, "band": band, "bucket": bucket}
+            for gig_id, title, description, category in gigs
+            for band, bucket in enumerate(band_buckets(gig_tokens(title, description, category)))
+        ]
+        if rows:
+            db.session.execute(insert(GigSimilarityBand), rows)
+        db.session.commit()
+        total += len(gigs)
+        last_id = gigs[-1][0]
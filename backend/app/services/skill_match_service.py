@@ -0,0 +1,102 @@
+"""Skill-to-gig match index (``gig_skills``).
+
+A gig matches a skill when every token of the skill name, as produced by
+``search_service.tokenize``, appears in the gig's title or description. Rows
+are written in the same transaction as the change that affects them: the gig
+service reindexes a gig when it is created or its title or description
+changes, and the skill service indexes a new skill against existing gigs.
+Recommendations then join ``gig_skills`` on the student's skill ids instead of
+pattern-matching every gig's text per request.
+
+``rebuild_gig_skill_index`` (``backend/scripts/rebuild_gig_skills.py``)
+recreates the whole index, e.g. after loading data with SQL.
+"""
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, or_
+
+from .. import db
+from ..models import Gig, GigSkill, Skill
+from .search_service import tokenize
+
+REBUILD_BATCH_SIZE = 500
+
+
+def skill_tokens(name: Optional[str]) -> FrozenSet[str]:
+    return frozenset(tokenize(name))
+
+
+def _gig_tokens(title: Optional[str], description: Optional[str]) -> Tuple[set, set]:
+    title_tokens = set(tokenize(title))
+    return title_tokens, title_tokens | set(tokenize(description))
+
+
+def _match_rows(gig_id: int, title: Optional[str], description: Optional[str],
+                skills: Iterable[Tuple[int, FrozenSet[str]]]) -> List[Dict]:
+    title_tokens, all_tokens = _gig_tokens(title, description)
+    return [
+        {"gig_id": gig_id, "skill_id": skill_id, "in_title": tokens <= title_tokens}
+        for skill_id, tokens in skills
+        if tokens and tokens <= all_tokens
+    ]
+
+
+def _all_skill_tokens() -> List[Tuple[int, FrozenSet[str]]]:
+    return [(skill_id, skill_tokens(name)) for skill_id, name in db.session.query(Skill.id, Skill.name)]
+
+
+def index_gig_skills(gig: Gig) -> int:
+    """Replace the match rows of ``gig`` (which must be flushed); the caller commits."""
+    db.session.execute(delete(GigSkill).where(GigSkill.gig_id == gig.id))
+    rows = _match_rows(gig.id, gig.title, gig.description, _all_skill_tokens())
+    if rows:
+        db.session.execute(insert(GigSkill), rows)
+    return len(rows)
+
+
+def index_skill(skill: Skill) -> int:
+    """Match a new or renamed ``skill`` (which must be flushed) against every gig.
+
+    Only gigs containing the skill's longest token are tokenized, so the cost
+    follows the number of plausible matches. The caller commits.
+    """
+    db.session.execute(delete(GigSkill).where(GigSkill.skill_id == skill.id))
+    tokens = skill_tokens(skill.name)
+    if not tokens:
+        return 0
+    anchor = f"%{max(tokens, key=len)}%"
+    candidates = db.session.query(Gig.id, Gig.title, Gig.description).filter(
+        or_(Gig.title.ilike(anchor), Gig.description.ilike(anchor))
+    )
+    rows = []
+    for gig_id, title, description in candidates:
+        rows.extend(_match_rows(gig_id, title, description, [(skill.id, tokens)]))
+    if rows:
+        db.session.execute(insert(GigSkill), rows)
+    return len(rows)
+
+
+def rebuild_gig_skill_index(batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """Recompute ``gig_skills`` for every gig; commits per batch of gigs."""
+    skills = _all_skill_tokens()
+    db.session.execute(delete(GigSkill))
+    db.session.commit()
+    total, last_id = 0, 0
+    while True:
+        gigs = (
+            db.session.query(Gig.id, Gig.title, Gig.description)
+            .filter(Gig.id > last_id)
+            .order_by(Gig.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not gigs:
+            return total
+        rows = []
+        for gig_id, title, description in gigs:
+            rows.extend(_match_rows(gig_id, title, description, skills))
+        if rows:
+            db.session.execute(insert(GigSkill), rows)
+        db.session.commit()
+        total += len(rows)
+        last_id = gigs[-1][0]
@@ -2,6 +2,8 @@ from typing import Dict, List, Optional
 from .. import db
 from ..models import Skill, StudentSkill, User
 from .exceptions import NotFoundError, ValidationError
+from .recommendation_store import invalidate_recommendations
+from .skill_match_service import index_skill
 from .user_service import get_user_by_id
 
 
@@ -13,6 +15,8 @@ def create_skill(name: str, category: Optional[str] = None) -> Skill:
     
     skill = Skill(name=name.lower(), category=category)
     db.session.add(skill)
+    db.session.flush()
+    index_skill(skill)
     db.session.commit()
     return skill
 
@@ -58,6 +62,7 @@ def add_student_skill(student_id: int, skill_name: str, proficiency_level: str =
     )
     
     db.session.add(student_skill)
+    invalidate_recommendations(student_id)
     db.session.commit()
     return student_skill
 
@@ -81,6 +86,7 @@ def update_student_skill(student_id: int, skill_name: str, proficiency_level: st
         raise NotFoundError(f"Student does not have skill '{skill_name}'")
     
     student_skill.proficiency_level = proficiency_level
+    invalidate_recommendations(student_id)
     db.session.commit()
     return student_skill
 
@@ -99,6 +105,7 @@ def remove_student_skill(student_id: int, skill_name: str) -> None:
         raise NotFoundError(f"Student does not have skill '{skill_name}'")
     
     db.session.delete(student_skill)
+    invalidate_recommendations(student_id)
     db.session.commit()
 
 
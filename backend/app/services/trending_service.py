@@ -0,0 +1,241 @@
+"""Trending gigs from time-decayed activity.
+
+Applications and saves add to the gig's hourly row in ``gig_activity_buckets``
+in the same transaction as the write; gig detail views are counted per
+process in ``view_buffer`` and written in batches every
+``TRENDING_VIEW_FLUSH_SECONDS``. Buckets are incremented in the database, so
+concurrent writers cannot lose counts.
+
+``refresh_trending`` (``backend/scripts/refresh_trending.py``) scores every
+open gig active within ``TRENDING_WINDOW_HOURS``:
+
+    score = sum over buckets of (3 * applications + 2 * saves + 0.1 * views)
+            * 0.5 ** (bucket age in hours / TRENDING_HALF_LIFE_HOURS)
+
+stores the top ``TRENDING_SIZE`` in ``trending_gigs``, records the time in
+``trending_refreshes`` and prunes buckets that left the window.
+``/api/gigs/trending`` reads that list; it is refreshed inline when the last
+refresh is older than ``TRENDING_MAX_AGE`` seconds, in case the job is not
+scheduled. The refresh time is kept apart from the list so a quiet period's
+empty list is not recomputed on every request.
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from flask import current_app
+from sqlalchemy import and_, delete, insert, update
+from sqlalchemy.exc import IntegrityError
+
+from .. import db
+from ..models import Gig, GigActivityBucket, TrendingGig, TrendingRefresh
+from .recommendation_scoring import top_k
+
+logger = logging.getLogger("skillsync.trending")
+
+TRENDING_SIZE = 20
+ACTIVITY_WEIGHTS = {"applications": 3.0, "saves": 2.0, "views": 0.1}
+
+
+def bucket_start(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def record_activity(gig_id: int, applications: int = 0, saves: int = 0, views: int = 0,
+                    at: Optional[datetime] = None) -> None:
+    """Add to the gig's bucket for the hour of ``at`` (default now); the caller commits."""
+    start = bucket_start(at or datetime.utcnow())
+    increments = {"applications": applications, "saves": saves, "views": views}
+    if not any(increments.values()):
+        return
+    increment = (
+        update(GigActivityBucket)
+        .where(GigActivityBucket.gig_id == gig_id, GigActivityBucket.bucket_start == start)
+        .values({
+            getattr(GigActivityBucket, name): getattr(GigActivityBucket, name) + amount
+            for name, amount in increments.items() if amount
+        })
+        .execution_options(synchronize_session=False)
+    )
+    if db.session.execute(increment).rowcount:
+        return
+    try:
+        with db.session.begin_nested():
+            db.session.execute(
+                insert(GigActivityBucket).values(gig_id=gig_id, bucket_start=start, **increments)
+            )
+    except IntegrityError:
+        # A concurrent writer created this hour's bucket first
+        db.session.execute(increment)
+
+
+class ViewBuffer:
+    """Per-process gig view counts, written to the buckets in batches."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._last_flush = clock()
+
+    def record(self, gig_id: int) -> None:
+        interval = float(current_app.config.get("TRENDING_VIEW_FLUSH_SECONDS", 60))
+        with self._lock:
+            self._counts[gig_id] += 1
+            if self._clock() - self._last_flush < interval:
+                return
+            counts = self._take()
+        self._write(counts)
+
+    def counts_views(self, view):
+        """Count successful responses of a gig view routed with ``<int:gig_id>``.
+
+        Apply outside ``response_cache.cached`` so cache hits are counted too.
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code in (200, 304):
+                self.record(kwargs["gig_id"])
+            return response
+
+        return wrapper
+
+    def flush(self) -> int:
+        with self._lock:
+            counts = self._take()
+        return self._write(counts)
+
+    def _take(self) -> Counter:
+        counts, self._counts = self._counts, Counter()
+        self._last_flush = self._clock()
+        return counts
+
+    def _write(self, counts: Counter) -> int:
+        if not counts:
+            return 0
+        try:
+            # Gigs deleted since they were viewed are skipped
+            existing = [
+                gig_id for (gig_id,) in db.session.query(Gig.id).filter(Gig.id.in_(list(counts)))
+            ]
+            for gig_id in existing:
+                record_activity(gig_id, views=counts[gig_id])
+            db.session.commit()
+            return len(existing)
+        except Exception:
+            # Views are best effort; never fail the request that flushed them
+            db.session.rollback()
+            logger.exception("Failed to write %d buffered gig views", len(counts))
+            return 0
+
+
+view_buffer = ViewBuffer()
+
+
+def _open_gigs():
+    return Gig.query.filter(and_(Gig.approval_status == "approved", Gig.status == "open"))
+
+
+def compute_trending(limit: int = TRENDING_SIZE,
+                     now: Optional[datetime] = None) -> List[Tuple[int, float]]:
+    """``(gig_id, score)`` of the ``limit`` highest decayed scores, best first."""
+    now = now or datetime.utcnow()
+    half_life = float(current_app.config.get("TRENDING_HALF_LIFE_HOURS", 24))
+    window = int(current_app.config.get("TRENDING_WINDOW_HOURS", 72))
+    rows = (
+        db.session.query(
+            GigActivityBucket.gig_id,
+            GigActivityBucket.bucket_start,
+            GigActivityBucket.applications,
+            GigActivityBucket.saves,
+            GigActivityBucket.views,
+        )
+        .join(Gig, Gig.id == GigActivityBucket.gig_id)
+        .filter(
+            GigActivityBucket.bucket_start >= bucket_start(now - timedelta(hours=window)),
+            Gig.approval_status == "approved",
+            Gig.status == "open",
+        )
+        .all()
+    )
+    if not rows:
+        return []
+    gig_ids, starts, applications, saves, views = zip(*rows)
+    activity = (
+        ACTIVITY_WEIGHTS["applications"] * np.asarray(applications, dtype=float)
+        + ACTIVITY_WEIGHTS["saves"] * np.asarray(saves, dtype=float)
+        + ACTIVITY_WEIGHTS["views"] * np.asarray(views, dtype=float)
+    )
+    age_hours = np.asarray([(now - start).total_seconds() / 3600 for start in starts])
+    decayed = activity * np.power(0.5, np.clip(age_hours, 0, None) / half_life)
+    unique_ids, positions = np.unique(np.asarray(gig_ids), return_inverse=True)
+    scores = np.bincount(positions, weights=decayed)
+    return [(int(unique_ids[index]), float(scores[index])) for index in top_k(scores, limit)]
+
+
+def refresh_trending(limit: int = TRENDING_SIZE) -> Dict[str, int]:
+    """Replace the stored trending list and prune buckets outside the window."""
+    now = datetime.utcnow()
+    ranked = compute_trending(limit, now)
+    db.session.execute(delete(TrendingGig))
+    if ranked:
+        db.session.execute(insert(TrendingGig), [
+            {"rank": rank, "gig_id": gig_id, "score": score, "computed_at": now}
+            for rank, (gig_id, score) in enumerate(ranked)
+        ])
+    marked = db.session.execute(
+        update(TrendingRefresh).where(TrendingRefresh.id == 1).values(refreshed_at=now)
+    ).rowcount
+    if not marked:
+        db.session.execute(insert(TrendingRefresh).values(id=1, refreshed_at=now))
+    window = int(current_app.config.get("TRENDING_WINDOW_HOURS", 72))
+    pruned = db.session.execute(
+        delete(GigActivityBucket)
+        .where(GigActivityBucket.bucket_start < bucket_start(now - timedelta(hours=window)))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    return {"trending": len(ranked), "buckets_pruned": pruned}
+
+
+def _stored_trending(limit: int) -> List[Tuple[Gig, float]]:
+    return (
+        db.session.query(Gig, TrendingGig.score)
+        .join(TrendingGig, TrendingGig.gig_id == Gig.id)
+        .filter(Gig.approval_status == "approved", Gig.status == "open")
+        .order_by(TrendingGig.rank)
+        .limit(limit)
+        .all()
+    )
+
+
+def trending_gigs(limit: int) -> List[Tuple[Gig, float]]:
+    """``(gig, score)`` pairs for the trending endpoint, best first.
+
+    Quiet periods are padded with the open gigs with most applications.
+    """
+    max_age = int(current_app.config.get("TRENDING_MAX_AGE", 900))
+    refreshed_at = db.session.query(TrendingRefresh.refreshed_at).scalar()
+    if refreshed_at is None or refreshed_at < datetime.utcnow() - timedelta(seconds=max_age):
+        try:
+            refresh_trending()
+        except IntegrityError:
+            # A concurrent request refreshed the list first
+            db.session.rollback()
+    results = [(gig, score) for gig, score in _stored_trending(limit)]
+    if len(results) < limit:
+        listed = [gig.id for gig, _ in results]
+        padding = (
+            _open_gigs()
+            .filter(~Gig.id.in_(listed))
+            .order_by(Gig.application_count.desc(), Gig.created_at.desc())
+            .limit(limit - len(results))
+        )
+        results.extend((gig, 0.0) for gig in padding)
+    return results
@@ -3,6 +3,7 @@ from sqlalchemy import func
 from .. import db
 from ..models import Application, Gig, Rating, User
 from .exceptions import NotFoundError, ValidationError
+from .identity_cache import identity_cache
 
 
 def get_user_by_id(user_id: int) -> User:
@@ -34,6 +35,7 @@ def update_user_profile(user_id: int, profile_data: Dict) -> User:
         if field in allowed_fields:
             setattr(user, field, value)
     db.session.commit()
+    identity_cache.invalidate(user.uid)
     return user
 
 
@@ -118,6 +120,7 @@ def update_user_role(user_uid: str, new_role: str, admin_id: int) -> User:
     old_role = user.role
     user.role = new_role.lower()
     db.session.commit()
+    identity_cache.invalidate(user.uid)
     
     # TODO: Log the role change for audit purposes
     # create_audit_log(admin_id, "role_change", f"Changed {user.name} role from {old_role} to {new_role}")
@@ -3,6 +3,7 @@ from typing import Iterable, Union
 from flask import g, request
 from .auth_service import verify_token
 from .exceptions import AuthenticationError, AuthorizationError
+from .identity_cache import identity_cache
 from .user_service import get_user_by_uid
 
 
@@ -13,19 +14,18 @@ def _extract_bearer_token() -> str:
     return ""
 
 
-def require_auth(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        from .user_service import create_user_from_token
-        
-        token = _extract_bearer_token()
-        decoded = verify_token(token)
-        if not decoded:
-            raise AuthenticationError("Invalid or missing authentication token")
-        uid = decoded.get("uid")
-        if not uid:
-            raise AuthenticationError("Token payload missing uid")
-        
+def _authenticate(token: str):
+    from .user_service import create_user_from_token
+
+    decoded = verify_token(token)
+    if not decoded:
+        raise AuthenticationError("Invalid or missing authentication token")
+    uid = decoded.get("uid")
+    if not uid:
+        raise AuthenticationError("Token payload missing uid")
+
+    user = identity_cache.get(uid)
+    if user is None:
         user = get_user_by_uid(uid)
         if not user:
             # Auto-create user from token if doesn't exist
@@ -33,8 +33,30 @@ def require_auth(func):
                 user = create_user_from_token(decoded)
             except Exception as e:
                 raise AuthenticationError(f"Failed to create user: {str(e)}")
- 
-        g.current_user = user
+        identity_cache.remember(user)
+
+    g.current_user = user
+
+
+def require_auth(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        _authenticate(_extract_bearer_token())
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def require_stream_auth(func):
+    """``require_auth`` that also accepts an ``access_token`` query parameter.
+
+    Browser ``EventSource`` connections cannot send an Authorization header,
+    so only streaming endpoints should use this.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _extract_bearer_token() or request.args.get("access_token", "")
+        _authenticate(token)
         return func(*args, **kwargs)
 
     return wrapper
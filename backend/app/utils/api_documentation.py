@@ -153,10 +153,22 @@ class APIDocumentationGenerator:
                     "read": {"type": "boolean", "description": "Read status"},
                     "related_gig_id": {"type": "integer", "description": "Related gig ID"},
                     "related_application_id": {"type": "integer", "description": "Related application ID"},
+                    "count": {"type": "integer", "description": "Number of updates merged into this notification"},
                     "created_at": {"type": "string", "format": "date-time", "description": "Creation timestamp"}
                 },
                 "required": ["id", "type", "title", "message", "read"]
             },
+            "DeviceToken": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer", "description": "Device ID"},
+                    "token": {"type": "string", "description": "FCM registration token"},
+                    "platform": {"type": "string", "enum": ["ios", "android", "web"]},
+                    "created_at": {"type": "string", "format": "date-time"},
+                    "last_seen_at": {"type": "string", "format": "date-time"}
+                },
+                "required": ["id", "token"]
+            },
             "NotificationPreference": {
                 "type": "object",
                 "properties": {
@@ -250,6 +262,9 @@ class APIDocumentationGenerator:
                     }
                 }
             },
+            "NotModified": {
+                "description": "Not modified; the copy identified by If-None-Match is still current"
+            },
             "InternalServerError": {
                 "description": "Internal server error",
                 "content": {
@@ -280,6 +295,12 @@ class APIDocumentationGenerator:
                 "in": "query",
                 "description": "Search query string",
                 "schema": {"type": "string"}
+            },
+            "CursorParam": {
+                "name": "cursor",
+                "in": "query",
+                "description": "Opt into cursor pagination: pass an empty value for the first page, then the previous response's next_cursor. Cursor responses omit total and pages.",
+                "schema": {"type": "string"}
             }
         }
     
@@ -423,6 +444,7 @@ class APIDocumentationGenerator:
                     "parameters": [
                         {"$ref": "#/components/parameters/PageParam"},
                         {"$ref": "#/components/parameters/PerPageParam"},
+                        {"$ref": "#/components/parameters/CursorParam"},
                         {"$ref": "#/components/parameters/SearchParam"},
                         {
                             "name": "category",
@@ -447,6 +469,15 @@ class APIDocumentationGenerator:
                             "in": "query",
                             "description": "Maximum budget filter",
                             "schema": {"type": "number"}
+                        },
+                        {
+                            "name": "sort_by",
+                            "in": "query",
+                            "description": "Sort order; 'relevance' ranks full-text search matches",
+                            "schema": {
+                                "type": "string",
+                                "enum": ["newest", "budget_high", "budget_low", "deadline", "title", "rating", "relevance"]
+                            }
                         }
                     ],
                     "responses": {
@@ -469,7 +500,8 @@ class APIDocumentationGenerator:
                                     }
                                 }
                             }
-                        }
+                        },
+                        "304": {"$ref": "#/components/responses/NotModified"}
                     }
                 },
                 "post": {
@@ -614,7 +646,8 @@ class APIDocumentationGenerator:
                                     }
                                 }
                             }
-                        }
+                        },
+                        "304": {"$ref": "#/components/responses/NotModified"}
                     }
                 }
             },
@@ -726,7 +759,7 @@ class APIDocumentationGenerator:
                 "get": {
                     "tags": ["Recommendations"],
                     "summary": "Get similar gigs",
-                    "description": "Get gigs similar to the specified gig",
+                    "description": "Get open gigs whose title, description and category overlap most with the specified gig (MinHash index, neighbors cached per gig)",
                     "parameters": [
                         {
                             "name": "gig_id",
@@ -761,7 +794,7 @@ class APIDocumentationGenerator:
                 "get": {
                     "tags": ["Recommendations"],
                     "summary": "Get trending gigs",
-                    "description": "Get currently trending gigs based on application activity",
+                    "description": "Get currently trending gigs, ranked by applications, saves and views decayed over time; the list is precomputed periodically",
                     "parameters": [
                         {
                             "name": "limit",
@@ -972,7 +1005,8 @@ class APIDocumentationGenerator:
                                     }
                                 }
                             }
-                        }
+                        },
+                        "304": {"$ref": "#/components/responses/NotModified"}
                     }
                 }
             },
@@ -2033,27 +2067,61 @@ class APIDocumentationGenerator:
                 "get": {
                     "tags": ["Notifications"],
                     "summary": "Get user notifications",
-                    "description": "Get list of notifications for the current user",
+                    "description": (
+                        "Get notifications for the current user, newest first. Passing cursor "
+                        "(empty for the first page) or limit returns one page with next_cursor; "
+                        "without either the full list is returned as an array."
+                    ),
                     "parameters": [
                         {
                             "name": "unread_only",
                             "in": "query",
                             "description": "Show only unread notifications",
                             "schema": {"type": "boolean", "default": False}
+                        },
+                        {"$ref": "#/components/parameters/CursorParam"},
+                        {
+                            "name": "limit",
+                            "in": "query",
+                            "description": "Page size in paged mode",
+                            "schema": {"type": "integer", "minimum": 1, "maximum": 100, "default": 20}
+                        },
+                        {
+                            "name": "compact",
+                            "in": "query",
+                            "description": "Return id, type, title, read, related_gig_id, count and created_at only",
+                            "schema": {"type": "boolean", "default": False}
                         }
                     ],
                     "responses": {
                         "200": {
-                            "description": "List of notifications",
+                            "description": "Notifications, as an array or (paged mode) a page object",
                             "content": {
                                 "application/json": {
                                     "schema": {
-                                        "type": "array",
-                                        "items": {"$ref": "#/components/schemas/Notification"}
+                                        "oneOf": [
+                                            {
+                                                "type": "array",
+                                                "items": {"$ref": "#/components/schemas/Notification"}
+                                            },
+                                            {
+                                                "type": "object",
+                                                "properties": {
+                                                    "items": {
+                                                        "type": "array",
+                                                        "items": {"$ref": "#/components/schemas/Notification"}
+                                                    },
+                                                    "per_page": {"type": "integer"},
+                                                    "next_cursor": {"type": "string", "nullable": True},
+                                                    "has_more": {"type": "boolean"}
+                                                }
+                                            }
+                                        ]
                                     }
                                 }
                             }
-                        }
+                        },
+                        "304": {"$ref": "#/components/responses/NotModified"}
                     }
                 }
             },
@@ -2246,7 +2314,87 @@ class APIDocumentationGenerator:
                                     }
                                 }
                             }
+                        },
+                        "304": {"$ref": "#/components/responses/NotModified"}
+                    }
+                }
+            },
+            "/notifications/devices": {
+                "get": {
+                    "tags": ["Notifications"],
+                    "summary": "List registered push devices",
+                    "responses": {
+                        "200": {
+                            "description": "Devices, most recently seen first",
+                            "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/DeviceToken"}}}}
+                        }
+                    }
+                },
+                "post": {
+                    "tags": ["Notifications"],
+                    "summary": "Register or refresh a push device",
+                    "description": "Call on every app start; devices not refreshed within DEVICE_TOKEN_MAX_AGE_DAYS stop receiving pushes.",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "required": ["token"],
+                                    "properties": {
+                                        "token": {"type": "string", "description": "FCM registration token"},
+                                        "platform": {"type": "string", "enum": ["ios", "android", "web"]}
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    "responses": {
+                        "201": {
+                            "description": "Device registered",
+                            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/DeviceToken"}}}
+                        },
+                        "400": {"$ref": "#/components/responses/BadRequest"}
+                    }
+                },
+                "delete": {
+                    "tags": ["Notifications"],
+                    "summary": "Unregister a push device (e.g. on logout)",
+                    "requestBody": {
+                        "required": True,
+                        "content": {"application/json": {"schema": {"type": "object", "required": ["token"], "properties": {"token": {"type": "string"}}}}}
+                    },
+                    "responses": {
+                        "204": {"description": "Device removed"},
+                        "404": {"$ref": "#/components/responses/NotFound"}
+                    }
+                }
+            },
+            "/notifications/stream": {
+                "get": {
+                    "tags": ["Notifications"],
+                    "summary": "Stream notifications (Server-Sent Events)",
+                    "description": "Pushes new notifications as they are created. Event names are gig_pending, gig_approved, gig_rejected, gig_updated or notification, each carrying a Notification payload with its id as the event id; notification_updated events (no event id) resend a notification whose count and message changed when a gig update merged into it; heartbeat events are sent while idle. Reconnect with Last-Event-ID to resume. Connections close after NOTIFICATION_STREAM_MAX_DURATION seconds and the client is expected to reconnect.",
+                    "parameters": [
+                        {
+                            "name": "access_token",
+                            "in": "query",
+                            "description": "Token for EventSource clients that cannot send an Authorization header",
+                            "schema": {"type": "string"}
+                        },
+                        {
+                            "name": "Last-Event-ID",
+                            "in": "header",
+                            "description": "Resume after this notification id (also accepted as the last_event_id query parameter)",
+                            "schema": {"type": "integer"}
                         }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Event stream",
+                            "content": {"text/event-stream": {"schema": {"type": "string"}}}
+                        },
+                        "401": {"$ref": "#/components/responses/Unauthorized"}
                     }
                 }
             },
@@ -0,0 +1,284 @@
+"""
+Caching primitives and the response cache for public read endpoints
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+from flask import Flask, current_app, request
+
+logger = logging.getLogger('skillsync.cache')
+
+_MISSING = object()
+
+# Validator headers stored with a cached response so hits can still answer 304
+_REPLAYED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control')
+
+
+class TTLCache:
+    """Thread-safe in-process LRU cache with per-entry expiry.
+
+    Counters created through ``incr`` live outside the LRU so they are never
+    evicted; the response cache relies on that for its generation numbers.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            item = self._entries.get(key, _MISSING)
+            if item is not _MISSING:
+                expires_at, value = item
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = self._counters.get(key, 0) + 1
+            self._counters[key] = value
+            return value
+
+    def counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'local',
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class RedisCache:
+    """``TTLCache``-compatible cache over a redis-py style client.
+
+    Lets several worker processes share entries. Values must be JSON
+    serializable. Backend errors are logged and treated as misses so a cache
+    outage degrades to uncached reads instead of failing requests.
+    """
+
+    def __init__(self, client, prefix: str = 'skillsync:', default_ttl: float = 60.0):
+        self.client = client
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            raw = self.client.get(self.prefix + key)
+        except Exception as exc:
+            logger.warning(f"Cache get failed for {key}: {exc}")
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        try:
+            self.client.setex(self.prefix + key, max(int(ttl), 1), json.dumps(value))
+        except Exception as exc:
+            logger.warning(f"Cache set failed for {key}: {exc}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception as exc:
+            logger.warning(f"Cache delete failed for {key}: {exc}")
+
+    def incr(self, key: str) -> int:
+        try:
+            return int(self.client.incr(self.prefix + key))
+        except Exception as exc:
+            logger.warning(f"Cache incr failed for {key}: {exc}")
+            return 0
+
+    def counter(self, key: str) -> int:
+        try:
+            return int(self.client.get(self.prefix + key) or 0)
+        except Exception as exc:
+            logger.warning(f"Cache counter read failed for {key}: {exc}")
+            return 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'backend': 'redis',
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_registry: Dict[str, Any] = {}
+
+
+def register_cache(name: str, cache) -> None:
+    """Make a cache's statistics visible through ``cache_stats``."""
+    _registry[name] = cache
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+def create_shared_cache(app: Flask, prefix: str, max_entries: int, default_ttl: float):
+    """Return a ``RedisCache`` when ``REDIS_URL`` is configured, else a ``TTLCache``.
+
+    The redis client library is optional; without it the local cache is used.
+    """
+    redis_url = app.config.get('REDIS_URL')
+    if redis_url:
+        try:
+            import redis
+        except ImportError:
+            app.logger.warning("REDIS_URL is set but the redis package is not installed; using a local cache")
+        else:
+            return RedisCache(redis.Redis.from_url(redis_url), prefix=prefix, default_ttl=default_ttl)
+    return TTLCache(max_entries=max_entries, default_ttl=default_ttl)
+
+
+class ResponseCache:
+    """Caches full JSON responses of anonymous GET endpoints.
+
+    Entries are keyed on the path and the normalized query string, plus a
+    per-namespace generation number. ``invalidate`` bumps the generation, so
+    every cached response in the namespace becomes unreachable at once and
+    ages out through the TTL. A response computed while a write commits is
+    stored under the old generation and is never served.
+    """
+
+    def __init__(self, app: Flask = None):
+        self.backend = TTLCache()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        app.config.setdefault('RESPONSE_CACHE_ENABLED', True)
+        app.config.setdefault('RESPONSE_CACHE_TTL', 30)
+        app.config.setdefault('RESPONSE_CACHE_MAX_ENTRIES', 1024)
+        self.backend = create_shared_cache(
+            app,
+            prefix='skillsync:response:',
+            max_entries=int(app.config['RESPONSE_CACHE_MAX_ENTRIES']),
+            default_ttl=float(app.config['RESPONSE_CACHE_TTL']),
+        )
+        register_cache('responses', self.backend)
+        app.extensions['response_cache'] = self
+
+    def invalidate(self, namespace: str) -> None:
+        self.backend.incr(f"gen:{namespace}")
+
+    def _should_cache(self) -> bool:
+        return (
+            current_app.config.get('RESPONSE_CACHE_ENABLED', False)
+            and request.method == 'GET'
+            and 'Authorization' not in request.headers
+        )
+
+    def _key(self, namespace: str) -> str:
+        # Empty values stay in the key: views branch on a parameter's presence
+        # (``?cursor=`` is the first keyset page, not the offset listing)
+        params = sorted(
+            (name, value)
+            for name, values in request.args.lists()
+            for value in values
+        )
+        digest = hashlib.sha1(
+            json.dumps([request.path, params]).encode()
+        ).hexdigest()
+        generation = self.backend.counter(f"gen:{namespace}")
+        return f"{namespace}:{generation}:{digest}"
+
+    def cached(self, namespace: str, ttl: Optional[float] = None):
+        """Serve repeat anonymous GETs of the decorated view from the cache."""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self._should_cache():
+                    return view(*args, **kwargs)
+
+                key = self._key(namespace)
+                entry = self.backend.get(key)
+                if entry is not None:
+                    response = current_app.response_class(
+                        entry['body'], status=entry['status'], mimetype=entry['mimetype']
+                    )
+                    response.headers.update(entry.get('headers', {}))
+                    response.headers['X-Cache'] = 'HIT'
+                    # Honour If-None-Match/If-Modified-Since against the stored validators
+                    return response.make_conditional(request)
+
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.direct_passthrough:
+                    self.backend.set(
+                        key,
+                        {
+                            'body': response.get_data(as_text=True),
+                            'status': response.status_code,
+                            'mimetype': response.mimetype,
+                            'headers': {
+                                name: response.headers[name]
+                                for name in _REPLAYED_HEADERS
+                                if name in response.headers
+                            },
+                        },
+                        ttl,
+                    )
+                    response.headers['X-Cache'] = 'MISS'
+                return response
+
+            return wrapper
+        return decorator
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,61 @@
+"""
+Conditional GET support (ETag / Last-Modified)
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, Sequence
+
+from flask import current_app, request
+
+
+def make_etag(parts: Sequence[Any]) -> str:
+    """Stable digest of the values a response is derived from."""
+    payload = json.dumps(list(parts), default=str, separators=(',', ':'))
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _http_datetime(value: datetime) -> datetime:
+    # Columns hold naive UTC timestamps; HTTP dates have one-second precision.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def is_not_modified(etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Evaluate the request's preconditions against the current validators.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only consulted
+    when the client sent no entity tags.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return _http_datetime(last_modified) <= request.if_modified_since
+    return False
+
+
+def conditional_response(
+    validators: Sequence[Any],
+    build: Callable[[], Any],
+    last_modified: Optional[datetime] = None,
+    private: bool = True,
+):
+    """Answer ``304 Not Modified`` when the client's copy is current.
+
+    ``validators`` must change whenever the body would; ``build`` produces the
+    full response and is only called when the body has to be sent, so a
+    revalidation skips serialization entirely.
+    """
+    etag = make_etag(validators)
+    if is_not_modified(etag, last_modified):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.make_response(build())
+
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = _http_datetime(last_modified)
+    response.headers['Cache-Control'] = 'private, no-cache' if private else 'no-cache'
+    return response
@@ -13,6 +13,7 @@ import psutil
 import sys
 
 from .. import db
+from .cache import cache_stats
 
 
 class PerformanceMonitor:
@@ -164,6 +165,10 @@ class PerformanceMonitor:
         
         return metrics_summary
     
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """Hit/miss counters for every registered cache (responses, auth users, verified tokens)"""
+        return cache_stats()
+    
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get system resource metrics"""
         try:
@@ -243,6 +248,14 @@ class PerformanceMonitor:
             
             return jsonify(self.get_performance_metrics())
         
+        @app.route('/api/monitoring/caches')
+        def get_cache_metrics():
+            """Get cache hit/miss counters"""
+            if not getattr(g, 'current_user', None) or not g.current_user.is_role('admin'):
+                return jsonify({"error": "Admin access required"}), 403
+            
+            return jsonify(self.get_cache_metrics())
+        
         @app.route('/api/monitoring/system')
         def get_system_metrics():
             """Get system resource metrics"""
@@ -113,10 +113,14 @@ CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_feedback_category ON feedback(catego
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_feedback_status ON feedback(status);
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_feedback_created_at ON feedback(created_at);
 
--- Full-text search indexes (PostgreSQL specific)
--- These enable efficient text search on gig titles and descriptions
-CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gigs_title_fulltext ON gigs USING gin(to_tsvector('english', title));
-CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gigs_description_fulltext ON gigs USING gin(to_tsvector('english', description));
+-- Full-text search index (PostgreSQL specific)
+-- Weighted title/description/category document matched by gig search; the
+-- expression must stay identical to app.models.gig.search_document()
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gigs_search_vector ON gigs USING gin((
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(category, '')), 'C')
+));
 
 -- Partial indexes for better performance on specific conditions
 -- Index only for active, approved gigs (most common query)
@@ -169,5 +173,4 @@ COMMENT ON INDEX idx_gigs_active_approved IS 'Optimizes queries for browsing act
 COMMENT ON INDEX idx_notifications_unread IS 'Optimizes queries for unread notifications count and retrieval';
 COMMENT ON INDEX idx_applications_pending IS 'Optimizes queries for pending applications on gigs';
 COMMENT ON INDEX idx_ratings_flagged IS 'Optimizes moderation queries for flagged ratings';
-COMMENT ON INDEX idx_gigs_title_fulltext IS 'Enables full-text search on gig titles';
-COMMENT ON INDEX idx_gigs_description_fulltext IS 'Enables full-text search on gig descriptions';
\ No newline at end of file
+COMMENT ON INDEX idx_gigs_search_vector IS 'Enables ranked full-text search on gig title, description and category';
\ No newline at end of file
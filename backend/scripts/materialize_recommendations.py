@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Precompute every student's recommended gigs into student_recommendations.
+
+GET /api/gigs/recommended serves these rows and only ranks a student on demand
+when their list is missing or older than RECOMMENDATION_MAX_AGE. Run this from
+cron more often than that (e.g. hourly for the 6-hour default) so peak-time
+requests stay a single indexed read.
+
+Run:
+  source backend/.venv/bin/activate
+  python backend/scripts/materialize_recommendations.py --workers 4
+"""
+import argparse
+import os
+import sys
+
+# Ensure repo backend folder is on sys.path so `from app import ...` works even if PYTHONPATH is set oddly
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from app import create_app
+from app.services.recommendation_store import MATERIALIZE_CHUNK_SIZE, materialize_recommendations
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (1 runs in this process)")
+    parser.add_argument("--chunk-size", type=int, default=MATERIALIZE_CHUNK_SIZE,
+                        help="students per chunk")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        result = materialize_recommendations(workers=args.workers, chunk_size=args.chunk_size)
+        print(f"Stored recommendations for {result['students']} students in {result['chunks']} chunks")
+
+
+if __name__ == "__main__":
+    run()
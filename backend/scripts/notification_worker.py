@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Drain the notification outbox and the email and push delivery queues, and send digests.
+
+Each process claims batches under its own lease, so start as many copies as
+the backlog needs; they never send the same row twice. Without --once the
+worker keeps polling until it receives SIGINT/SIGTERM.
+
+Run:
+  source backend/.venv/bin/activate
+  python backend/scripts/notification_worker.py --queue all
+  python backend/scripts/notification_worker.py --queue email --once
+"""
+import argparse
+import os
+import signal
+import sys
+import threading
+
+# Ensure repo backend folder is on sys.path so `from app import ...` works even if PYTHONPATH is set oddly
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from app import create_app
+from app.services.delivery_worker import QueueWorker
+from app.services.notification_digest import DigestWorker
+from app.services.outbox_service import OutboxDispatcher
+
+QUEUES = ["outbox", "digest", "email", "push"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--queue", choices=QUEUES + ["all"], default="all")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--idle-sleep", type=float, default=5.0,
+                        help="seconds to wait when a queue is empty")
+    parser.add_argument("--once", action="store_true",
+                        help="drain what is claimable now and exit")
+    return parser.parse_args()
+
+
+def run():
+    args = parse_args()
+    app = create_app()
+    queues = QUEUES if args.queue == "all" else [args.queue]
+    batch_size = args.batch_size or app.config["NOTIFICATION_WORKER_BATCH_SIZE"]
+
+    def make_worker(queue):
+        if queue == "outbox":
+            return OutboxDispatcher()
+        if queue == "digest":
+            return DigestWorker()
+        return QueueWorker(queue, concurrency=args.concurrency)
+
+    if args.once:
+        with app.app_context():
+            for queue in queues:
+                totals = make_worker(queue).drain(batch_size)
+                done = totals.get("dispatched", totals.get("digests", totals.get("sent", 0)))
+                print(f"{queue}: done {done}, failed {totals.get('failed', 0)} "
+                      f"in {totals['batches']} batches")
+        return
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    def work(queue):
+        with app.app_context():
+            make_worker(queue).run_forever(
+                batch_size, idle_sleep=args.idle_sleep, stop=stop
+            )
+
+    threads = [threading.Thread(target=work, args=(queue,), name=f"{queue}-worker") for queue in queues]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        for thread in threads:
+            thread.join(timeout=1)
+
+
+if __name__ == "__main__":
+    run()
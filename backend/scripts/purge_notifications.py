@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Apply notification retention: archive old notifications and delete settled
+email/push queue rows and outbox events.
+
+Windows come from NOTIFICATION_RETENTION_DAYS and DELIVERY_RETENTION_DAYS.
+Work is done in batches with a commit per batch, so it is safe to run while
+the API and notification workers are up; schedule it daily from cron.
+
+Run:
+  source backend/.venv/bin/activate
+  python backend/scripts/purge_notifications.py
+"""
+import argparse
+import os
+import sys
+
+# Ensure repo backend folder is on sys.path so `from app import ...` works even if PYTHONPATH is set oddly
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from app import create_app
+from app.services.retention_service import RETENTION_BATCH_SIZE, run_retention
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=RETENTION_BATCH_SIZE)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        results = run_retention(batch_size=args.batch_size)
+        purged = results["purged"]
+        print(f"Archived {results['notifications_archived']} notifications; purged "
+              f"{purged['email']} emails, {purged['push']} pushes, {purged['outbox']} outbox events")
+
+
+if __name__ == "__main__":
+    run()
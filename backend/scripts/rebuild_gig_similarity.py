@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Rebuild the similar-gig index (gig_similarity_bands) and drop every cached
+neighbor list (gig_neighbors).
+
+The gig and admin services keep the index current; run this once after
+applying migrations/016_gig_similarity.sql, and after loading gigs outside
+the service layer (e.g. database/seed.sql).
+
+Run:
+  source backend/.venv/bin/activate
+  python backend/scripts/rebuild_gig_similarity.py
+"""
+import os
+import sys
+
+# Ensure repo backend folder is on sys.path so `from app import ...` works even if PYTHONPATH is set oddly
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from app import create_app
+from app.services.similarity_service import rebuild_similarity_index
+
+
+def run():
+    app = create_app()
+    with app.app_context():
+        gigs = rebuild_similarity_index()
+        print(f"Indexed {gigs} gigs for similarity")
+
+
+if __name__ == "__main__":
+    run()
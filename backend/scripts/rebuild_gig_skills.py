@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Rebuild the gig_skills match index from the gigs and skills tables.
+
+The gig and skill services keep the index current; run this once after
+applying migrations/014_gig_skills.sql, and after loading gigs or skills
+outside the service layer (e.g. database/seed.sql).
+
+Run:
+  source backend/.venv/bin/activate
+  python backend/scripts/rebuild_gig_skills.py
+"""
+import os
+import sys
+
+# Ensure repo backend folder is on sys.path so `from app import ...` works even if PYTHONPATH is set oddly
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from app import create_app
+from app.services.skill_match_service import rebuild_gig_skill_index
+
+
+def run():
+    app = create_app()
+    with app.app_context():
+        rows = rebuild_gig_skill_index()
+        print(f"Indexed {rows} gig/skill matches")
+
+
+if __name__ == "__main__":
+    run()
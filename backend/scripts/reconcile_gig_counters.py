@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Recompute the denormalized gig counters (application_count, rating_sum,
+rating_count) from the applications and ratings tables.
+
+The services keep these columns current; run this after loading data outside
+the service layer (e.g. database/seed.sql) or from a periodic job to repair
+any drift.
+
+Run:
+  source backend/.venv/bin/activate
+  python backend/scripts/reconcile_gig_counters.py
+"""
+import os
+import sys
+
+# Ensure repo backend folder is on sys.path so `from app import ...` works even if PYTHONPATH is set oddly
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from app import create_app
+from app.services.gig_service import reconcile_gig_counters
+
+
+def run():
+    app = create_app()
+    with app.app_context():
+        fixed = reconcile_gig_counters()
+        print(f"Reconciled counters on {fixed} gigs")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Recompute the per-user unread notification counters from the notifications
+table.
+
+The notification services keep notification_counters current; run this after
+inserting notifications outside the service layer or from a periodic job to
+repair any drift. Users without a counter row are skipped: theirs is built
+from the table on first read.
+
+Run:
+  source backend/.venv/bin/activate
+  python backend/scripts/reconcile_notification_counters.py
+"""
+import os
+import sys
+
+# Ensure repo backend folder is on sys.path so `from app import ...` works even if PYTHONPATH is set oddly
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from app import create_app
+from app.services.notification_counters import reconcile_notification_counters
+
+
+def run():
+    app = create_app()
+    with app.app_context():
+        fixed = reconcile_notification_counters()
+        print(f"Reconciled unread counters for {fixed} users")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Recompute the trending gigs list (trending_gigs) from the hourly activity
+buckets and prune buckets older than TRENDING_WINDOW_HOURS.
+
+GET /api/gigs/trending serves the stored list and only recomputes it inline
+once it is older than TRENDING_MAX_AGE; run this from cron more often than
+that (e.g. every 5 minutes for the 15-minute default).
+
+Run:
+  source backend/.venv/bin/activate
+  python backend/scripts/refresh_trending.py
+"""
+import os
+import sys
+
+# Ensure repo backend folder is on sys.path so `from app import ...` works even if PYTHONPATH is set oddly
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from app import create_app
+from app.services.gig_service import invalidate_gig_cache
+from app.services.trending_service import refresh_trending
+
+
+def run():
+    app = create_app()
+    with app.app_context():
+        result = refresh_trending()
+        invalidate_gig_cache()
+        print(f"Stored {result['trending']} trending gigs, pruned {result['buckets_pruned']} activity buckets")
+
+
+if __name__ == "__main__":
+    run()
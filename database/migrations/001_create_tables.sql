@@ -41,6 +41,9 @@ CREATE TABLE gigs (
     deadline DATE,
     status VARCHAR(50) DEFAULT 'open',
     approval_status VARCHAR(50) DEFAULT 'pending',
+    application_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_count INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -84,7 +87,9 @@ CREATE TABLE notifications (
     read BOOLEAN DEFAULT FALSE,
     related_gig_id INTEGER REFERENCES gigs (id) ON DELETE SET NULL,
     related_application_id INTEGER REFERENCES applications (id) ON DELETE SET NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    group_count INTEGER NOT NULL DEFAULT 1,
+    digest_pending BOOLEAN NOT NULL DEFAULT FALSE
 );
 
 -- Create saved_gigs table
@@ -161,7 +166,12 @@ CREATE TABLE email_queue (
     attempts INTEGER DEFAULT 0,
     last_attempt TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    sent_at TIMESTAMP
+    sent_at TIMESTAMP,
+    claimed_by VARCHAR(64),
+    claimed_until TIMESTAMP,
+    priority SMALLINT NOT NULL DEFAULT 1,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT
 );
 
 -- Create push_notifications table
@@ -177,5 +187,10 @@ CREATE TABLE push_notifications (
     attempts INTEGER DEFAULT 0,
     last_attempt TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    sent_at TIMESTAMP
+    sent_at TIMESTAMP,
+    claimed_by VARCHAR(64),
+    claimed_until TIMESTAMP,
+    priority SMALLINT NOT NULL DEFAULT 1,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT
 );
\ No newline at end of file
@@ -0,0 +1,12 @@
+-- Full-text search for gig browsing (GET /api/gigs?search=...)
+-- The expression must stay identical to app.models.gig.search_document() so the
+-- planner can use this index for the @@ match and ts_rank_cd ordering.
+CREATE INDEX IF NOT EXISTS idx_gigs_search_vector ON gigs USING gin ((
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(category, '')), 'C')
+));
+
+-- Superseded by idx_gigs_search_vector; no query matches these expressions.
+DROP INDEX IF EXISTS idx_gigs_title_fulltext;
+DROP INDEX IF EXISTS idx_gigs_description_fulltext;
@@ -0,0 +1,11 @@
+-- Composite indexes for cursor (keyset) pagination.
+-- Each matches a (sort key, id) ordering so a page is a single index seek.
+
+-- GET /api/gigs?cursor=... (default newest-first feed of approved gigs)
+CREATE INDEX IF NOT EXISTS idx_gigs_approval_created_id ON gigs (approval_status, created_at DESC, id DESC);
+
+-- GET /api/admin/users?cursor=...
+CREATE INDEX IF NOT EXISTS idx_users_created_id ON users (created_at DESC, id DESC);
+
+-- GET /api/admin/audit-logs?cursor=...
+CREATE INDEX IF NOT EXISTS idx_audit_logs_created_id ON audit_logs (created_at DESC, id DESC);
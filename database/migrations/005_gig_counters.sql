@@ -0,0 +1,20 @@
+-- Denormalized per-gig counters.
+-- The application, rating and admin services increment these in the same
+-- transaction as the row they count; backend/scripts/reconcile_gig_counters.py
+-- recomputes them in bulk.
+
+ALTER TABLE gigs ADD COLUMN IF NOT EXISTS application_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE gigs ADD COLUMN IF NOT EXISTS rating_sum INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE gigs ADD COLUMN IF NOT EXISTS rating_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill from existing rows (withdrawn applications are not counted)
+UPDATE gigs g SET
+    application_count = (
+        SELECT COUNT(*) FROM applications a
+        WHERE a.gig_id = g.id AND a.status <> 'withdrawn'
+    ),
+    rating_sum = (SELECT COALESCE(SUM(r.score), 0) FROM ratings r WHERE r.gig_id = g.id),
+    rating_count = (SELECT COUNT(*) FROM ratings r WHERE r.gig_id = g.id);
+
+-- GET /api/gigs/trending orders open, approved gigs by application_count
+CREATE INDEX IF NOT EXISTS idx_gigs_trending ON gigs (approval_status, status, application_count DESC, created_at DESC);
@@ -0,0 +1,14 @@
+-- Lease columns for the email/push delivery workers.
+-- A worker claims pending rows by stamping claimed_by/claimed_until
+-- (selected with FOR UPDATE SKIP LOCKED) and commits before sending, so
+-- concurrent workers never pick up the same row. Rows whose lease expired
+-- because a worker died are claimed again.
+
+ALTER TABLE email_queue ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(64);
+ALTER TABLE email_queue ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMP;
+ALTER TABLE push_notifications ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(64);
+ALTER TABLE push_notifications ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMP;
+
+-- Claim scans only look at pending rows, oldest first
+CREATE INDEX IF NOT EXISTS idx_email_queue_claim ON email_queue (id) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_push_notifications_claim ON push_notifications (id) WHERE status = 'pending';
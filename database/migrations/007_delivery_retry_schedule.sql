@@ -0,0 +1,28 @@
+-- Retry scheduling and priorities for the email/push delivery queues.
+-- Failed sends are retried at next_attempt_at (exponential backoff with
+-- jitter); rows that exhaust their attempts stay 'failed' with last_error.
+-- Workers claim by priority, fresh rows before retries.
+
+ALTER TABLE email_queue ADD COLUMN IF NOT EXISTS priority SMALLINT NOT NULL DEFAULT 1;
+ALTER TABLE email_queue ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMP;
+ALTER TABLE email_queue ADD COLUMN IF NOT EXISTS last_error TEXT;
+UPDATE email_queue SET next_attempt_at = COALESCE(last_attempt, created_at, CURRENT_TIMESTAMP)
+WHERE next_attempt_at IS NULL;
+ALTER TABLE email_queue ALTER COLUMN next_attempt_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE email_queue ALTER COLUMN next_attempt_at SET NOT NULL;
+
+ALTER TABLE push_notifications ADD COLUMN IF NOT EXISTS priority SMALLINT NOT NULL DEFAULT 1;
+ALTER TABLE push_notifications ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMP;
+ALTER TABLE push_notifications ADD COLUMN IF NOT EXISTS last_error TEXT;
+UPDATE push_notifications SET next_attempt_at = COALESCE(last_attempt, created_at, CURRENT_TIMESTAMP)
+WHERE next_attempt_at IS NULL;
+ALTER TABLE push_notifications ALTER COLUMN next_attempt_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE push_notifications ALTER COLUMN next_attempt_at SET NOT NULL;
+
+-- Claim scans follow the worker's ORDER BY over pending rows
+DROP INDEX IF EXISTS idx_email_queue_claim;
+DROP INDEX IF EXISTS idx_push_notifications_claim;
+CREATE INDEX IF NOT EXISTS idx_email_queue_claim
+    ON email_queue (priority, (attempts > 0), id) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_push_notifications_claim
+    ON push_notifications (priority, (attempts > 0), id) WHERE status = 'pending';
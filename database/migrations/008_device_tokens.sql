@@ -0,0 +1,14 @@
+-- Registry of push devices. Queued pushes without a device_token are fanned
+-- out to the user's live tokens at send time; tokens FCM reports as
+-- unregistered or invalid are deleted.
+
+CREATE TABLE IF NOT EXISTS device_tokens (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    token VARCHAR(255) NOT NULL UNIQUE,
+    platform VARCHAR(20),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_seen_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_device_tokens_user_seen ON device_tokens (user_id, last_seen_at);
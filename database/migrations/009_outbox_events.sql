@@ -0,0 +1,19 @@
+-- Transactional outbox. Gig and application writes insert their notification
+-- side effects here in the same transaction; the notification worker
+-- dispatches pending events and leases them like the delivery queues.
+
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id SERIAL PRIMARY KEY,
+    event_type VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}',
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'dispatched', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    claimed_by VARCHAR(64),
+    claimed_until TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    dispatched_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_outbox_events_status_available ON outbox_events (status, available_at, id);
@@ -0,0 +1,30 @@
+-- Gig update coalescing and email digests. Repeat updates for the same gig
+-- merge into the recipient's recent unread notification (group_count counts
+-- the merged events); notifications flagged digest_pending are mailed in a
+-- periodic digest instead of one email per event. Recipients who only want
+-- email queue the update in notification_digest_items instead.
+
+ALTER TABLE notifications ADD COLUMN IF NOT EXISTS group_count INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE notifications ADD COLUMN IF NOT EXISTS digest_pending BOOLEAN NOT NULL DEFAULT FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_notifications_coalesce
+    ON notifications (user_id, related_gig_id, type, created_at)
+    WHERE read = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_notifications_digest_pending
+    ON notifications (user_id, created_at)
+    WHERE digest_pending = TRUE;
+
+CREATE TABLE IF NOT EXISTS notification_digest_items (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    type VARCHAR(50) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    related_gig_id INTEGER REFERENCES gigs (id) ON DELETE CASCADE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    group_count INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE INDEX IF NOT EXISTS idx_notification_digest_items_user_created
+    ON notification_digest_items (user_id, created_at);
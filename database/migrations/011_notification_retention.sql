@@ -0,0 +1,31 @@
+-- Notification retention. Notifications past NOTIFICATION_RETENTION_DAYS move
+-- to notifications_archive so the hot table stays small; settled queue rows
+-- and outbox events are deleted by backend/scripts/purge_notifications.py.
+
+CREATE TABLE IF NOT EXISTS notifications_archive (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    type VARCHAR(50) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    read BOOLEAN DEFAULT FALSE,
+    related_gig_id INTEGER,
+    related_application_id INTEGER,
+    created_at TIMESTAMP,
+    group_count INTEGER NOT NULL DEFAULT 1,
+    digest_pending BOOLEAN NOT NULL DEFAULT FALSE,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_notifications_archive_user_id ON notifications_archive (user_id);
+
+-- Range scans for the hot-window summary counts
+CREATE INDEX IF NOT EXISTS idx_notifications_user_created ON notifications (user_id, created_at);
+
+-- Retention scans over settled rows
+CREATE INDEX IF NOT EXISTS idx_email_queue_settled
+    ON email_queue (created_at) WHERE status IN ('sent', 'failed');
+CREATE INDEX IF NOT EXISTS idx_push_notifications_settled
+    ON push_notifications (created_at) WHERE status IN ('sent', 'failed');
+CREATE INDEX IF NOT EXISTS idx_outbox_events_settled
+    ON outbox_events (created_at) WHERE status IN ('dispatched', 'failed');
@@ -0,0 +1,6 @@
+-- Unread fast path for GET /api/notifications?unread_only=true: pages and the
+-- list validator read only the unread slice of a user's history.
+
+CREATE INDEX IF NOT EXISTS idx_notifications_user_unread
+    ON notifications (user_id, created_at, id)
+    WHERE read = FALSE;
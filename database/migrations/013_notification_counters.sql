@@ -0,0 +1,17 @@
+-- Maintained unread notification count per user, so the unread-count endpoint
+-- is a primary-key read. Existing users are backfilled here; users created
+-- later get their row on first read. backend/scripts/reconcile_notification_counters.py
+-- repairs drift.
+
+CREATE TABLE IF NOT EXISTS notification_counters (
+    user_id INTEGER PRIMARY KEY REFERENCES users (id) ON DELETE CASCADE,
+    unread_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO notification_counters (user_id, unread_count)
+SELECT users.id, count(notifications.id) FILTER (WHERE NOT notifications.read)
+FROM users
+LEFT JOIN notifications ON notifications.user_id = users.id
+GROUP BY users.id
+ON CONFLICT (user_id) DO NOTHING;
@@ -0,0 +1,12 @@
+-- Skill-to-gig match index for student recommendations. A row means every
+-- token of the skill name appears in the gig's title or description. The
+-- services maintain it; populate it once with backend/scripts/rebuild_gig_skills.py.
+
+CREATE TABLE IF NOT EXISTS gig_skills (
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills (id) ON DELETE CASCADE,
+    in_title BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (gig_id, skill_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gig_skills_skill_gig ON gig_skills (skill_id, gig_id);
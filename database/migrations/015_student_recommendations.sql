@@ -0,0 +1,12 @@
+-- Precomputed recommended gigs per student, one row per rank. Written by
+-- backend/scripts/materialize_recommendations.py and on demand for students
+-- whose list is missing or older than RECOMMENDATION_MAX_AGE.
+
+CREATE TABLE IF NOT EXISTS student_recommendations (
+    student_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (student_id, rank)
+);
@@ -0,0 +1,24 @@
+-- Similar-gig index: LSH buckets of each approved, open gig's MinHash
+-- signature, and the cached nearest-neighbor list per gig. The services
+-- maintain both; populate the buckets once with
+-- backend/scripts/rebuild_gig_similarity.py.
+
+CREATE TABLE IF NOT EXISTS gig_similarity_bands (
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    PRIMARY KEY (gig_id, band)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gig_similarity_bands_bucket ON gig_similarity_bands (band, bucket);
+
+CREATE TABLE IF NOT EXISTS gig_neighbors (
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    neighbor_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (gig_id, rank)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gig_neighbors_neighbor ON gig_neighbors (neighbor_id);
@@ -0,0 +1,26 @@
+-- Hourly application, save and view counts per gig, and the precomputed
+-- trending list served by /api/gigs/trending, with the time of its last
+-- refresh. Refresh the list with backend/scripts/refresh_trending.py.
+
+CREATE TABLE IF NOT EXISTS gig_activity_buckets (
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    bucket_start TIMESTAMP NOT NULL,
+    applications INTEGER NOT NULL DEFAULT 0,
+    saves INTEGER NOT NULL DEFAULT 0,
+    views INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (gig_id, bucket_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gig_activity_buckets_start ON gig_activity_buckets (bucket_start);
+
+CREATE TABLE IF NOT EXISTS trending_gigs (
+    rank INTEGER PRIMARY KEY,
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS trending_refreshes (
+    id INTEGER PRIMARY KEY,
+    refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
@@ -1,3 +1,27 @@
+DROP TABLE IF EXISTS trending_refreshes CASCADE;
+
+DROP TABLE IF EXISTS trending_gigs CASCADE;
+
+DROP TABLE IF EXISTS gig_activity_buckets CASCADE;
+
+DROP TABLE IF EXISTS gig_neighbors CASCADE;
+
+DROP TABLE IF EXISTS gig_similarity_bands CASCADE;
+
+DROP TABLE IF EXISTS student_recommendations CASCADE;
+
+DROP TABLE IF EXISTS gig_skills CASCADE;
+
+DROP TABLE IF EXISTS notification_counters CASCADE;
+
+DROP TABLE IF EXISTS notifications_archive CASCADE;
+
+DROP TABLE IF EXISTS notification_digest_items CASCADE;
+
+DROP TABLE IF EXISTS outbox_events CASCADE;
+
+DROP TABLE IF EXISTS device_tokens CASCADE;
+
 DROP TABLE IF EXISTS push_notifications CASCADE;
 
 DROP TABLE IF EXISTS email_queue CASCADE;
@@ -49,6 +73,9 @@ CREATE TABLE gigs (
     deadline DATE,
     status VARCHAR(50) DEFAULT 'open',
     approval_status VARCHAR(50) DEFAULT 'pending',
+    application_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_count INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -89,7 +116,9 @@ CREATE TABLE notifications (
     read BOOLEAN DEFAULT FALSE,
     related_gig_id INTEGER REFERENCES gigs (id) ON DELETE SET NULL,
     related_application_id INTEGER REFERENCES applications (id) ON DELETE SET NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    group_count INTEGER NOT NULL DEFAULT 1,
+    digest_pending BOOLEAN NOT NULL DEFAULT FALSE
 );
 
 CREATE TABLE saved_gigs (
@@ -159,7 +188,12 @@ CREATE TABLE email_queue (
     attempts INTEGER DEFAULT 0,
     last_attempt TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    sent_at TIMESTAMP
+    sent_at TIMESTAMP,
+    claimed_by VARCHAR(64),
+    claimed_until TIMESTAMP,
+    priority SMALLINT NOT NULL DEFAULT 1,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT
 );
 
 CREATE TABLE push_notifications (
@@ -174,7 +208,120 @@ CREATE TABLE push_notifications (
     attempts INTEGER DEFAULT 0,
     last_attempt TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    sent_at TIMESTAMP
+    sent_at TIMESTAMP,
+    claimed_by VARCHAR(64),
+    claimed_until TIMESTAMP,
+    priority SMALLINT NOT NULL DEFAULT 1,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT
+);
+
+CREATE TABLE device_tokens (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    token VARCHAR(255) NOT NULL UNIQUE,
+    platform VARCHAR(20),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_seen_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE outbox_events (
+    id SERIAL PRIMARY KEY,
+    event_type VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}',
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'dispatched', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    claimed_by VARCHAR(64),
+    claimed_until TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    dispatched_at TIMESTAMP
+);
+
+CREATE TABLE notification_digest_items (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    type VARCHAR(50) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    related_gig_id INTEGER REFERENCES gigs (id) ON DELETE CASCADE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    group_count INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE notifications_archive (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    type VARCHAR(50) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    read BOOLEAN DEFAULT FALSE,
+    related_gig_id INTEGER,
+    related_application_id INTEGER,
+    created_at TIMESTAMP,
+    group_count INTEGER NOT NULL DEFAULT 1,
+    digest_pending BOOLEAN NOT NULL DEFAULT FALSE,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE notification_counters (
+    user_id INTEGER PRIMARY KEY REFERENCES users (id) ON DELETE CASCADE,
+    unread_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE gig_skills (
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills (id) ON DELETE CASCADE,
+    in_title BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (gig_id, skill_id)
+);
+
+CREATE TABLE student_recommendations (
+    student_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (student_id, rank)
+);
+
+CREATE TABLE gig_similarity_bands (
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    PRIMARY KEY (gig_id, band)
+);
+
+CREATE TABLE gig_neighbors (
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    neighbor_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (gig_id, rank)
+);
+
+CREATE TABLE gig_activity_buckets (
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    bucket_start TIMESTAMP NOT NULL,
+    applications INTEGER NOT NULL DEFAULT 0,
+    saves INTEGER NOT NULL DEFAULT 0,
+    views INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (gig_id, bucket_start)
+);
+
+CREATE TABLE trending_gigs (
+    rank INTEGER PRIMARY KEY,
+    gig_id INTEGER NOT NULL REFERENCES gigs (id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE trending_refreshes (
+    id INTEGER PRIMARY KEY,
+    refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX idx_users_email ON users (email);
@@ -213,4 +360,31 @@ CREATE INDEX idx_saved_gigs_gig_id ON saved_gigs (gig_id);
 
 CREATE INDEX idx_student_skills_student_id ON student_skills (student_id);
 
-CREATE INDEX idx_student_skills_skill_id ON student_skills (skill_id);
\ No newline at end of file
+CREATE INDEX idx_student_skills_skill_id ON student_skills (skill_id);
+
+CREATE INDEX idx_device_tokens_user_seen ON device_tokens (user_id, last_seen_at);
+
+CREATE INDEX idx_outbox_events_status_available ON outbox_events (status, available_at, id);
+
+CREATE INDEX idx_notifications_coalesce ON notifications (user_id, related_gig_id, type, created_at) WHERE read = FALSE;
+
+CREATE INDEX idx_notifications_digest_pending ON notifications (user_id, created_at) WHERE digest_pending = TRUE;
+
+CREATE INDEX idx_notification_digest_items_user_created ON notification_digest_items (user_id, created_at);
+
+CREATE INDEX ix_notifications_archive_user_id ON notifications_archive (user_id);
+
+CREATE INDEX idx_notifications_user_created ON notifications (user_id, created_at);
+
+CREATE INDEX idx_notifications_user_unread ON notifications (user_id, created_at, id) WHERE read = FALSE;
+
+CREATE INDEX idx_gig_skills_skill_gig ON gig_skills (skill_id, gig_id);
+CREATE INDEX idx_gig_similarity_bands_bucket ON gig_similarity_bands (band, bucket);
+CREATE INDEX idx_gig_neighbors_neighbor ON gig_neighbors (neighbor_id);
+CREATE INDEX idx_gig_activity_buckets_start ON gig_activity_buckets (bucket_start);
+
+CREATE INDEX idx_email_queue_settled ON email_queue (created_at) WHERE status IN ('sent', 'failed');
+
+CREATE INDEX idx_push_notifications_settled ON push_notifications (created_at) WHERE status IN ('sent', 'failed');
+
+CREATE INDEX idx_outbox_events_settled ON outbox_events (created_at) WHERE status IN ('dispatched', 'failed');
@@ -135,3 +135,12 @@ VALUES
     (9, 'application_update', TRUE, TRUE, TRUE),
     (5, 'new_gig', FALSE, TRUE, TRUE),
     (5, 'application_update', TRUE, TRUE, TRUE);
+
+-- Seed rows bypass the service layer, so derive the denormalized gig counters
+UPDATE gigs g SET
+    application_count = (
+        SELECT COUNT(*) FROM applications a
+        WHERE a.gig_id = g.id AND a.status <> 'withdrawn'
+    ),
+    rating_sum = (SELECT COALESCE(SUM(r.score), 0) FROM ratings r WHERE r.gig_id = g.id),
+    rating_count = (SELECT COUNT(*) FROM ratings r WHERE r.gig_id = g.id);
@@ -0,0 +1,160 @@
+"""
+Tests for the email/push delivery workers
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import User
+from app.models.notification_preferences import EmailQueue, PushNotification
+from app.services.delivery_worker import (
+    QueueWorker,
+    list_dead_letters,
+    requeue_dead_letters,
+    retry_delay,
+)
+from app.services.exceptions import ValidationError
+
+
+class TestQueueWorker:
+    """Test lease-based claiming and batch processing"""
+
+    @pytest.fixture
+    def queued_emails(self, db_session):
+        user = User(uid="worker_user", name="Worker User",
+                    email="worker_user@test.com", role="student")
+        db_session.add(user)
+        db_session.commit()
+        emails = [
+            EmailQueue(user_id=user.id, email_address=user.email,
+                       subject=f"Subject {i}", body="Body")
+            for i in range(5)
+        ]
+        db_session.add_all(emails)
+        db_session.commit()
+        return [email.id for email in emails]
+
+    def test_workers_claim_disjoint_batches(self, queued_emails):
+        first = QueueWorker("email", worker_id="worker-a").claim_batch(3)
+        second = QueueWorker("email", worker_id="worker-b").claim_batch(3)
+        third = QueueWorker("email", worker_id="worker-c").claim_batch(3)
+
+        first_ids = {row.id for row in first}
+        second_ids = {row.id for row in second}
+        assert len(first_ids) == 3 and len(second_ids) == 2
+        assert first_ids.isdisjoint(second_ids)
+        assert first_ids | second_ids == set(queued_emails)
+        assert third == []
+
+    def test_expired_lease_is_reclaimed(self, db_session, queued_emails):
+        QueueWorker("email", worker_id="crashed").claim_batch(5)
+        assert QueueWorker("email", worker_id="other").claim_batch(5) == []
+
+        EmailQueue.query.update({EmailQueue.claimed_until: datetime.utcnow() - timedelta(seconds=1)})
+        db_session.commit()
+
+        reclaimed = QueueWorker("email", worker_id="other").claim_batch(5)
+        assert len(reclaimed) == 5
+        assert all(row.claimed_by.startswith("other:") for row in reclaimed)
+
+    def test_process_batch_sends_in_parallel(self, queued_emails):
+        threads = set()
+
+        def sender(email):
+            threads.add(threading.get_ident())
+            return True
+
+        results = QueueWorker("email", concurrency=4, sender=sender).process_batch(10)
+
+        assert results == {"claimed": 5, "sent": 5, "failed": 0, "errors": []}
+        assert threading.get_ident() not in threads
+        for email in EmailQueue.query.all():
+            assert email.status == "sent"
+            assert email.sent_at is not None
+            assert email.claimed_by is None and email.claimed_until is None
+
+    def test_failed_send_releases_lease(self, queued_emails):
+        def sender(email):
+            raise RuntimeError("provider timeout")
+
+        worker = QueueWorker("email", sender=sender)
+        results = worker.process_batch(1)
+
+        assert results["sent"] == 0
+        assert results["errors"] == [f"Email {queued_emails[0]}: provider timeout"]
+        email = EmailQueue.query.get(queued_emails[0])
+        assert email.status == "pending"
+        assert email.attempts == 1
+        assert email.claimed_until is None
+
+    def test_drain_processes_every_batch(self, queued_emails):
+        totals = QueueWorker("email", sender=lambda email: True).drain(batch_size=2)
+
+        assert totals["batches"] == 3
+        assert totals["sent"] == 5
+        assert EmailQueue.query.filter_by(status="pending").count() == 0
+
+    def test_push_queue(self, db_session, queued_emails):
+        user_id = EmailQueue.query.first().user_id
+        db_session.add(PushNotification(user_id=user_id, title="Push", body="Body"))
+        db_session.commit()
+
+        results = QueueWorker("push", sender=lambda push: True).process_batch(10)
+        assert results["sent"] == 1
+
+    def test_failed_send_is_scheduled_with_backoff(self, queued_emails):
+        worker = QueueWorker("email", sender=lambda email: False)
+        before = datetime.utcnow()
+        worker.process_batch(1)
+
+        email = EmailQueue.query.get(queued_emails[0])
+        assert email.status == "pending"
+        assert email.last_error == "Sender reported failure"
+        assert email.next_attempt_at >= before + timedelta(seconds=30)
+
+        # Not due yet, so the next claim moves on to other rows
+        claimed = {row.id for row in QueueWorker("email").claim_batch(10)}
+        assert email.id not in claimed
+
+    def test_exhausted_rows_are_dead_lettered(self, db_session, queued_emails):
+        def sender(email):
+            raise RuntimeError("mailbox unavailable")
+
+        worker = QueueWorker("email", sender=sender)
+        for _ in range(3):
+            EmailQueue.query.update({EmailQueue.next_attempt_at: datetime.utcnow()})
+            db_session.commit()
+            worker.process_batch(10)
+
+        dead = list_dead_letters("email")
+        assert len(dead) == 5
+        assert all(row.last_error == "mailbox unavailable" for row in dead)
+
+        assert requeue_dead_letters("email", [queued_emails[0]]) == 1
+        email = EmailQueue.query.get(queued_emails[0])
+        assert email.status == "pending" and email.attempts == 0
+        assert len(list_dead_letters("email")) == 4
+
+    def test_claims_fresh_high_priority_rows_first(self, db_session, queued_emails):
+        rows = EmailQueue.query.order_by(EmailQueue.id).all()
+        rows[0].attempts = 1          # normal priority retry
+        rows[1].priority = 2          # low priority (bulk)
+        rows[4].priority = 0          # high priority, newest
+        db_session.commit()
+
+        worker = QueueWorker("email")
+        order = [worker.claim_batch(1)[0].id for _ in range(5)]
+
+        assert order == [rows[4].id, rows[2].id, rows[3].id, rows[0].id, rows[1].id]
+
+    def test_retry_delay_grows_and_is_capped(self):
+        for attempts, step in [(1, 60), (2, 120), (3, 240)]:
+            delay = retry_delay(attempts, 60, 3600).total_seconds()
+            assert step / 2 <= delay <= step
+        assert retry_delay(20, 60, 3600).total_seconds() <= 3600
+
+    def test_unknown_queue(self, app):
+        with pytest.raises(ValidationError):
+            QueueWorker("sms")
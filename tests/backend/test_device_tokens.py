@@ -0,0 +1,84 @@
+"""
+Tests for the push device registry
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import DeviceToken, User
+from app.services.device_service import get_live_tokens, register_device
+
+STUDENT = {"Authorization": "Bearer test:device_student:student"}
+
+
+class TestDeviceEndpoints:
+    """Test /api/notifications/devices"""
+
+    def test_register_list_and_unregister(self, client, db_session):
+        response = client.post(
+            "/api/notifications/devices",
+            json={"token": "fcm-token-1", "platform": "android"},
+            headers=STUDENT,
+        )
+        assert response.status_code == 201
+        assert response.get_json()["platform"] == "android"
+
+        # Registering again refreshes the same row
+        client.post("/api/notifications/devices", json={"token": "fcm-token-1"}, headers=STUDENT)
+        listed = client.get("/api/notifications/devices", headers=STUDENT).get_json()
+        assert [device["token"] for device in listed] == ["fcm-token-1"]
+
+        response = client.delete(
+            "/api/notifications/devices", json={"token": "fcm-token-1"}, headers=STUDENT
+        )
+        assert response.status_code == 204
+        assert DeviceToken.query.count() == 0
+
+    def test_rejects_invalid_registration(self, client, db_session):
+        response = client.post(
+            "/api/notifications/devices", json={"token": "abc", "platform": "pager"}, headers=STUDENT
+        )
+        assert response.status_code == 400
+        response = client.post("/api/notifications/devices", json={}, headers=STUDENT)
+        assert response.status_code == 400
+
+    def test_unregister_unknown_token(self, client, db_session):
+        response = client.delete(
+            "/api/notifications/devices", json={"token": "missing"}, headers=STUDENT
+        )
+        assert response.status_code == 404
+
+
+class TestDeviceRegistry:
+    """Test the device token service"""
+
+    @pytest.fixture
+    def users(self, db_session):
+        users = [
+            User(uid=f"device_user_{i}", name=f"Device User {i}",
+                 email=f"device{i}@test.com", role="student")
+            for i in range(2)
+        ]
+        db_session.add_all(users)
+        db_session.commit()
+        return users
+
+    def test_token_moves_to_new_user(self, users):
+        register_device(users[0].id, "shared-device", "ios")
+        device = register_device(users[1].id, "shared-device")
+
+        assert device.user_id == users[1].id
+        assert device.platform == "ios"
+        assert DeviceToken.query.count() == 1
+
+    def test_live_tokens_skip_stale_devices(self, db_session, users):
+        register_device(users[0].id, "fresh", "android")
+        stale = register_device(users[0].id, "stale", "android")
+        register_device(users[1].id, "other", "web")
+        stale.last_seen_at = datetime.utcnow() - timedelta(days=90)
+        db_session.commit()
+
+        tokens = get_live_tokens([users[0].id, users[1].id])
+
+        assert tokens == {users[0].id: ["fresh"], users[1].id: ["other"]}
@@ -0,0 +1,119 @@
+"""
+Tests for ETag / Last-Modified conditional responses
+"""
+
+import pytest
+
+from app.models import User, Gig
+from app.services.gig_service import update_gig
+from app.services.notification_service import create_notification
+
+
+def auth(uid, role):
+    return {"Authorization": f"Bearer test:{uid}:{role}"}
+
+
+@pytest.fixture
+def approved_gig(db_session):
+    provider = User(uid="etag_provider", name="ETag Provider",
+                    email="etag_provider@test.com", role="provider")
+    db_session.add(provider)
+    db_session.commit()
+    gig = Gig(title="Conditional gig", description="Has validators",
+              provider_id=provider.id, approval_status="approved", status="open")
+    db_session.add(gig)
+    db_session.commit()
+    return gig
+
+
+@pytest.fixture
+def student(db_session):
+    user = User(uid="etag_student", name="ETag Student",
+                email="etag_student@test.com", role="student")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class TestGigConditionalGet:
+    """Test validators on gig reads"""
+
+    def test_revalidation_returns_304_until_gig_changes(self, client, approved_gig):
+        first = client.get(f"/api/gigs/{approved_gig.id}")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        cached = client.get(f"/api/gigs/{approved_gig.id}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.data == b""
+
+        update_gig(approved_gig.id, {"title": "Renamed gig"})
+        changed = client.get(f"/api/gigs/{approved_gig.id}", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.get_json()["title"] == "Renamed gig"
+
+    def test_no_last_modified_for_bodies_that_change_without_updated_at(
+        self, client, approved_gig
+    ):
+        # Counter and provider changes alter the body but not updated_at, so
+        # If-Modified-Since alone must never answer 304
+        first = client.get(f"/api/gigs/{approved_gig.id}")
+        assert "Last-Modified" not in first.headers
+
+        again = client.get(f"/api/gigs/{approved_gig.id}",
+                           headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+        assert again.status_code == 200
+
+    def test_list_etag(self, client, approved_gig):
+        first = client.get("/api/gigs")
+        cached = client.get("/api/gigs", headers={"If-None-Match": first.headers["ETag"]})
+        assert cached.status_code == 304
+
+
+class TestNotificationConditionalGet:
+    """Test validators on notification polling endpoints"""
+
+    def test_unread_count_changes_with_new_notification(self, client, student):
+        headers = auth(student.uid, "student")
+        first = client.get("/api/notifications/unread-count", headers=headers)
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        again = client.get("/api/notifications/unread-count",
+                           headers={**headers, "If-None-Match": etag})
+        assert again.status_code == 304
+
+        create_notification(student.id, "new_gig", "New gig", "A gig was posted")
+        changed = client.get("/api/notifications/unread-count",
+                             headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.get_json() == {"unread_count": 1}
+
+    def test_list_changes_when_marked_read(self, client, student):
+        headers = auth(student.uid, "student")
+        notification = create_notification(student.id, "new_gig", "New gig", "Posted")
+        etag = client.get("/api/notifications", headers=headers).headers["ETag"]
+        assert client.get("/api/notifications",
+                          headers={**headers, "If-None-Match": etag}).status_code == 304
+
+        client.patch(f"/api/notifications/{notification.id}/read", headers=headers)
+        assert client.get("/api/notifications",
+                          headers={**headers, "If-None-Match": etag}).status_code == 200
+        # The read flip leaves the newest created_at unchanged
+        assert client.get("/api/notifications", headers={
+            **headers, "If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT",
+        }).status_code == 200
+
+
+class TestProfileConditionalGet:
+    """Test validators on profile reads"""
+
+    def test_profile_update_changes_etag(self, client, student):
+        headers = auth(student.uid, "student")
+        etag = client.get(f"/api/users/{student.id}", headers=headers).headers["ETag"]
+        assert client.get(f"/api/users/{student.id}",
+                          headers={**headers, "If-None-Match": etag}).status_code == 304
+
+        client.put("/api/users/profile", json={"bio": "Updated bio"}, headers=headers)
+        assert client.get(f"/api/users/{student.id}",
+                          headers={**headers, "If-None-Match": etag}).status_code == 200
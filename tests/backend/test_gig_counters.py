@@ -0,0 +1,112 @@
+"""
+Tests for the denormalized gig counters
+"""
+
+import pytest
+
+from app import db
+from app.models import User, Gig, Application, Rating
+from app.services import admin_service, application_service, rating_service
+from app.services.gig_service import reconcile_gig_counters
+
+
+@pytest.fixture
+def counter_setup(db_session):
+    provider = User(uid="counter_provider", name="Counter Provider",
+                    email="counter_provider@test.com", role="provider")
+    student = User(uid="counter_student", name="Counter Student",
+                   email="counter_student@test.com", role="student")
+    admin = User(uid="counter_admin", name="Counter Admin",
+                 email="counter_admin@test.com", role="admin")
+    db_session.add_all([provider, student, admin])
+    db_session.commit()
+
+    gig = Gig(title="Counted gig", description="Has counters",
+              provider_id=provider.id, approval_status="approved", status="open")
+    db_session.add(gig)
+    db_session.commit()
+    return {"provider": provider, "student": student, "admin": admin, "gig": gig}
+
+
+class TestApplicationCounter:
+    """Test application_count maintenance"""
+
+    def test_apply_and_withdraw(self, counter_setup):
+        gig, student = counter_setup["gig"], counter_setup["student"]
+
+        application = application_service.create_application(student.id, gig.id, "hi")
+        assert db.session.get(Gig, gig.id).application_count == 1
+
+        application_service.withdraw_application(application.id, student.id)
+        assert db.session.get(Gig, gig.id).application_count == 0
+
+    def test_counter_update_keeps_updated_at(self, counter_setup):
+        gig, student = counter_setup["gig"], counter_setup["student"]
+        before = gig.updated_at
+        application_service.create_application(student.id, gig.id)
+        assert db.session.get(Gig, gig.id).updated_at == before
+
+
+    def test_select_candidate_counts_rejected_applications(self, counter_setup):
+        gig, student = counter_setup["gig"], counter_setup["student"]
+        other = User(uid="counter_other", name="Counter Other",
+                     email="counter_other@test.com", role="student")
+        db.session.add(other)
+        db.session.commit()
+        chosen = application_service.create_application(student.id, gig.id)
+        withdrawn = application_service.create_application(other.id, gig.id)
+        application_service.withdraw_application(withdrawn.id, other.id)
+        assert db.session.get(Gig, gig.id).application_count == 1
+
+        application_service.select_candidate(chosen.id, counter_setup["provider"].id)
+
+        assert db.session.get(Application, withdrawn.id).status == "rejected"
+        assert db.session.get(Gig, gig.id).application_count == 2
+        assert reconcile_gig_counters() == 0
+
+
+class TestRatingCounter:
+    """Test rating_sum/rating_count maintenance"""
+
+    def test_rate_edit_and_moderate_remove(self, counter_setup):
+        gig, student = counter_setup["gig"], counter_setup["student"]
+        provider, admin = counter_setup["provider"], counter_setup["admin"]
+        db.session.add(Application(gig_id=gig.id, student_id=student.id, status="completed"))
+        gig.status = "completed"
+        db.session.commit()
+
+        rating = rating_service.create_rating(student.id, provider.id, gig.id, 4)
+        refreshed = db.session.get(Gig, gig.id)
+        assert (refreshed.rating_sum, refreshed.rating_count) == (4, 1)
+        assert refreshed.rating_average == 4.0
+
+        rating_service.edit_rating(rating.id, student.id, score=2)
+        refreshed = db.session.get(Gig, gig.id)
+        assert (refreshed.rating_sum, refreshed.rating_count) == (2, 1)
+        assert refreshed.rating_average == 2.0
+
+        admin_service.moderate_rating(rating.id, admin.id, "remove")
+        refreshed = db.session.get(Gig, gig.id)
+        assert (refreshed.rating_sum, refreshed.rating_count) == (0, 0)
+        assert refreshed.rating_average == 0.0
+
+
+class TestReconcile:
+    """Test bulk counter reconciliation"""
+
+    def test_repairs_drift(self, counter_setup):
+        gig, student = counter_setup["gig"], counter_setup["student"]
+        provider = counter_setup["provider"]
+        db.session.add_all([
+            Application(gig_id=gig.id, student_id=student.id, status="pending"),
+            Application(gig_id=gig.id, student_id=provider.id, status="withdrawn"),
+            Rating(rater_id=student.id, ratee_id=provider.id, gig_id=gig.id, score=3),
+        ])
+        db.session.commit()
+
+        assert reconcile_gig_counters() == 1
+        refreshed = db.session.get(Gig, gig.id)
+        assert refreshed.application_count == 1
+        assert (refreshed.rating_sum, refreshed.rating_count) == (3, 1)
+
+        assert reconcile_gig_counters() == 0
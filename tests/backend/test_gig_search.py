@@ -0,0 +1,96 @@
+"""
+Tests for gig full-text search
+"""
+
+import pytest
+
+from app.models import User, Gig
+from app.services.gig_service import browse_gigs
+from app.services.search_service import InvertedIndex, tokenize
+
+
+class TestTokenizer:
+    """Test search text tokenization"""
+
+    def test_tokenize_lowercases_and_drops_stop_words(self):
+        assert tokenize("Build a Website for the Chess Club") == [
+            "build", "website", "chess", "club"
+        ]
+
+    def test_tokenize_strips_punctuation(self):
+        assert tokenize("python & pandas!") == ["python", "pandas"]
+
+    def test_tokenize_empty(self):
+        assert tokenize(None) == []
+        assert tokenize("") == []
+
+
+class TestInvertedIndex:
+    """Test the in-process fallback index"""
+
+    @pytest.fixture
+    def index(self):
+        index = InvertedIndex()
+        index.add(1, {"title": "Python tutor", "description": "Teach python basics", "category": "tutoring"})
+        index.add(2, {"title": "Logo design", "description": "Design a logo for a club", "category": "design"})
+        index.add(3, {"title": "Data analysis", "description": "Survey data in python", "category": "data"})
+        return index
+
+    def test_search_requires_every_term(self, index):
+        assert set(index.search("python data")) == {3}
+
+    def test_search_matches_prefixes(self, index):
+        assert set(index.search("pyth")) == {1, 3}
+
+    def test_title_matches_rank_higher(self, index):
+        scores = index.search("python")
+        assert scores[1] > scores[3]
+
+    def test_reindex_and_remove(self, index):
+        index.add(2, {"title": "Poster design", "description": "Print posters", "category": "design"})
+        assert index.search("logo") == {}
+        index.remove(2)
+        assert index.search("design") == {}
+        assert len(index) == 2
+
+    def test_no_terms(self, index):
+        assert index.search("the") == {}
+
+
+class TestBrowseGigsSearch:
+    """Test search through the gig browsing service"""
+
+    @pytest.fixture
+    def searchable_gigs(self, db_session):
+        provider = User(
+            uid="search_provider",
+            name="Search Provider",
+            email="search_provider@test.com",
+            role="provider"
+        )
+        db_session.add(provider)
+        db_session.commit()
+
+        gigs = [
+            Gig(title="Python tutor", description="Teach python basics", category="tutoring",
+                provider_id=provider.id, approval_status="approved"),
+            Gig(title="Data analysis", description="Analyze survey data with python", category="data",
+                provider_id=provider.id, approval_status="approved"),
+            Gig(title="Logo design", description="Design a logo for the chess club", category="design",
+                provider_id=provider.id, approval_status="approved"),
+        ]
+        db_session.add_all(gigs)
+        db_session.commit()
+        return gigs
+
+    def test_search_filters_results(self, searchable_gigs):
+        result = browse_gigs({"search": "logo"}, {"page": 1, "per_page": 20})
+        assert [gig.title for gig in result["items"]] == ["Logo design"]
+
+    def test_search_by_relevance(self, searchable_gigs):
+        result = browse_gigs({"search": "python", "sort": "relevance"}, {"page": 1, "per_page": 20})
+        assert [gig.title for gig in result["items"]] == ["Python tutor", "Data analysis"]
+
+    def test_search_matches_category(self, searchable_gigs):
+        result = browse_gigs({"search": "tutoring"}, {"page": 1, "per_page": 20})
+        assert result["total"] == 1
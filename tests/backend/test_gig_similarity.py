@@ -0,0 +1,154 @@
+"""
+Tests for the MinHash similar-gig index
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.models import Gig, GigNeighbor, GigSimilarityBand, User
+from app.services.admin_service import approve_gig
+from app.services.application_service import create_application, select_candidate
+from app.services.gig_service import (
+    create_gig,
+    delete_gig,
+    mark_expired_gigs,
+    update_gig,
+    update_gig_status,
+)
+from app.services.recommendation_service import get_similar_gigs
+from app.services.similarity_service import (
+    SIGNATURE_BANDS,
+    band_buckets,
+    gig_tokens,
+    jaccard,
+    rebuild_similarity_index,
+)
+
+
+@pytest.fixture
+def people(db_session):
+    provider = User(uid="similar_provider", name="Similar Provider",
+                    email="similar_provider@test.com", role="provider")
+    admin = User(uid="similar_admin", name="Similar Admin",
+                 email="similar_admin@test.com", role="admin")
+    db_session.add_all([provider, admin])
+    db_session.commit()
+    return provider.id, admin.id
+
+
+def _approved(people, title, description, category="Design"):
+    provider_id, admin_id = people
+    gig = create_gig(provider_id, {"title": title, "description": description,
+                                   "category": category})
+    return approve_gig(gig.id, admin_id)
+
+
+def _cached(gig_id):
+    return [row.neighbor_id for row in
+            GigNeighbor.query.filter_by(gig_id=gig_id).order_by(GigNeighbor.rank)]
+
+
+class TestSignatures:
+    """Test the MinHash arithmetic"""
+
+    def test_buckets_are_stable_and_track_overlap(self):
+        tokens = gig_tokens("Logo design", "Vector logo for a bakery", "Design")
+
+        assert band_buckets(tokens) == band_buckets(frozenset(sorted(tokens, reverse=True)))
+        assert len(band_buckets(tokens)) == SIGNATURE_BANDS
+        assert band_buckets(frozenset()) == []
+        assert jaccard(tokens, gig_tokens("Logo design", "", "")) == pytest.approx(2 / 4)
+
+
+class TestSimilarGigs:
+    """Test incremental indexing and cached neighbor lists"""
+
+    def test_approval_indexes_and_neighbors_rank_by_overlap(self, people):
+        reference = _approved(people, "Logo design", "Vector logo for a local bakery brand")
+        close = _approved(people, "Logo design", "Vector logo for a bakery brand refresh")
+        far = _approved(people, "Tax filing", "Spreadsheet help for a small shop", "Finance")
+        pending = create_gig(people[0], {"title": "Logo design",
+                                         "description": "Vector logo for a local bakery brand"})
+
+        assert GigSimilarityBand.query.filter_by(gig_id=pending.id).count() == 0
+        similar = get_similar_gigs(reference.id, limit=5)
+
+        assert [gig.id for gig in similar] == [close.id]
+        assert _cached(reference.id) == [close.id]
+        assert far.id not in _cached(reference.id)
+
+    def test_changes_drop_affected_lists(self, people):
+        reference = _approved(people, "Wedding photography", "Shoot a small outdoor wedding")
+        other = _approved(people, "Wedding photography", "Shoot an outdoor wedding reception")
+        get_similar_gigs(reference.id)
+        assert _cached(reference.id) == [other.id]
+
+        newcomer = _approved(people, "Wedding photography", "Shoot a small outdoor wedding party")
+        assert _cached(reference.id) == []
+        assert newcomer.id in [gig.id for gig in get_similar_gigs(reference.id)]
+
+        update_gig_status(other.id, "closed")
+        assert other.id not in [gig.id for gig in get_similar_gigs(reference.id)]
+
+        update_gig(newcomer.id, {"title": "Plumbing repair", "description": "Fix a kitchen sink",
+                                 "category": "Home"})
+        assert [gig.id for gig in get_similar_gigs(reference.id)] == []
+
+    def test_expired_gigs_leave_the_index(self, db_session, people):
+        reference = _approved(people, "Garden cleanup", "Weed and trim a small backyard garden")
+        expiring = _approved(people, "Garden cleanup", "Weed and trim a backyard garden today")
+        get_similar_gigs(reference.id)
+        expiring.deadline = date.today() - timedelta(days=1)
+        db_session.commit()
+
+        assert mark_expired_gigs() == 1
+
+        assert GigSimilarityBand.query.filter_by(gig_id=expiring.id).count() == 0
+        assert _cached(reference.id) == []
+        assert get_similar_gigs(reference.id) == []
+
+    def test_selecting_a_candidate_unindexes_the_gig(self, db_session, people):
+        reference = _approved(people, "Bike repair", "Fix gears and brakes on a city bike")
+        taken = _approved(people, "Bike repair", "Fix gears and brakes on a road bike")
+        get_similar_gigs(reference.id)
+        get_similar_gigs(taken.id)
+        student = User(uid="similar_student", name="Similar Student",
+                       email="similar_student@test.com", role="student")
+        db_session.add(student)
+        db_session.commit()
+        application = create_application(student.id, taken.id)
+
+        select_candidate(application.id, people[0])
+
+        assert GigSimilarityBand.query.filter_by(gig_id=taken.id).count() == 0
+        assert _cached(reference.id) == [] and _cached(taken.id) == []
+        assert get_similar_gigs(reference.id) == []
+
+    def test_stale_cached_rows_are_replaced(self, db_session, people):
+        reference = _approved(people, "Dog walking", "Walk a friendly dog every morning")
+        gone = _approved(people, "Dog walking", "Walk a friendly dog every evening")
+        get_similar_gigs(reference.id)
+        # Closed outside the services: the cached row survives
+        db_session.get(Gig, gone.id).status = "closed"
+        db_session.commit()
+        fresh = _approved(people, "Dog walking", "Walk a friendly dog every afternoon")
+        GigNeighbor.query.delete()
+        db_session.add(GigNeighbor(gig_id=reference.id, rank=0, neighbor_id=gone.id, score=1.0))
+        db_session.commit()
+
+        assert [gig.id for gig in get_similar_gigs(reference.id)] == [fresh.id]
+        assert _cached(reference.id) == [fresh.id]
+
+    def test_delete_and_rebuild(self, db_session, people):
+        reference = _approved(people, "Math tutoring", "Algebra tutoring for high school students")
+        other = _approved(people, "Math tutoring", "Algebra and geometry tutoring for students")
+        get_similar_gigs(reference.id)
+
+        delete_gig(other.id)
+        assert _cached(reference.id) == []
+
+        GigSimilarityBand.query.delete()
+        db_session.commit()
+        assert rebuild_similarity_index(batch_size=1) == 1
+        assert GigSimilarityBand.query.filter_by(gig_id=reference.id).count() == SIGNATURE_BANDS
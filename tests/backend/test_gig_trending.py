@@ -0,0 +1,149 @@
+"""
+Tests for decayed trending gigs
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Gig, GigActivityBucket, TrendingGig, TrendingRefresh, User
+from app.services import trending_service
+from app.services.application_service import create_application
+from app.services.saved_gigs_service import save_gig
+from app.services.trending_service import (
+    ViewBuffer,
+    bucket_start,
+    compute_trending,
+    record_activity,
+    refresh_trending,
+    trending_gigs,
+    view_buffer,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def gigs(db_session):
+    provider = User(uid="trend_provider", name="Trend Provider",
+                    email="trend_provider@test.com", role="provider")
+    student = User(uid="trend_student", name="Trend Student",
+                   email="trend_student@test.com", role="student")
+    db_session.add_all([provider, student])
+    db_session.flush()
+    gigs = [
+        Gig(title=f"Trend gig {i}", description="Odd job", provider_id=provider.id,
+            approval_status="approved", status="open")
+        for i in range(3)
+    ]
+    db_session.add_all(gigs)
+    db_session.commit()
+    return student.id, [gig.id for gig in gigs]
+
+
+def _bucket(gig_id):
+    return GigActivityBucket.query.filter_by(gig_id=gig_id).one()
+
+
+class TestActivityBuckets:
+    """Test bucket maintenance from writes and views"""
+
+    def test_applications_and_saves_increment_the_hour(self, gigs):
+        student_id, gig_ids = gigs
+        create_application(student_id, gig_ids[0])
+        save_gig(student_id, gig_ids[0])
+
+        bucket = _bucket(gig_ids[0])
+        assert (bucket.applications, bucket.saves, bucket.views) == (1, 1, 0)
+        assert bucket.bucket_start == bucket_start(datetime.utcnow())
+
+    def test_views_are_buffered(self, app, gigs):
+        _, gig_ids = gigs
+        app.config["TRENDING_VIEW_FLUSH_SECONDS"] = 60
+        clock = FakeClock()
+        buffer = ViewBuffer(clock=clock)
+
+        buffer.record(gig_ids[1])
+        buffer.record(gig_ids[1])
+        assert GigActivityBucket.query.count() == 0
+
+        clock.now += 61
+        buffer.record(gig_ids[1])
+        assert _bucket(gig_ids[1]).views == 3
+
+    def test_detail_views_are_counted(self, app, client, db_session, gigs):
+        _, gig_ids = gigs
+        # Drop views other tests left in the shared buffer
+        view_buffer.flush()
+        GigActivityBucket.query.delete()
+        db_session.commit()
+        app.config["TRENDING_VIEW_FLUSH_SECONDS"] = 0
+
+        client.get(f"/api/gigs/{gig_ids[2]}")
+        client.get(f"/api/gigs/{gig_ids[2]}")
+        view_buffer.flush()
+
+        assert _bucket(gig_ids[2]).views == 2
+
+
+class TestTrendingList:
+    """Test decayed scoring and the stored list"""
+
+    def test_recent_activity_outranks_older(self, db_session, gigs):
+        _, gig_ids = gigs
+        now = datetime.utcnow()
+        record_activity(gig_ids[0], applications=2, at=now - timedelta(hours=48))
+        record_activity(gig_ids[1], applications=1, at=now)
+        record_activity(gig_ids[2], views=5, at=now)
+        db_session.commit()
+
+        ranked = compute_trending(now=now)
+
+        assert [gig_id for gig_id, _ in ranked] == [gig_ids[1], gig_ids[0], gig_ids[2]]
+        assert ranked[0][1] == pytest.approx(3.0, rel=0.05)
+        assert ranked[1][1] == pytest.approx(6.0 * 0.25, rel=0.05)
+
+    def test_refresh_prunes_and_endpoint_serves_the_list(self, db_session, client, gigs):
+        _, gig_ids = gigs
+        record_activity(gig_ids[2], saves=1)
+        record_activity(gig_ids[0], saves=1, at=datetime.utcnow() - timedelta(days=10))
+        db_session.commit()
+
+        assert refresh_trending() == {"trending": 1, "buckets_pruned": 1}
+        assert [row.gig_id for row in TrendingGig.query] == [gig_ids[2]]
+
+        response = client.get("/api/gigs/trending?limit=3")
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body[0]["id"] == gig_ids[2]
+        assert body[0]["trending_score"] > 0
+        assert len(body) == 3  # padded with other open gigs
+
+    def test_empty_list_is_not_refreshed_until_stale(self, app, db_session, monkeypatch, gigs):
+        app.config["TRENDING_MAX_AGE"] = 900
+        refreshes = []
+        real_refresh = trending_service.refresh_trending
+
+        def counting_refresh(*args, **kwargs):
+            refreshes.append(1)
+            return real_refresh(*args, **kwargs)
+
+        monkeypatch.setattr(trending_service, "refresh_trending", counting_refresh)
+
+        assert [score for _, score in trending_gigs(3)] == [0.0, 0.0, 0.0]
+        trending_gigs(3)
+        assert len(refreshes) == 1
+        assert TrendingGig.query.count() == 0
+
+        TrendingRefresh.query.update(
+            {"refreshed_at": datetime.utcnow() - timedelta(seconds=901)}
+        )
+        db_session.commit()
+        trending_gigs(3)
+        assert len(refreshes) == 2
@@ -0,0 +1,81 @@
+"""
+Tests for the authenticated-user identity cache
+"""
+
+import pytest
+from flask import g
+from sqlalchemy import event
+
+from app import db
+from app.models import User
+from app.services import admin_service
+from app.services.identity_cache import AuthenticatedUser, identity_cache
+from app.services.utils import require_auth
+
+
+@pytest.fixture
+def cache_enabled(app):
+    app.config["AUTH_USER_CACHE_ENABLED"] = True
+    identity_cache.cache.clear()
+    yield
+    app.config["AUTH_USER_CACHE_ENABLED"] = False
+    identity_cache.cache.clear()
+
+
+@pytest.fixture
+def users(db_session):
+    student = User(uid="identity_student", name="Identity Student",
+                   email="identity_student@test.com", role="student")
+    admin = User(uid="identity_admin", name="Identity Admin",
+                 email="identity_admin@test.com", role="admin")
+    db_session.add_all([student, admin])
+    db_session.commit()
+    return {"student": student, "admin": admin}
+
+
+def _authenticate(app, uid, role):
+    @require_auth
+    def view():
+        return g.current_user
+
+    with app.test_request_context(headers={"Authorization": f"Bearer test:{uid}:{role}"}):
+        return view()
+
+
+class TestIdentityCache:
+    """Test the cached require_auth path"""
+
+    def test_repeat_callers_skip_users_lookup(self, app, cache_enabled, users):
+        first = _authenticate(app, "identity_student", "student")
+        assert isinstance(first, User)
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            second = _authenticate(app, "identity_student", "student")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert isinstance(second, AuthenticatedUser)
+        assert (second.id, second.role) == (users["student"].id, "student")
+        assert second.is_role("student")
+        assert statements == []
+
+    def test_other_attributes_load_the_row(self, app, cache_enabled, users):
+        _authenticate(app, "identity_student", "student")
+        cached = _authenticate(app, "identity_student", "student")
+        assert cached.email == "identity_student@test.com"
+
+    def test_role_change_invalidates(self, app, cache_enabled, users):
+        _authenticate(app, "identity_student", "student")
+        admin_service.update_user_role(users["student"].id, "provider", users["admin"].id)
+        refreshed = _authenticate(app, "identity_student", "student")
+        assert refreshed.role == "provider"
+
+    def test_disabled_by_config(self, app, users):
+        _authenticate(app, "identity_student", "student")
+        assert isinstance(_authenticate(app, "identity_student", "student"), User)
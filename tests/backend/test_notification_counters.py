@@ -0,0 +1,106 @@
+"""
+Tests for maintained unread notification counters
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Notification, NotificationCounter, User
+from app.services.notification_counters import reconcile_notification_counters
+from app.services.notification_service import (
+    create_notification,
+    fan_out_notification,
+    get_unread_notification_count,
+    mark_all_notifications_read,
+    mark_notification_read,
+)
+from app.services.retention_service import archive_notifications
+
+
+@pytest.fixture
+def users(db_session):
+    users = [
+        User(uid=f"counter_user_{i}", name=f"Counter User {i}",
+             email=f"counter{i}@test.com", role="student")
+        for i in range(2)
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+    return [user.id for user in users]
+
+
+class TestUnreadCounters:
+    """Test counter initialization and maintenance"""
+
+    def test_lazy_initialization_counts_existing_rows(self, db_session, users):
+        db_session.add_all([
+            Notification(user_id=users[0], type="t", title="a", message="m"),
+            Notification(user_id=users[0], type="t", title="b", message="m", read=True),
+        ])
+        db_session.commit()
+
+        assert db_session.get(NotificationCounter, users[0]) is None
+        assert get_unread_notification_count(users[0]) == 1
+        assert db_session.get(NotificationCounter, users[0]).unread_count == 1
+
+    def test_writes_keep_the_counter_current(self, users):
+        assert get_unread_notification_count(users[0]) == 0
+
+        first = create_notification(users[0], "t", "a", "m")
+        create_notification(users[0], "t", "b", "m")
+        fan_out_notification(users, "announcement", "Hello", "Everyone")
+        assert get_unread_notification_count(users[0]) == 3
+
+        mark_notification_read(first.id, users[0])
+        mark_notification_read(first.id, users[0])  # already read: no double decrement
+        assert get_unread_notification_count(users[0]) == 2
+
+        assert mark_all_notifications_read(users[0]) == 2
+        assert get_unread_notification_count(users[0]) == 0
+
+    def test_archival_decrements(self, db_session, users):
+        get_unread_notification_count(users[0])
+        old = create_notification(users[0], "t", "old", "m")
+        old.created_at = datetime.utcnow() - timedelta(days=365)
+        db_session.commit()
+
+        archive_notifications()
+
+        assert get_unread_notification_count(users[0]) == 0
+
+    def test_reconcile_repairs_drift(self, db_session, users):
+        for user_id in users:
+            get_unread_notification_count(user_id)
+        db_session.add(Notification(user_id=users[1], type="t", title="raw", message="m"))
+        db_session.commit()
+
+        assert reconcile_notification_counters() == 1
+        assert get_unread_notification_count(users[1]) == 1
+        assert reconcile_notification_counters() == 0
+
+    def test_racing_initialization_keeps_the_first_row(self, db_session, users, monkeypatch):
+        # Another request inserted the row after this one looked it up
+        db_session.add(NotificationCounter(user_id=users[0], unread_count=7))
+        db_session.commit()
+        db_session.expire_all()
+        real_get = db_session.get
+        lookups = []
+
+        def stale_get(model, key):
+            lookups.append(key)
+            return None if len(lookups) == 1 else real_get(model, key)
+
+        monkeypatch.setattr(db_session, "get", stale_get)
+        assert get_unread_notification_count(users[0]) == 7
+
+    def test_writes_touch_updated_at(self, db_session, users):
+        get_unread_notification_count(users[0])
+        counter = db_session.get(NotificationCounter, users[0])
+        counter.updated_at = datetime(2000, 1, 1)
+        db_session.commit()
+
+        create_notification(users[0], "t", "a", "m")
+
+        db_session.expire_all()
+        assert db_session.get(NotificationCounter, users[0]).updated_at > datetime(2000, 1, 1)
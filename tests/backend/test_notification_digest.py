@@ -0,0 +1,134 @@
+"""
+Tests for gig update coalescing and email digests
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Gig, Notification, NotificationDigestItem, User
+from app.models.notification_preferences import EmailQueue
+from app.services.notification_digest import DigestWorker
+from app.services.notification_service import (
+    PRIORITY_LOW,
+    notify_gig_update,
+    update_notification_preference,
+)
+
+
+@pytest.fixture
+def gig_and_students(db_session):
+    provider = User(uid="digest_provider", name="Digest Provider",
+                    email="digest_provider@test.com", role="provider")
+    students = [
+        User(uid=f"digest_student_{i}", name=f"Digest Student {i}",
+             email=f"digest_student{i}@test.com", role="student")
+        for i in range(3)
+    ]
+    db_session.add_all([provider, *students])
+    db_session.commit()
+    gig = Gig(title="Mural", description="Paint a mural", provider_id=provider.id,
+              status="open", approval_status="approved")
+    db_session.add(gig)
+    db_session.commit()
+    return gig.id, [student.id for student in students]
+
+
+class TestCoalescing:
+    """Test merging of repeated gig updates"""
+
+    def test_repeat_updates_merge_into_one_notification(self, gig_and_students):
+        gig_id, student_ids = gig_and_students
+        for update in ("details_updated", "details_updated", "status_changed_closed"):
+            notify_gig_update(student_ids, gig_id, update)
+
+        notifications = Notification.query.filter_by(type="gig_update").all()
+        assert len(notifications) == 3
+        assert {n.group_count for n in notifications} == {3}
+        assert notifications[0].message.endswith("Latest: status_changed_closed.")
+
+    def test_read_or_old_notifications_are_not_merged(self, db_session, gig_and_students):
+        gig_id, student_ids = gig_and_students
+        notify_gig_update(student_ids, gig_id, "details_updated")
+        first = Notification.query.filter_by(user_id=student_ids[0]).one()
+        first.read = True
+        second = Notification.query.filter_by(user_id=student_ids[1]).one()
+        second.created_at = datetime.utcnow() - timedelta(hours=1)
+        db_session.commit()
+
+        notify_gig_update(student_ids, gig_id, "details_updated")
+
+        counts = {user_id: Notification.query.filter_by(user_id=user_id).count()
+                  for user_id in student_ids}
+        assert counts == {student_ids[0]: 2, student_ids[1]: 2, student_ids[2]: 1}
+
+    def test_window_zero_disables_merging(self, app, gig_and_students):
+        gig_id, student_ids = gig_and_students
+        app.config["NOTIFICATION_COALESCE_WINDOW"] = 0
+        try:
+            notify_gig_update(student_ids[:1], gig_id, "a")
+            notify_gig_update(student_ids[:1], gig_id, "b")
+        finally:
+            app.config["NOTIFICATION_COALESCE_WINDOW"] = 600
+        assert Notification.query.count() == 2
+
+
+class TestDigests:
+    """Test periodic digest emails"""
+
+    def test_digest_replaces_per_event_emails(self, db_session, gig_and_students):
+        gig_id, student_ids = gig_and_students
+        update_notification_preference(student_ids[0], "gig_update", email_enabled=True)
+        for _ in range(5):
+            notify_gig_update(student_ids, gig_id, "details_updated")
+
+        assert EmailQueue.query.count() == 0
+        assert DigestWorker().process_batch()["claimed"] == 0  # not due yet
+
+        Notification.query.update({Notification.created_at: datetime.utcnow() - timedelta(hours=2)})
+        db_session.commit()
+        results = DigestWorker().process_batch()
+
+        assert results == {"claimed": 1, "digests": 1, "notifications": 1}
+        email = EmailQueue.query.one()
+        assert email.user_id == student_ids[0]
+        assert email.template == "digest" and email.priority == PRIORITY_LOW
+        assert "5 new updates" in email.body
+        assert Notification.query.filter_by(digest_pending=True).count() == 0
+
+    def test_read_notifications_are_left_out(self, db_session, gig_and_students):
+        gig_id, student_ids = gig_and_students
+        update_notification_preference(student_ids[0], "gig_update", email_enabled=True)
+        notify_gig_update(student_ids[:1], gig_id, "details_updated")
+        Notification.query.update({Notification.read: True})
+        db_session.commit()
+
+        results = DigestWorker(interval=0).process_batch()
+
+        assert results["claimed"] == 1 and results["digests"] == 0
+        assert EmailQueue.query.count() == 0
+        assert Notification.query.filter_by(digest_pending=True).count() == 0
+
+    def test_email_only_recipients_get_digests(self, db_session, gig_and_students):
+        gig_id, student_ids = gig_and_students
+        update_notification_preference(student_ids[0], "gig_update",
+                                       in_app_enabled=False, email_enabled=True)
+        for update in ("details_updated", "status_changed_closed"):
+            notify_gig_update(student_ids, gig_id, update)
+
+        assert Notification.query.filter_by(user_id=student_ids[0]).count() == 0
+        item = NotificationDigestItem.query.one()
+        assert (item.user_id, item.group_count) == (student_ids[0], 2)
+        assert DigestWorker().process_batch()["claimed"] == 0
+
+        NotificationDigestItem.query.update(
+            {NotificationDigestItem.created_at: datetime.utcnow() - timedelta(hours=2)}
+        )
+        db_session.commit()
+        results = DigestWorker().process_batch()
+
+        assert results == {"claimed": 1, "digests": 1, "notifications": 1}
+        email = EmailQueue.query.one()
+        assert email.user_id == student_ids[0]
+        assert "Latest: status_changed_closed." in email.body
+        assert NotificationDigestItem.query.count() == 0
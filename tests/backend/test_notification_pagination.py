@@ -0,0 +1,120 @@
+"""
+Tests for cursor-paginated notification listing
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Gig, Notification, User
+from app.routes import notification_routes
+from app.services.notification_service import notify_gig_update
+
+
+def auth(uid, role="student"):
+    return {"Authorization": f"Bearer test:{uid}:{role}"}
+
+
+@pytest.fixture
+def student(db_session):
+    user = User(uid="paging_student", name="Paging Student",
+                email="paging@test.com", role="student")
+    db_session.add(user)
+    db_session.commit()
+    # Pairs share a timestamp so the id tie breaker is exercised
+    base = datetime.utcnow()
+    db_session.add_all([
+        Notification(user_id=user.id, type="new_gig", title=f"Gig {i}", message="m",
+                     read=i % 3 == 0, created_at=base - timedelta(minutes=i // 2))
+        for i in range(45)
+    ])
+    db_session.commit()
+    return user
+
+
+def _pages(client, student, query):
+    seen, cursor = [], ""
+    while True:
+        response = client.get(f"/api/notifications?cursor={cursor}&{query}",
+                              headers=auth(student.uid))
+        assert response.status_code == 200
+        body = response.get_json()
+        seen.append(body["items"])
+        if not body["has_more"]:
+            assert body["next_cursor"] is None
+            return seen
+        cursor = body["next_cursor"]
+
+
+class TestNotificationPagination:
+    """Test paged mode of GET /api/notifications"""
+
+    def test_pages_cover_every_notification_once(self, client, student):
+        pages = _pages(client, student, "limit=20")
+
+        assert [len(page) for page in pages] == [20, 20, 5]
+        ids = [item["id"] for page in pages for item in page]
+        expected = [n.id for n in Notification.query.filter_by(user_id=student.id)
+                    .order_by(Notification.created_at.desc(), Notification.id.desc())]
+        assert ids == expected
+
+    def test_unread_only(self, client, student):
+        pages = _pages(client, student, "limit=10&unread_only=true")
+
+        items = [item for page in pages for item in page]
+        assert len(items) == 30
+        assert not any(item["read"] for item in items)
+
+    def test_compact_items(self, client, student):
+        response = client.get("/api/notifications?limit=1&compact=true",
+                              headers=auth(student.uid))
+
+        item = response.get_json()["items"][0]
+        assert set(item) == {"id", "type", "title", "read", "related_gig_id", "count", "created_at"}
+
+    def test_limit_is_capped(self, client, student):
+        response = client.get("/api/notifications?limit=500", headers=auth(student.uid))
+        assert response.get_json()["per_page"] == 100
+
+    def test_invalid_cursor(self, client, student):
+        response = client.get("/api/notifications?cursor=not-a-cursor",
+                              headers=auth(student.uid))
+        assert response.status_code == 400
+
+    def test_legacy_list_unchanged(self, client, student):
+        response = client.get("/api/notifications", headers=auth(student.uid))
+        assert len(response.get_json()) == 45
+
+    def test_merged_update_changes_etag(self, client, db_session, student):
+        provider = User(uid="paging_provider", name="Paging Provider",
+                        email="paging_provider@test.com", role="provider")
+        db_session.add(provider)
+        db_session.commit()
+        gig = Gig(title="Logo", description="d", provider_id=provider.id,
+                  status="open", approval_status="approved")
+        db_session.add(gig)
+        db_session.commit()
+        notify_gig_update([student.id], gig.id, "details_updated")
+
+        etag = client.get("/api/notifications?limit=5", headers=auth(student.uid)).headers["ETag"]
+        notify_gig_update([student.id], gig.id, "details_updated")
+        again = client.get("/api/notifications?limit=5",
+                           headers={**auth(student.uid), "If-None-Match": etag})
+
+        assert again.status_code == 200
+        assert again.get_json()["items"][0]["count"] == 2
+
+    def test_paged_validator_skips_history_aggregates(self, client, student, monkeypatch):
+        def aggregate(*args, **kwargs):
+            raise AssertionError("paged mode must not aggregate the whole history")
+
+        monkeypatch.setattr(notification_routes, "get_notification_state", aggregate)
+        first = client.get("/api/notifications?limit=5", headers=auth(student.uid))
+        etag = first.headers["ETag"]
+        newest = first.get_json()["items"][0]["id"]
+
+        assert client.get("/api/notifications?limit=5",
+                          headers={**auth(student.uid), "If-None-Match": etag}).status_code == 304
+        client.patch(f"/api/notifications/{newest}/read", headers=auth(student.uid))
+        assert client.get("/api/notifications?limit=5",
+                          headers={**auth(student.uid), "If-None-Match": etag}).status_code == 200
@@ -0,0 +1,181 @@
+"""
+Tests for the notification event stream
+"""
+
+import json
+import threading
+
+import pytest
+
+from app.models import Gig, User
+from app.services.notification_service import create_notification, notify_gig_update
+from app.services.notification_stream import NotificationHub, notification_hub
+
+
+def _events(body):
+    """Parse an SSE body into (id, event, data) tuples, skipping the retry hint."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        if "event" in fields:
+            events.append((fields.get("id"), fields["event"], fields.get("data")))
+    return events
+
+
+class TestNotificationHub:
+    """Test the in-process fan-out hub"""
+
+    def test_publish_wakes_only_that_users_subscriptions(self):
+        hub = NotificationHub()
+        first, second = hub.subscribe(1), hub.subscribe(1)
+        other = hub.subscribe(2)
+
+        hub.publish(1)
+
+        assert first.wait(0) and second.wait(0)
+        assert not other.wait(0)
+
+    def test_wake_ups_coalesce(self):
+        hub = NotificationHub()
+        subscription = hub.subscribe(1)
+        hub.publish(1)
+        hub.publish(1)
+
+        assert subscription.wait(0)
+        assert not subscription.wait(0)
+
+    def test_publish_from_another_thread(self):
+        hub = NotificationHub()
+        subscription = hub.subscribe(1)
+        timer = threading.Timer(0.05, hub.publish, args=(1,))
+        timer.start()
+        try:
+            assert subscription.wait(2)
+        finally:
+            timer.cancel()
+
+    def test_updated_ids_accumulate_until_taken(self):
+        hub = NotificationHub()
+        subscription = hub.subscribe(1)
+        hub.publish(1, updated_ids=[7])
+        hub.publish(1, updated_ids=[3, 7])
+
+        assert subscription.wait(0)
+        assert subscription.take_updated() == [3, 7]
+        assert subscription.take_updated() == []
+
+    def test_unsubscribe(self):
+        hub = NotificationHub()
+        subscription = hub.subscribe(1)
+        assert hub.connection_count() == 1
+        hub.unsubscribe(subscription)
+        hub.publish(1)
+        assert hub.connection_count() == 0
+        assert not subscription.wait(0)
+
+
+class TestStreamEndpoint:
+    """Test /api/notifications/stream"""
+
+    @pytest.fixture(autouse=True)
+    def short_streams(self, app):
+        app.config["NOTIFICATION_STREAM_HEARTBEAT"] = 0.05
+        app.config["NOTIFICATION_STREAM_MAX_DURATION"] = 0.12
+        yield
+        app.config["NOTIFICATION_STREAM_HEARTBEAT"] = 15
+        app.config["NOTIFICATION_STREAM_MAX_DURATION"] = 300
+
+    @pytest.fixture
+    def student(self, db_session):
+        user = User(uid="stream_student", name="Stream Student",
+                    email="stream_student@test.com", role="student")
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    def test_create_notification_publishes(self, student):
+        subscription = notification_hub.subscribe(student.id)
+        try:
+            create_notification(student.id, "application_status", "Update", "Accepted")
+            assert subscription.wait(0)
+        finally:
+            notification_hub.unsubscribe(subscription)
+
+    def test_resume_from_last_event_id(self, client, student):
+        # The stream releases the session, so keep plain ids rather than instances
+        first = create_notification(student.id, "gig_approved", "Approved", "Live now").id
+        second = create_notification(student.id, "gig_update", "Updated", "Deadline changed").id
+        third = create_notification(student.id, "application_status", "Status", "Accepted").id
+
+        response = client.get(
+            "/api/notifications/stream",
+            headers={
+                "Authorization": "Bearer test:stream_student:student",
+                "Last-Event-ID": str(first),
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        assert response.headers["Cache-Control"] == "no-cache"
+        events = _events(response.get_data(as_text=True))
+        assert [(e[0], e[1]) for e in events[:2]] == [
+            (str(second), "gig_updated"),
+            (str(third), "notification"),
+        ]
+        assert all(event[1] == "heartbeat" for event in events[2:])
+
+    def test_merged_update_is_resent(self, client, db_session, monkeypatch, student):
+        gig = Gig(title="Stream gig", description="Odd job", provider_id=student.id,
+                  status="open", approval_status="approved")
+        db_session.add(gig)
+        db_session.commit()
+        gig_id = gig.id
+        notification_id = notify_gig_update([student.id], gig_id, "details_updated")[0].id
+
+        subscription = notification_hub.subscribe(student.id)
+        try:
+            notify_gig_update([student.id], gig_id, "deadline_changed")
+            assert subscription.take_updated() == [notification_id]
+        finally:
+            notification_hub.unsubscribe(subscription)
+
+        # Replay that publish to the stream's own subscription
+        subscribe = notification_hub.subscribe
+
+        def subscribed_with_update(user_id):
+            stream_subscription = subscribe(user_id)
+            stream_subscription.notify([notification_id])
+            return stream_subscription
+
+        monkeypatch.setattr(notification_hub, "subscribe", subscribed_with_update)
+        response = client.get(
+            "/api/notifications/stream",
+            headers={
+                "Authorization": "Bearer test:stream_student:student",
+                "Last-Event-ID": str(notification_id),
+            },
+        )
+
+        events = _events(response.get_data(as_text=True))
+        assert events[0][:2] == (None, "notification_updated")
+        payload = json.loads(events[0][2])
+        assert (payload["id"], payload["count"]) == (notification_id, 2)
+        assert payload["message"].endswith("Latest: deadline_changed.")
+
+    def test_fresh_connection_skips_backlog(self, client, student):
+        create_notification(student.id, "gig_approved", "Approved", "Live now")
+
+        response = client.get(
+            "/api/notifications/stream?access_token=test:stream_student:student"
+        )
+
+        assert response.status_code == 200
+        body = response.get_data(as_text=True)
+        assert body.startswith("retry: ")
+        events = _events(body)
+        assert events and all(event[1] == "heartbeat" for event in events)
+
+    def test_requires_authentication(self, client):
+        response = client.get("/api/notifications/stream")
+        assert response.status_code == 401
@@ -299,8 +299,13 @@ class TestEmailNotificationSystem:
             message="Test failure"
         )
         
-        # Process multiple times to trigger failure after max attempts
+        # Process multiple times to trigger failure after max attempts,
+        # making each scheduled retry due straight away
         for _ in range(3):
+            EmailQueue.query.filter_by(id=email_id).update(
+                {EmailQueue.next_attempt_at: datetime.utcnow()}
+            )
+            db_session.commit()
             process_email_queue(limit=10)
         
         # Verify email marked as failed after max attempts
@@ -400,18 +405,20 @@ class TestBulkNotificationSystem:
         db_session.commit()
         return users
     
-    @patch('app.services.notification_service.create_notification_with_preferences')
-    def test_send_bulk_notification(self, mock_create, db_session, multiple_users):
+    def test_send_bulk_notification(self, db_session, multiple_users):
         """Test sending bulk notifications"""
         admin = multiple_users[-1]  # Last user is admin
         target_users = multiple_users[:-1]  # All except admin
         
-        mock_create.return_value = {
-            "created": [
-                {"type": "in_app", "id": 1},
-                {"type": "email", "id": 2}
-            ]
-        }
+        # One recipient opted out of announcement emails
+        db_session.add(NotificationPreference(
+            user_id=target_users[0].id,
+            notification_type="system_announcement",
+            email_enabled=False,
+            push_enabled=True,
+            in_app_enabled=True
+        ))
+        db_session.commit()
         
         user_ids = [user.id for user in target_users]
         
@@ -424,12 +431,44 @@ class TestBulkNotificationSystem:
         )
         
         assert results["total_users"] == 3
-        assert results["in_app_sent"] == 3  # 3 users * 1 in_app each
-        assert results["emails_queued"] == 3  # 3 users * 1 email each
+        assert results["in_app_sent"] == 3
+        assert results["emails_queued"] == 2
+        assert results["push_queued"] == 3
         assert len(results["errors"]) == 0
         
-        # Verify mock was called for each user
-        assert mock_create.call_count == 3
+        assert Notification.query.filter_by(type="system_announcement").count() == 3
+        assert EmailQueue.query.filter(EmailQueue.user_id.in_(user_ids)).count() == 2
+        assert PushNotification.query.filter(PushNotification.user_id.in_(user_ids)).count() == 3
+    
+    def test_bulk_notification_statements_do_not_grow_per_user(self, db_session, multiple_users):
+        """Test the fan-out issues a fixed number of statements per chunk"""
+        from sqlalchemy import event
+        from app import db
+        
+        admin = multiple_users[-1]
+        user_ids = [user.id for user in multiple_users[:-1]]
+        statements = []
+        
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+        
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            results = send_bulk_notification(
+                user_ids=user_ids + [999999],
+                notification_type="system_announcement",
+                title="Welcome back",
+                message="New term starts Monday",
+                admin_id=admin.id
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+        
+        assert results["in_app_sent"] == 3
+        assert results["errors"] == ["User 999999: User with id 999999 not found"]
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        # notifications, email_queue, push_notifications and the audit log entry
+        assert len(inserts) <= 4
 
 
 class TestNotificationUtilities:
@@ -0,0 +1,153 @@
+"""
+Tests for the notification outbox
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.models import Gig, Notification, OutboxEvent, User
+from app.models.notification_preferences import EmailQueue
+from app.services import outbox_service
+from app.services.application_service import create_application
+from app.services.exceptions import ValidationError
+from app.services.gig_service import create_gig
+from app.services.notification_stream import notification_hub
+from app.services.outbox_service import OutboxDispatcher, dispatch_outbox, enqueue_event
+
+
+@pytest.fixture
+def people(db_session):
+    provider = User(uid="outbox_provider", name="Outbox Provider",
+                    email="outbox_provider@test.com", role="provider")
+    student = User(uid="outbox_student", name="Outbox Student",
+                   email="outbox_student@test.com", role="student")
+    admins = [
+        User(uid=f"outbox_admin_{i}", name=f"Outbox Admin {i}",
+             email=f"outbox_admin{i}@test.com", role="admin")
+        for i in range(3)
+    ]
+    db_session.add_all([provider, student, *admins])
+    db_session.commit()
+    return {"provider": provider.id, "student": student.id, "admins": [a.id for a in admins]}
+
+
+class TestOutbox:
+    """Test outbox writes and dispatch"""
+
+    def test_create_gig_records_event_instead_of_notifying(self, people):
+        gig = create_gig(people["provider"], {"title": "Logo design", "description": "Need a logo"})
+
+        event = OutboxEvent.query.one()
+        assert (event.event_type, event.payload, event.status) == (
+            "gig_submitted", {"gig_id": gig.id}, "pending"
+        )
+        assert Notification.query.count() == 0
+
+        results = dispatch_outbox()
+
+        assert results["dispatched"] == 1
+        notified = {n.user_id for n in Notification.query.filter_by(type="gig_pending")}
+        assert notified == set(people["admins"])
+        event = OutboxEvent.query.one()
+        assert event.status == "dispatched" and event.dispatched_at is not None
+        assert event.claimed_by is None
+
+    def test_application_notifies_provider_and_admins(self, db_session, people):
+        gig = Gig(title="Tutoring", description="Math tutoring", provider_id=people["provider"],
+                  status="open", approval_status="approved")
+        db_session.add(gig)
+        db_session.commit()
+
+        application = create_application(people["student"], gig.id, "Keen")
+
+        assert {e.event_type for e in OutboxEvent.query} == {"application_submitted", "application_received"}
+        OutboxDispatcher().drain()
+
+        received = Notification.query.filter_by(type="application_received").all()
+        assert [n.user_id for n in received] == [people["provider"]]
+        assert received[0].related_application_id == application.id
+        submitted = Notification.query.filter_by(type="application_submitted").all()
+        assert {n.user_id for n in submitted} == set(people["admins"])
+
+    def test_event_is_rolled_back_with_the_write(self, db_session, people):
+        enqueue_event("gig_submitted", {"gig_id": 1})
+        db_session.rollback()
+
+        assert OutboxEvent.query.count() == 0
+
+    def test_failed_handler_is_retried_then_parked(self, db_session, people, monkeypatch):
+        gig = create_gig(people["provider"], {"title": "Website", "description": "Landing page"})
+
+        def broken(payload):
+            Notification.query.session.add(
+                Notification(user_id=people["provider"], type="gig_pending", title="t", message="m")
+            )
+            raise RuntimeError("smtp down")
+
+        monkeypatch.setitem(outbox_service.HANDLERS, "gig_submitted", broken)
+        for attempt in range(1, 4):
+            OutboxEvent.query.update({OutboxEvent.available_at: datetime.utcnow()})
+            db_session.commit()
+            results = dispatch_outbox()
+            assert results["errors"] == [f"Event {OutboxEvent.query.one().id}: smtp down"]
+
+        event = OutboxEvent.query.one()
+        assert event.status == "failed" and event.attempts == 3
+        assert event.last_error == "smtp down"
+        assert event.payload == {"gig_id": gig.id}
+        # The handler's partial work was rolled back each time
+        assert Notification.query.count() == 0
+
+    def test_handler_failure_after_its_work_keeps_the_event_pending(
+        self, db_session, people, monkeypatch
+    ):
+        create_gig(people["provider"], {"title": "Flyer", "description": "Club flyer"})
+        real_handler = outbox_service.HANDLERS["gig_submitted"]
+
+        def fails_after_work(payload):
+            real_handler(payload)
+            raise RuntimeError("late failure")
+
+        monkeypatch.setitem(outbox_service.HANDLERS, "gig_submitted", fails_after_work)
+        assert dispatch_outbox()["errors"]
+
+        event = OutboxEvent.query.one()
+        assert (event.status, event.attempts) == ("pending", 1)
+        assert Notification.query.count() == 0
+        assert EmailQueue.query.count() == 0
+
+        monkeypatch.setitem(outbox_service.HANDLERS, "gig_submitted", real_handler)
+        OutboxEvent.query.update({OutboxEvent.available_at: datetime.utcnow()})
+        db_session.commit()
+        subscription = notification_hub.subscribe(people["admins"][0])
+        try:
+            assert dispatch_outbox()["dispatched"] == 1
+            assert subscription.wait(0)
+        finally:
+            notification_hub.unsubscribe(subscription)
+        assert Notification.query.count() == len(people["admins"])
+
+    def test_failed_event_waits_for_backoff(self, db_session, people, monkeypatch):
+        create_gig(people["provider"], {"title": "Poster", "description": "Event poster"})
+        monkeypatch.setitem(outbox_service.HANDLERS, "gig_submitted",
+                            lambda payload: 1 / 0)
+
+        assert dispatch_outbox()["failed"] == 0
+        assert dispatch_outbox()["claimed"] == 0
+        assert OutboxEvent.query.one().available_at > datetime.utcnow()
+
+    def test_unknown_event_type(self, app):
+        with pytest.raises(ValidationError):
+            enqueue_event("gig_exploded", {})
+
+    def test_process_outbox_endpoint(self, client, people):
+        create_gig(people["provider"], {"title": "Video edit", "description": "Short clip"})
+
+        response = client.post(
+            "/api/notifications/admin/process-outbox",
+            headers={"Authorization": "Bearer test:outbox_admin_0:admin"},
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["dispatched"] == 1
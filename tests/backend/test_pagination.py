@@ -0,0 +1,87 @@
+"""
+Tests for cursor (keyset) pagination
+"""
+
+import pytest
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+
+from app.models import User, Gig
+from app.services.exceptions import ValidationError
+from app.services.gig_service import browse_gigs
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+class TestCursorEncoding:
+    """Test opaque cursor round-trips"""
+
+    def test_round_trip_typed_values(self):
+        values = [datetime(2025, 1, 2, 3, 4, 5), date(2025, 2, 1), Decimal("12.50"), 42, "title"]
+        cursor = encode_cursor("newest", values)
+        assert decode_cursor(cursor, "newest", len(values)) == values
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValidationError):
+            decode_cursor("not-a-cursor", "newest", 2)
+
+    def test_rejects_cursor_from_other_sort(self):
+        cursor = encode_cursor("title", ["a", 1])
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor, "newest", 2)
+
+
+class TestBrowseGigsCursorMode:
+    """Test keyset pagination through the gig feed"""
+
+    @pytest.fixture
+    def many_gigs(self, db_session):
+        provider = User(
+            uid="cursor_provider",
+            name="Cursor Provider",
+            email="cursor_provider@test.com",
+            role="provider"
+        )
+        db_session.add(provider)
+        db_session.commit()
+
+        base_time = datetime(2025, 1, 1)
+        gigs = [
+            Gig(
+                title=f"Gig {i}",
+                description="Paginated gig",
+                provider_id=provider.id,
+                approval_status="approved",
+                # Pairs of gigs share a timestamp to exercise the id tie breaker
+                created_at=base_time - timedelta(minutes=i // 2),
+            )
+            for i in range(25)
+        ]
+        db_session.add_all(gigs)
+        db_session.commit()
+        return gigs
+
+    def _walk(self, filters, per_page=10):
+        seen, cursor, pages = [], "", 0
+        while cursor is not None:
+            page = browse_gigs(filters, {"per_page": per_page, "cursor": cursor})
+            assert "total" not in page
+            seen.extend(gig.id for gig in page["items"])
+            cursor = page["next_cursor"]
+            pages += 1
+        return seen, pages
+
+    def test_walks_every_gig_once_newest_first(self, many_gigs):
+        seen, pages = self._walk({})
+        assert pages == 3
+        assert len(seen) == len(set(seen)) == 25
+        expected = sorted(many_gigs, key=lambda gig: (gig.created_at, gig.id), reverse=True)
+        assert seen == [gig.id for gig in expected]
+
+    def test_walks_by_title(self, many_gigs):
+        seen, _ = self._walk({"sort": "title"})
+        expected = sorted(many_gigs, key=lambda gig: (gig.title, gig.id))
+        assert seen == [gig.id for gig in expected]
+
+    def test_rating_sort_not_supported(self, many_gigs):
+        with pytest.raises(ValidationError):
+            browse_gigs({"sort": "rating"}, {"cursor": ""})
@@ -0,0 +1,92 @@
+"""
+Tests for notification preference resolution
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models import User
+from app.models.notification_preferences import NotificationPreference
+from app.services.notification_service import (
+    create_notification_with_preferences,
+    update_notification_preference,
+)
+from app.services.preference_resolver import ChannelSettings, preference_resolver
+
+
+class CountingStatements:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(db.engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(db.engine, "before_cursor_execute", self)
+
+
+class TestPreferenceResolver:
+    """Test cached, default-aware preference lookups"""
+
+    @pytest.fixture
+    def users(self, db_session):
+        users = [
+            User(uid=f"pref_resolver_{i}", name=f"Resolver User {i}",
+                 email=f"resolver{i}@test.com", role="student")
+            for i in range(3)
+        ]
+        db_session.add_all(users)
+        db_session.commit()
+        return users
+
+    @pytest.fixture
+    def cache_enabled(self, app):
+        app.config["NOTIFICATION_PREFERENCE_CACHE_ENABLED"] = True
+        preference_resolver.cache.clear()
+        yield
+        app.config["NOTIFICATION_PREFERENCE_CACHE_ENABLED"] = False
+        preference_resolver.cache.clear()
+
+    def test_defaults_apply_without_writing_rows(self, users):
+        user = users[0]
+
+        assert preference_resolver.resolve(user.id, "gig_update") == ChannelSettings(False, True, True)
+        assert preference_resolver.resolve(user.id, "brand_new_type") == ChannelSettings(True, True, True)
+
+        result = create_notification_with_preferences(user.id, "gig_update", "Updated", "Gig changed")
+        assert [item["type"] for item in result["created"]] == ["in_app", "push"]
+        assert NotificationPreference.query.filter_by(user_id=user.id).count() == 0
+
+    def test_cached_until_preferences_change(self, users, cache_enabled):
+        user = users[0]
+        update_notification_preference(user.id, "application_status", email_enabled=False)
+        preference_resolver.resolve(user.id, "application_status")
+
+        with CountingStatements() as statements:
+            settings = preference_resolver.resolve(user.id, "application_status")
+            preference_resolver.resolve(user.id, "rating_received")
+        assert statements.count == 0
+        assert settings.email_enabled is False
+
+        update_notification_preference(user.id, "application_status", email_enabled=True)
+        assert preference_resolver.resolve(user.id, "application_status").email_enabled is True
+
+    def test_resolve_many_uses_one_query(self, db_session, users):
+        db_session.add(NotificationPreference(
+            user_id=users[1].id, notification_type="gig_update",
+            email_enabled=True, push_enabled=False, in_app_enabled=True,
+        ))
+        db_session.commit()
+        user_ids = [user.id for user in users]
+
+        with CountingStatements() as statements:
+            resolved = preference_resolver.resolve_many(user_ids, "gig_update")
+
+        assert statements.count == 1
+        assert resolved[user_ids[0]] == ChannelSettings(False, True, True)
+        assert resolved[user_ids[1]] == ChannelSettings(True, False, True)
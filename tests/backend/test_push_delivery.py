@@ -0,0 +1,139 @@
+"""
+Tests for batched push delivery
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from firebase_admin import exceptions as fb_exceptions, messaging
+
+from app import firebase
+from app.models import DeviceToken, User
+from app.models.notification_preferences import PushNotification
+from app.services.delivery_worker import QueueWorker
+from app.services.push_delivery import (
+    FCMTransport,
+    FakePushTransport,
+    TokenResult,
+    deliver_pushes,
+    get_push_transport,
+)
+
+
+def _row(row_id, token, title="Title", body="Body", data=None, user_id=1):
+    return SimpleNamespace(id=row_id, user_id=user_id, device_token=token,
+                           title=title, body=body, data=data)
+
+
+class TestDeliverPushes:
+    """Test grouping, chunking and result mapping"""
+
+    def test_groups_by_payload_and_chunks(self):
+        transport = FakePushTransport()
+        rows = [_row(i, f"token-{i}") for i in range(1200)]
+        rows.append(_row(5000, "token-x", title="Other"))
+
+        outcomes = deliver_pushes(rows, transport)
+
+        assert [len(request["tokens"]) for request in transport.requests] == [500, 500, 200, 1]
+        assert all(sent for _, sent, _, _ in outcomes)
+        assert [row.id for row, *_ in outcomes] == [row.id for row in rows]
+
+    def test_maps_per_token_failures(self):
+        transport = FakePushTransport({
+            "dead": TokenResult(False, "UNREGISTERED: gone", permanent=True),
+            "busy": TokenResult(False, "UNAVAILABLE: try later"),
+        })
+        rows = [_row(1, "ok"), _row(2, "dead"), _row(3, "busy"), _row(4, None)]
+
+        outcomes = {row.id: (sent, error, permanent) for row, sent, error, permanent in
+                    deliver_pushes(rows, transport)}
+
+        assert outcomes[1] == (True, None, False)
+        assert outcomes[2] == (False, "UNREGISTERED: gone", True)
+        assert outcomes[3] == (False, "UNAVAILABLE: try later", False)
+        assert outcomes[4] == (False, "No registered devices", True)
+        assert len(transport.requests) == 1
+
+    def test_fans_out_to_registered_devices(self):
+        transport = FakePushTransport({
+            "old-phone": TokenResult(False, "UNREGISTERED: gone", permanent=True),
+        })
+        rows = [_row(1, None, user_id=7), _row(2, None, user_id=8)]
+        invalid = []
+
+        outcomes = deliver_pushes(
+            rows, transport, {7: ["old-phone", "new-phone"], 8: ["old-phone"]}, invalid
+        )
+
+        assert transport.requests[0]["tokens"] == ["old-phone", "new-phone", "old-phone"]
+        assert [(sent, permanent) for _, sent, _, permanent in outcomes] == [(True, False), (False, True)]
+        assert invalid == ["old-phone", "old-phone"]
+
+    def test_failed_request_is_transient(self):
+        class BrokenTransport:
+            def send_multicast(self, tokens, title, body, data=None):
+                raise ConnectionError("fcm unreachable")
+
+        outcomes = deliver_pushes([_row(1, "a"), _row(2, "b")], BrokenTransport())
+        assert all(not sent and not permanent for _, sent, _, permanent in outcomes)
+
+    def test_fcm_transport_maps_batch_response(self, monkeypatch):
+        response = messaging.BatchResponse([
+            messaging.SendResponse({"name": "projects/p/messages/1"}, None),
+            messaging.SendResponse(None, messaging.UnregisteredError("Token not registered")),
+            messaging.SendResponse(None, messaging.SenderIdMismatchError("Wrong sender")),
+            messaging.SendResponse(None, fb_exceptions.InvalidArgumentError("Bad payload")),
+        ])
+        monkeypatch.setattr(firebase, "send_multicast", lambda *args: response)
+
+        results = FCMTransport().send_multicast(["a", "b", "c", "d"], "Title", "Body")
+
+        assert results[0] == TokenResult(True)
+        assert results[1].permanent and results[1].error.startswith("NOT_FOUND")
+        assert results[2].permanent and results[2].error.startswith("PERMISSION_DENIED")
+        # A malformed message is not the tokens' fault: retried, never pruned
+        assert not results[3].success and not results[3].permanent
+
+
+class TestPushQueueMulticast:
+    """Test the push queue worker with a multicast transport"""
+
+    @pytest.fixture
+    def fake_transport(self, app):
+        app.config["PUSH_TRANSPORT"] = "fake"
+        app.extensions.pop("push_transports", None)
+        yield get_push_transport()
+        app.config["PUSH_TRANSPORT"] = "mock"
+        app.extensions.pop("push_transports", None)
+
+    def test_worker_fans_out_and_prunes_invalid_tokens(self, db_session, app, fake_transport):
+        users = [
+            User(uid=f"multicast_user_{i}", name=f"Multicast User {i}",
+                 email=f"multicast{i}@test.com", role="student")
+            for i in range(3)
+        ]
+        db_session.add_all(users)
+        db_session.commit()
+        db_session.add_all([
+            DeviceToken(user_id=users[0].id, token="phone-0", platform="android"),
+            DeviceToken(user_id=users[0].id, token="tablet-0", platform="ios"),
+            DeviceToken(user_id=users[1].id, token="stale-1", platform="android"),
+        ])
+        db_session.add_all([
+            PushNotification(user_id=user.id, title="Announcement", body="Hello", data={})
+            for user in users
+        ])
+        db_session.commit()
+        fake_transport.failing_tokens["stale-1"] = TokenResult(False, "UNREGISTERED: gone", permanent=True)
+
+        results = QueueWorker("push").process_batch(10)
+
+        assert results["sent"] == 1
+        assert results["failed"] == 2
+        assert len(fake_transport.requests) == 1
+        assert sorted(fake_transport.requests[0]["tokens"]) == ["phone-0", "stale-1", "tablet-0"]
+        assert {row.last_error for row in PushNotification.query.filter_by(status="failed")} == {
+            "UNREGISTERED: gone", "No registered devices"
+        }
+        assert {device.token for device in DeviceToken.query.all()} == {"phone-0", "tablet-0"}
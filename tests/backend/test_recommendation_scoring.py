@@ -0,0 +1,96 @@
+"""
+Tests for vectorized recommendation scoring
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.models import Application, Gig, User
+from app.services.gig_service import create_gig
+from app.services.recommendation_scoring import fetch_candidates, score_candidates, top_k
+from app.services.recommendation_service import get_recommended_gigs_for_student
+from app.services.skill_service import add_student_skill
+
+
+@pytest.fixture
+def people(db_session):
+    provider = User(uid="score_provider", name="Score Provider",
+                    email="score_provider@test.com", role="provider", average_rating=4.5)
+    student = User(uid="score_student", name="Score Student",
+                   email="score_student@test.com", role="student", location="Nairobi")
+    db_session.add_all([provider, student])
+    db_session.commit()
+    return provider.id, student.id
+
+
+def _approved(provider_id, title, description="", **fields):
+    gig = create_gig(provider_id, {"title": title, "description": description, **fields})
+    gig.approval_status = "approved"
+    Gig.query.session.commit()
+    return gig
+
+
+class TestScoring:
+    """Test the scoring arithmetic on plain rows"""
+
+    def test_components(self):
+        now = datetime(2026, 1, 15)
+        rows = [
+            # id, created_at, location, applications, skill score, rating
+            (1, now, "Nairobi CBD", 0, 2.0, 5),
+            (2, now - timedelta(days=14), "Mombasa", 0, 0.0, 0),
+            (3, now, "Mombasa", 10, 1.0, 5),
+        ]
+
+        scores = score_candidates(rows, "nairobi", now=now)
+
+        assert scores[0] == pytest.approx(0.45 + 0.15 + 0.2 + 0.1)
+        # Half-life decay, neutral rating for an unrated provider
+        assert scores[1] == pytest.approx(0.1 + 0.1 * 0.5)
+        # Half the best skill score, half saturated
+        assert scores[2] == pytest.approx(0.225 + 0.2 + 0.1 - 0.05)
+        assert score_candidates([], "nairobi").size == 0
+
+    def test_top_k_is_ordered_and_bounded(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3])
+
+        assert top_k(scores, 3).tolist() == [1, 3, 2]
+        assert top_k(scores, 10).tolist() == [1, 3, 2, 4, 0]
+        assert top_k(scores, 0).size == 0
+
+    def test_top_k_ties_keep_input_order(self):
+        scores = np.array([0.5, 0.9, 0.5, 0.5, 0.1, 0.5])
+
+        assert top_k(scores, 3).tolist() == [1, 0, 2]
+        assert top_k(scores, 5).tolist() == [1, 0, 2, 3, 5]
+        assert top_k(np.zeros(8), 3).tolist() == [0, 1, 2]
+
+
+class TestRecommendations:
+    """Test candidate selection and ranking against the database"""
+
+    def test_candidates_exclude_applied_and_closed(self, db_session, people):
+        provider_id, student_id = people
+        open_gig = _approved(provider_id, "Open gig")
+        applied = _approved(provider_id, "Applied gig")
+        closed = _approved(provider_id, "Closed gig")
+        closed.status = "closed"
+        db_session.add(Application(gig_id=applied.id, student_id=student_id))
+        db_session.commit()
+
+        assert [row[0] for row in fetch_candidates(student_id)] == [open_gig.id]
+
+    def test_proficiency_and_location_shape_the_ranking(self, people):
+        provider_id, student_id = people
+        add_student_skill(student_id, "python", proficiency_level="expert")
+        add_student_skill(student_id, "excel", proficiency_level="beginner")
+        local = _approved(provider_id, "Data entry", location="Nairobi")
+        beginner = _approved(provider_id, "Excel cleanup", location="Kisumu")
+        expert = _approved(provider_id, "Python scripts", location="Kisumu")
+
+        recommended = get_recommended_gigs_for_student(student_id, limit=2)
+
+        assert [gig.id for gig in recommended] == [expert.id, beginner.id]
+        assert local.id in [gig.id for gig in get_recommended_gigs_for_student(student_id)]
@@ -0,0 +1,100 @@
+"""
+Tests for precomputed student recommendations
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Application, Gig, StudentRecommendation, User
+from app.services.gig_service import create_gig
+from app.services.recommendation_service import get_recommended_gigs_for_student
+from app.services.recommendation_store import (
+    get_stored_recommendations,
+    materialize_recommendations,
+)
+from app.services.skill_service import add_student_skill
+
+
+@pytest.fixture
+def people(db_session):
+    provider = User(uid="store_provider", name="Store Provider",
+                    email="store_provider@test.com", role="provider")
+    students = [
+        User(uid=f"store_student_{i}", name=f"Store Student {i}",
+             email=f"store_student{i}@test.com", role="student")
+        for i in range(3)
+    ]
+    db_session.add_all([provider, *students])
+    db_session.commit()
+    return provider.id, [student.id for student in students]
+
+
+@pytest.fixture
+def gigs(db_session, people):
+    provider_id, _ = people
+    gigs = [
+        create_gig(provider_id, {"title": f"Gig {i}", "description": "Odd job"})
+        for i in range(3)
+    ]
+    for gig in gigs:
+        gig.approval_status = "approved"
+    db_session.commit()
+    return [gig.id for gig in gigs]
+
+
+def _stored_ids(student_id):
+    return [
+        row.gig_id for row in
+        StudentRecommendation.query.filter_by(student_id=student_id).order_by(StudentRecommendation.rank)
+    ]
+
+
+class TestRecommendationStore:
+    """Test batch materialization and serving from stored rows"""
+
+    def test_materialize_in_chunks(self, people, gigs):
+        _, students = people
+
+        assert materialize_recommendations(chunk_size=2) == {"students": 3, "chunks": 2}
+
+        for student_id in students:
+            assert sorted(_stored_ids(student_id)) == sorted(gigs)
+
+    def test_serves_stored_rows_without_closed_or_applied_gigs(self, db_session, people, gigs):
+        _, students = people
+        materialize_recommendations()
+        ranked = _stored_ids(students[0])
+        db_session.get(Gig, ranked[0]).status = "closed"
+        db_session.add(Application(gig_id=ranked[1], student_id=students[0]))
+        db_session.commit()
+
+        served = get_recommended_gigs_for_student(students[0], limit=5)
+
+        assert [gig.id for gig in served] == ranked[2:]
+        assert _stored_ids(students[0]) == ranked  # served, not recomputed
+
+    def test_new_and_stale_students_are_ranked_on_demand(self, db_session, people, gigs):
+        _, students = people
+        assert get_stored_recommendations(students[0], 5) is None
+
+        served = get_recommended_gigs_for_student(students[0], limit=2)
+
+        assert len(served) == 2
+        assert len(_stored_ids(students[0])) == 3
+        assert get_stored_recommendations(students[0], 5) is not None
+
+        StudentRecommendation.query.update(
+            {"computed_at": datetime.utcnow() - timedelta(days=1)}
+        )
+        db_session.commit()
+        assert get_stored_recommendations(students[0], 5) is None
+
+    def test_skill_change_invalidates(self, people, gigs):
+        _, students = people
+        materialize_recommendations()
+
+        add_student_skill(students[0], "python")
+
+        assert _stored_ids(students[0]) == []
+        assert _stored_ids(students[1]) != []
@@ -0,0 +1,103 @@
+"""
+Tests for the response cache
+"""
+
+import pytest
+
+from app.models import User, Gig
+from app.services.gig_service import update_gig_status
+from app.utils.cache import TTLCache, response_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test the in-process LRU cache"""
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = TTLCache(max_entries=10, default_ttl=5, clock=clock)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        clock.now += 6
+        assert cache.get("a") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_counters_survive_eviction(self):
+        cache = TTLCache(max_entries=1)
+        cache.incr("gen:gigs")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.counter("gen:gigs") == 1
+
+
+class TestResponseCache:
+    """Test caching of public gig reads"""
+
+    @pytest.fixture
+    def cache_enabled(self, app):
+        app.config["RESPONSE_CACHE_ENABLED"] = True
+        response_cache.invalidate("gigs")
+        yield
+        app.config["RESPONSE_CACHE_ENABLED"] = False
+
+    @pytest.fixture
+    def open_gig(self, db_session):
+        provider = User(uid="cache_provider", name="Cache Provider",
+                        email="cache_provider@test.com", role="provider")
+        db_session.add(provider)
+        db_session.commit()
+        gig = Gig(title="Cached gig", description="Served from cache",
+                  provider_id=provider.id, approval_status="approved", status="open")
+        db_session.add(gig)
+        db_session.commit()
+        return gig
+
+    def test_repeat_reads_hit_and_writes_invalidate(self, client, cache_enabled, open_gig):
+        first = client.get(f"/api/gigs/{open_gig.id}")
+        assert first.headers["X-Cache"] == "MISS"
+
+        second = client.get(f"/api/gigs/{open_gig.id}")
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.get_json() == first.get_json()
+
+        update_gig_status(open_gig.id, "closed")
+        third = client.get(f"/api/gigs/{open_gig.id}")
+        assert third.headers["X-Cache"] == "MISS"
+        assert third.get_json()["status"] == "closed"
+
+    def test_query_parameter_order_is_normalized(self, client, cache_enabled, open_gig):
+        client.get("/api/gigs?page=1&per_page=5")
+        response = client.get("/api/gigs?per_page=5&page=1")
+        assert response.headers["X-Cache"] == "HIT"
+
+    def test_empty_parameters_are_part_of_the_key(self, client, cache_enabled, open_gig):
+        offset = client.get("/api/gigs")
+        assert "total" in offset.get_json()
+
+        keyset = client.get("/api/gigs?cursor=")
+        assert keyset.headers["X-Cache"] == "MISS"
+        assert "next_cursor" in keyset.get_json()
+
+    def test_authenticated_requests_bypass_cache(self, client, cache_enabled, open_gig):
+        headers = {"Authorization": "Bearer test:cache_student:student"}
+        client.get("/api/gigs", headers=headers)
+        response = client.get("/api/gigs", headers=headers)
+        assert "X-Cache" not in response.headers
@@ -0,0 +1,75 @@
+"""
+Tests for notification retention
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Notification, NotificationArchive, OutboxEvent, User
+from app.models.notification_preferences import EmailQueue, PushNotification
+from app.services.notification_service import get_notification_summary
+from app.services.retention_service import archive_notifications, purge_delivery_queues
+
+OLD = datetime.utcnow() - timedelta(days=200)
+
+
+@pytest.fixture
+def user_id(db_session):
+    user = User(uid="retention_user", name="Retention User",
+                email="retention@test.com", role="student")
+    db_session.add(user)
+    db_session.commit()
+    return user.id
+
+
+class TestRetention:
+    """Test archival and purging"""
+
+    def test_archives_old_notifications_in_batches(self, db_session, user_id):
+        db_session.add_all(
+            [Notification(user_id=user_id, type="gig_update", title=f"Old {i}",
+                          message="m", created_at=OLD) for i in range(5)]
+            + [Notification(user_id=user_id, type="gig_update", title="Pending digest",
+                            message="m", created_at=OLD, digest_pending=True),
+               Notification(user_id=user_id, type="gig_update", title="New", message="m")]
+        )
+        db_session.commit()
+        old_ids = sorted(n.id for n in Notification.query.filter(Notification.title.like("Old%")))
+
+        assert archive_notifications(batch_size=2) == 5
+
+        assert {n.title for n in Notification.query} == {"Pending digest", "New"}
+        archived = NotificationArchive.query.order_by(NotificationArchive.id).all()
+        assert [row.id for row in archived] == old_ids
+        assert all(row.user_id == user_id and row.archived_at for row in archived)
+
+    def test_purges_settled_rows_only(self, db_session, user_id):
+        for status in ("sent", "failed", "pending"):
+            db_session.add(EmailQueue(user_id=user_id, email_address="retention@test.com",
+                                      subject="s", body="b", status=status, created_at=OLD))
+            db_session.add(PushNotification(user_id=user_id, title="t", body="b",
+                                            status=status, created_at=OLD))
+        db_session.add(EmailQueue(user_id=user_id, email_address="retention@test.com",
+                                  subject="recent", body="b", status="sent"))
+        db_session.add(OutboxEvent(event_type="gig_submitted", payload={},
+                                   status="dispatched", created_at=OLD))
+        db_session.commit()
+
+        assert purge_delivery_queues() == {"email": 2, "push": 2, "outbox": 1}
+        assert {e.status for e in EmailQueue.query} == {"pending", "sent"}
+        assert [p.status for p in PushNotification.query] == ["pending"]
+        assert OutboxEvent.query.count() == 0
+
+    def test_summary_only_counts_hot_window(self, db_session, user_id):
+        db_session.add_all([
+            Notification(user_id=user_id, type="gig_update", title="Old",
+                         message="m", created_at=OLD),
+            Notification(user_id=user_id, type="gig_update", title="New", message="m"),
+        ])
+        db_session.commit()
+
+        summary = get_notification_summary(user_id)
+
+        assert summary["total_notifications"] == 1
+        assert summary["unread_count"] == 1
@@ -0,0 +1,67 @@
+"""
+Tests for batched gig serialization
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models import User, Gig, Application, Rating
+from app.routes.serializers import gig_to_dict, gigs_to_dicts
+from app.services.gig_service import reconcile_gig_counters
+
+
+class TestGigsToDicts:
+    """Test the bulk gig serializer"""
+
+    @pytest.fixture
+    def rated_gigs(self, db_session):
+        provider = User(uid="batch_provider", name="Batch Provider",
+                        email="batch_provider@test.com", role="provider")
+        student = User(uid="batch_student", name="Batch Student",
+                       email="batch_student@test.com", role="student")
+        db_session.add_all([provider, student])
+        db_session.commit()
+
+        gigs = [
+            Gig(title=f"Batch gig {i}", description="Serialized in bulk",
+                provider_id=provider.id, approval_status="approved")
+            for i in range(5)
+        ]
+        db_session.add_all(gigs)
+        db_session.commit()
+
+        db_session.add_all([
+            Application(gig_id=gigs[0].id, student_id=student.id, status="pending"),
+            Application(gig_id=gigs[1].id, student_id=student.id, status="accepted"),
+            Rating(rater_id=student.id, ratee_id=provider.id, gig_id=gigs[0].id, score=4),
+            Rating(rater_id=student.id, ratee_id=provider.id, gig_id=gigs[0].id, score=5),
+        ])
+        db_session.commit()
+        reconcile_gig_counters()
+        return gigs
+
+    def test_matches_single_gig_serializer(self, rated_gigs):
+        expected = [gig_to_dict(gig) for gig in rated_gigs]
+        assert gigs_to_dicts(rated_gigs) == expected
+        assert expected[0]["rating_average"] == 4.5
+        assert expected[0]["rating_count"] == 2
+        assert expected[1]["application_count"] == 1
+
+    def test_query_count_does_not_grow_with_page_size(self, rated_gigs):
+        statements = []
+
+        def count(*args):
+            statements.append(args)
+
+        db.session.expire_all()
+        gigs = Gig.query.all()
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            gigs_to_dicts(gigs)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+        assert len(statements) == 1
+
+    def test_empty_list(self, db_session):
+        assert gigs_to_dicts([]) == []
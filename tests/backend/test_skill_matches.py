@@ -0,0 +1,90 @@
+"""
+Tests for the skill-to-gig match index
+"""
+
+import pytest
+
+from app.models import Gig, GigSkill, User
+from app.services.gig_service import create_gig, update_gig
+from app.services.recommendation_service import (
+    get_recommended_gigs_for_student,
+    get_student_recommendation_stats,
+)
+from app.services.skill_match_service import rebuild_gig_skill_index
+from app.services.skill_service import add_student_skill, create_skill
+
+
+@pytest.fixture
+def people(db_session):
+    provider = User(uid="match_provider", name="Match Provider",
+                    email="match_provider@test.com", role="provider")
+    student = User(uid="match_student", name="Match Student",
+                   email="match_student@test.com", role="student")
+    db_session.add_all([provider, student])
+    db_session.commit()
+    return provider.id, student.id
+
+
+def _approve(*gigs):
+    for gig in gigs:
+        gig.approval_status = "approved"
+    Gig.query.session.commit()
+
+
+def _matched_skills(gig_id):
+    return {row.skill.name for row in GigSkill.query.filter_by(gig_id=gig_id)}
+
+
+class TestSkillMatchIndex:
+    """Test index maintenance and indexed recommendations"""
+
+    def test_gig_writes_maintain_the_index(self, people):
+        provider_id, _ = people
+        create_skill("Python")
+        create_skill("Machine Learning")
+        gig = create_gig(provider_id, {"title": "Python tutor",
+                                       "description": "Intro to machine learning"})
+
+        assert _matched_skills(gig.id) == {"python", "machine learning"}
+        title_match = GigSkill.query.filter_by(gig_id=gig.id, in_title=True).one()
+        assert title_match.skill.name == "python"
+
+        update_gig(gig.id, {"description": "Just scripting"})
+        assert _matched_skills(gig.id) == {"python"}
+
+    def test_new_skill_is_matched_against_existing_gigs(self, people):
+        provider_id, _ = people
+        gig = create_gig(provider_id, {"title": "Build a React dashboard",
+                                       "description": "Charts and tables"})
+        create_gig(provider_id, {"title": "Reactive cleanup", "description": "Chemistry lab"})
+
+        create_skill("react")
+
+        assert GigSkill.query.count() == 1
+        assert _matched_skills(gig.id) == {"react"}
+
+    def test_recommendations_rank_by_matched_skills(self, people):
+        provider_id, student_id = people
+        for name in ("design", "figma", "logo"):
+            add_student_skill(student_id, name)
+        both = create_gig(provider_id, {"title": "Logo design", "description": "Use figma"})
+        one = create_gig(provider_id, {"title": "Poster design", "description": "Print"})
+        none = create_gig(provider_id, {"title": "Data entry", "description": "Spreadsheets"})
+        _approve(both, one, none)
+
+        recommended = get_recommended_gigs_for_student(student_id, limit=4)
+
+        assert [gig.id for gig in recommended[:2]] == [both.id, one.id]
+        stats = get_student_recommendation_stats(student_id)
+        assert stats["skill_based_matches"] == 2
+        assert stats["skills_count"] == 3
+
+    def test_rebuild(self, db_session, people):
+        provider_id, _ = people
+        create_skill("excel")
+        gig = create_gig(provider_id, {"title": "Excel cleanup", "description": "Tidy sheets"})
+        GigSkill.query.delete()
+        db_session.commit()
+
+        assert rebuild_gig_skill_index(batch_size=1) == 1
+        assert _matched_skills(gig.id) == {"excel"}
@@ -0,0 +1,72 @@
+"""
+Tests for the verified Firebase token cache
+"""
+
+import time
+
+import pytest
+
+from app.services import auth_service
+
+
+class FakeFirebaseAuth:
+    def __init__(self, claims):
+        self.claims = claims
+        self.calls = []
+
+    def verify_id_token(self, id_token, check_revoked=False):
+        self.calls.append((id_token, check_revoked))
+        return dict(self.claims)
+
+
+@pytest.fixture
+def fake_firebase(monkeypatch):
+    def install(claims):
+        fake = FakeFirebaseAuth(claims)
+        monkeypatch.setattr(auth_service, "firebase_available", True)
+        monkeypatch.setattr(auth_service, "auth", fake)
+        auth_service._verified_tokens.clear()
+        return fake
+
+    yield install
+    auth_service._verified_tokens.clear()
+
+
+class TestVerifiedTokenCache:
+    """Test caching of verify_id_token results"""
+
+    def test_repeat_token_skips_verification(self, app, fake_firebase):
+        fake = fake_firebase({"uid": "cached_uid", "exp": time.time() + 3600})
+        hits_before = auth_service._verified_tokens.stats()["hits"]
+        with app.app_context():
+            first = auth_service.verify_token("firebase-token")
+            second = auth_service.verify_token("firebase-token")
+        assert first == second
+        assert len(fake.calls) == 1
+        assert auth_service._verified_tokens.stats()["hits"] == hits_before + 1
+
+    def test_expired_token_is_not_cached(self, app, fake_firebase):
+        fake = fake_firebase({"uid": "expired_uid", "exp": time.time() - 1})
+        with app.app_context():
+            auth_service.verify_token("old-token")
+            auth_service.verify_token("old-token")
+        assert len(fake.calls) == 2
+
+    def test_revocation_checks_bound_cache_lifetime(self, app, fake_firebase):
+        fake = fake_firebase({"uid": "revocable_uid", "exp": time.time() + 3600})
+        app.config["FIREBASE_CHECK_REVOKED"] = True
+        app.config["VERIFIED_TOKEN_REVOCATION_TTL"] = 0
+        try:
+            with app.app_context():
+                auth_service.verify_token("revocable-token")
+                auth_service.verify_token("revocable-token")
+        finally:
+            app.config["FIREBASE_CHECK_REVOKED"] = False
+            app.config["VERIFIED_TOKEN_REVOCATION_TTL"] = 300
+        assert fake.calls == [("revocable-token", True), ("revocable-token", True)]
+
+    def test_callers_cannot_mutate_cached_claims(self, app, fake_firebase):
+        fake_firebase({"uid": "immutable_uid", "exp": time.time() + 3600})
+        with app.app_context():
+            auth_service.verify_token("token")["uid"] = "tampered"
+            assert auth_service.verify_token("token")["uid"] == "immutable_uid"
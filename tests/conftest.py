@@ -22,6 +22,10 @@ class TestConfig:
     WTF_CSRF_ENABLED = False
     SECRET_KEY = 'test-secret-key'
     FIREBASE_CREDENTIALS_PATH = 'firebase_credentials.json'
+    # Tests write rows directly, bypassing the service-level cache invalidation
+    RESPONSE_CACHE_ENABLED = False
+    AUTH_USER_CACHE_ENABLED = False
+    NOTIFICATION_PREFERENCE_CACHE_ENABLED = False
 
 @pytest.fixture(scope='session')
 def app():